@@ -8,22 +8,29 @@ CLI:
   python UNIFIED_RSI_EXTENDED.py selftest
   python UNIFIED_RSI_EXTENDED.py evolve --fresh --generations 100
   python UNIFIED_RSI_EXTENDED.py evolve --fresh --generations 50 --mode program
+  python UNIFIED_RSI_EXTENDED.py evolve --fresh --generations 50 --genome-repr ast
+  python UNIFIED_RSI_EXTENDED.py evolve --fresh --generations 50 --selection lexicase --population 256
   python UNIFIED_RSI_EXTENDED.py evolve --fresh --generations 50 --mode algo --task sort_int_list
   python UNIFIED_RSI_EXTENDED.py learner-evolve --fresh --generations 100
   python UNIFIED_RSI_EXTENDED.py meta-meta --episodes 20 --gens-per-episode 20
   python UNIFIED_RSI_EXTENDED.py task-switch --task-a poly2 --task-b piecewise
   python UNIFIED_RSI_EXTENDED.py report --state-dir .rsi_state
+  python UNIFIED_RSI_EXTENDED.py report --state-dir .rsi_state --columnar
   python UNIFIED_RSI_EXTENDED.py transfer-bench --from poly2 --to piecewise --budget 10
   python UNIFIED_RSI_EXTENDED.py rsi-loop --generations 50 --rounds 10
   python UNIFIED_RSI_EXTENDED.py rsi-loop --generations 20 --rounds 5 --mode learner
+  python UNIFIED_RSI_EXTENDED.py rsi-loop --generations 20 --rounds 5 --pipeline --autopatch-workers 2
   python UNIFIED_RSI_EXTENDED.py duo-loop --rounds 5 --slice-seconds 8 --blackboard .rsi_blackboard.jsonl --k-full 6
 
 DUO-LOOP OVERVIEW
 -----------------
-The duo-loop command adds a sequential, low-spec cooperative loop with two virtual agents:
+The duo-loop command adds a low-spec cooperative loop with two virtual agents:
 - Creator: proposes diverse candidate programs (novelty-biased generation).
 - Critic: prefilters, refines, stress-checks, and adopts candidates (robustness/generalization-biased).
 
+The Creator streams candidates into a bounded, hash-deduplicated queue consumed by a pool of
+Critic worker processes (--critic-workers, --queue-size); a full queue throttles the Creator.
+
 Unlike evolve/rsi-loop, duo-loop never adopts directly from Creator; adoption is Critic-only.
 It keeps state in the existing state directory and logs to an append-only blackboard JSONL file.
 
@@ -36,28 +43,43 @@ Algo: Added algorithmic task suite, algo-mode validator/sandbox, and transfer-be
 """
 from __future__ import annotations
 
+import __future__
 import argparse
 import ast
+import atexit
+import bisect
 import collections
+import concurrent.futures
 import difflib
 import hashlib
+import heapq
 import json
 import math
 import copy
+import mmap
 import os
+import pickle
+import queue
 import random
 import re
+import signal
+import socket
 import subprocess
 import shutil
 import sys
 import tempfile
 import textwrap
+import threading
 import time
 import traceback
-from dataclasses import dataclass, asdict, field
+from dataclasses import dataclass, asdict, field, fields
 from pathlib import Path
 from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Set, Union
 import multiprocessing as mp
+import multiprocessing.connection
+from array import array
+
+from weighted_sampling import VersionedWeights, WeightedSampler
 
 
 # ---------------------------
@@ -86,6 +108,26 @@ def write_json(p: Path, obj: Any, indent: int = 2):
     safe_mkdir(p.parent)
     p.write_text(json.dumps(obj, ensure_ascii=False, indent=indent, default=str), encoding="utf-8")
 
+def write_text_atomic(p: Path, text: str) -> None:
+    """Write to a temp file, fsync it, then rename over `p`: readers see the old or the new file, never a torn one."""
+    safe_mkdir(p.parent)
+    tmp = p.with_name(f".{p.name}.{os.getpid()}.tmp")
+    with tmp.open("w", encoding="utf-8") as f:
+        f.write(text)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, p)
+    try:
+        fd = os.open(p.parent, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)  # make the rename itself durable
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
 def unified_diff(old: str, new: str, name: str) -> str:
     return "".join(
         difflib.unified_diff(
@@ -97,22 +139,264 @@ def unified_diff(old: str, new: str, name: str) -> str:
     )
 
 
+JSONL_FLUSH_RECORDS = 256
+JSONL_FLUSH_SECONDS = 2.0
+JSONL_ROTATE_BYTES = 0
+JSONL_INDEX_EVERY = 64
+
+
+def jsonl_index_path(path: Path) -> Path:
+    return path.with_name(path.name + ".idx")
+
+
+class JsonlSink:
+    """
+    Buffered JSONL appender. write() serializes the record into a buffer; the buffer goes to disk
+    in one append once `max_records` lines are waiting or `max_seconds` have passed since the last
+    flush, on flush() (round boundaries) and at exit. With `rotate_bytes` > 0, a file that has grown
+    past it is gzipped to <name>.<n>.gz and restarted empty. Writes are thread-safe.
+
+    With `index_key` (record -> (section, gen)), each flush also appends chunk entries to the
+    <name>.idx sidecar: {"off", "len", "count", "key", "lo", "hi"} for runs of at most `index_every`
+    records sharing a section, so readers can seek instead of scanning (see jsonl_chunks).
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        max_records: int = JSONL_FLUSH_RECORDS,
+        max_seconds: float = JSONL_FLUSH_SECONDS,
+        rotate_bytes: int = JSONL_ROTATE_BYTES,
+        index_every: int = JSONL_INDEX_EVERY,
+        index_key: Optional[Callable[[Dict[str, Any]], Tuple[str, int]]] = None,
+    ):
+        self.path = path
+        self.index_path = jsonl_index_path(path)
+        self.max_records = max(1, max_records)
+        self.max_seconds = max_seconds
+        self.rotate_bytes = rotate_bytes
+        self.index_every = max(1, index_every)
+        self.index_key = index_key
+        self._buffer: List[str] = []
+        self._keys: List[Tuple[str, int]] = []
+        self._last_flush = time.monotonic()
+        self._lock = threading.Lock()
+        self.flushes = 0
+
+    def write(self, record: Dict[str, Any]) -> None:
+        line = json.dumps(record) + "\n"
+        key = self.index_key(record) if self.index_key else None
+        with self._lock:
+            self._buffer.append(line)
+            if key is not None:
+                self._keys.append(key)
+            if len(self._buffer) >= self.max_records or time.monotonic() - self._last_flush >= self.max_seconds:
+                self._flush()
+
+    def flush(self) -> None:
+        with self._lock:
+            self._flush()
+
+    def reset(self) -> None:
+        """Drop buffered records and delete the file and its index."""
+        with self._lock:
+            self._buffer.clear()
+            self._keys.clear()
+            for p in (self.path, self.index_path):
+                if p.exists():
+                    p.unlink()
+
+    def _flush(self) -> None:
+        self._last_flush = time.monotonic()
+        if not self._buffer:
+            return
+        safe_mkdir(self.path.parent)
+        with self.path.open("ab") as f:
+            start = f.tell()
+            data = [line.encode("utf-8") for line in self._buffer]
+            f.write(b"".join(data))
+            size = f.tell()
+        if self.index_key and len(self._keys) == len(data):
+            self._append_index(start, data)
+        self._buffer.clear()
+        self._keys.clear()
+        self.flushes += 1
+        if self.rotate_bytes > 0 and size >= self.rotate_bytes:
+            self._rotate()
+
+    def _append_index(self, off: int, data: List[bytes]) -> None:
+        entries: List[Dict[str, Any]] = []
+        for (key, gen), line in zip(self._keys, data):
+            last = entries[-1] if entries else None
+            if last is None or last["key"] != key or last["count"] >= self.index_every:
+                last = {"off": off, "len": 0, "count": 0, "key": key, "lo": gen, "hi": gen}
+                entries.append(last)
+            last["len"] += len(line)
+            last["count"] += 1
+            last["lo"], last["hi"] = min(last["lo"], gen), max(last["hi"], gen)
+            off += len(line)
+        with self.index_path.open("a", encoding="utf-8") as f:
+            f.write("".join(json.dumps(e, separators=(",", ":")) + "\n" for e in entries))
+
+    def _rotate(self) -> None:
+        import gzip
+
+        n = 1
+        while (target := self.path.with_name(f"{self.path.name}.{n}.gz")).exists():
+            n += 1
+        with self.path.open("rb") as src, gzip.open(target, "wb") as dst:
+            shutil.copyfileobj(src, dst)
+        self.path.unlink()
+        if self.index_path.exists():
+            self.index_path.unlink()
+
+
+_JSONL_SINKS: Dict[str, JsonlSink] = {}
+_JSONL_SINKS_LOCK = threading.Lock()
+
+
+def jsonl_sink(path: Path, **options: Any) -> JsonlSink:
+    """
+    Shared sink for `path`, so every writer of a file goes through one buffer; flushed at exit.
+    `options` (JsonlSink keyword arguments) apply when the sink is created.
+    """
+    key = str(Path(path).resolve())
+    with _JSONL_SINKS_LOCK:
+        if key not in _JSONL_SINKS:
+            if not _JSONL_SINKS:
+                atexit.register(flush_jsonl_sinks)
+            _JSONL_SINKS[key] = JsonlSink(Path(path), **options)
+        return _JSONL_SINKS[key]
+
+
+def flush_jsonl_sinks(path: Optional[Path] = None) -> None:
+    """Flush the sink for `path`, or every sink; call before reading a log written in this process."""
+    with _JSONL_SINKS_LOCK:
+        sinks = list(_JSONL_SINKS.values()) if path is None else [_JSONL_SINKS.get(str(Path(path).resolve()))]
+    for sink in sinks:
+        if sink is not None:
+            sink.flush()
+
+
+def _json_or_none(line: bytes) -> Optional[Dict[str, Any]]:
+    try:
+        return json.loads(line)
+    except ValueError:
+        return None
+
+
+def read_jsonl_tail(path: Path, k: int, block_size: int = 1 << 16) -> List[Dict[str, Any]]:
+    """Last `k` non-blank lines of a JSONL file (undecodable ones dropped), read backwards from the end."""
+    flush_jsonl_sinks(path)
+    if k <= 0 or not path.exists():
+        return []
+    found: List[bytes] = []
+    with path.open("rb") as f:
+        pos = f.seek(0, os.SEEK_END)
+        head = b""
+        while pos > 0 and len(found) < k:
+            step = min(block_size, pos)
+            pos -= step
+            f.seek(pos)
+            parts = (f.read(step) + head).split(b"\n")
+            head = parts[0]
+            for part in reversed(parts[1:]):
+                if part.strip() and len(found) < k:
+                    found.append(part)
+        if pos == 0 and head.strip() and len(found) < k:
+            found.append(head)
+    return [rec for rec in map(_json_or_none, reversed(found)) if rec is not None]
+
+
+def jsonl_chunks(path: Path) -> Optional[List[Dict[str, Any]]]:
+    """
+    Chunk table of a JSONL file from its .idx sidecar, or None without a usable index. Entries are
+    trusted only while they tile the file from offset 0; bytes past the last such entry (a crash
+    between the two appends, or writes without an index) come back as one chunk with key None.
+    """
+    flush_jsonl_sinks(path)
+    index_path = jsonl_index_path(path)
+    if not path.exists() or not index_path.exists():
+        return None
+    size = path.stat().st_size
+    chunks: List[Dict[str, Any]] = []
+    end = 0
+    with index_path.open("rb") as f:
+        for line in f:
+            entry = _json_or_none(line)
+            if not entry or entry.get("off") != end or end + entry.get("len", 0) > size:
+                break
+            chunks.append(entry)
+            end += entry["len"]
+    if not chunks:
+        return None
+    if end < size:
+        chunks.append({"off": end, "len": size - end, "count": None, "key": None, "lo": None, "hi": None})
+    return chunks
+
+
+def read_jsonl_chunk(f: Any, chunk: Dict[str, Any]) -> List[Tuple[int, Dict[str, Any]]]:
+    """(offset, record) pairs of one chunk from a file opened in binary mode."""
+    f.seek(chunk["off"])
+    out = []
+    off = chunk["off"]
+    for line in f.read(chunk["len"]).splitlines(keepends=True):
+        if line.strip() and (rec := _json_or_none(line)) is not None:
+            out.append((off, rec))
+        off += len(line)
+    return out
+
+
+def run_log_section(record: Dict[str, Any]) -> Tuple[str, int]:
+    """Index key of a run_log.jsonl record: its task/mode section and generation."""
+    return f"{record['task_id']}::{record.get('mode', 'unknown')}", int(record["gen"])
+
+
+def read_run_log_range(
+    path: Path, section: Optional[str] = None, gen_lo: float = -math.inf, gen_hi: float = math.inf
+) -> List[Dict[str, Any]]:
+    """Run-log records of `section` (None = all) with gen_lo <= gen <= gen_hi, in file order."""
+    chunks = jsonl_chunks(path)
+    if chunks is None:
+        if not path.exists():
+            return []
+        chunks = [{"off": 0, "len": path.stat().st_size, "key": None}]
+    out = []
+    with path.open("rb") as f:
+        for chunk in chunks:
+            if chunk["key"] is not None and (
+                (section is not None and chunk["key"] != section) or chunk["hi"] < gen_lo or chunk["lo"] > gen_hi
+            ):
+                continue
+            for _, rec in read_jsonl_chunk(f, chunk):
+                key, gen = run_log_section(rec)
+                if (section is None or key == section) and gen_lo <= gen <= gen_hi:
+                    out.append(rec)
+    return out
+
+
+RUN_LOG_MAX_RECORDS = 256
+
+
 class RunLogger:
     def __init__(self, path: Path, window: int = 10, append: bool = False):
         self.path = path
         self.window = window
-        self.records: List[Dict[str, Any]] = []
-        self.best_scores: List[float] = []
-        self.best_hold: List[float] = []
+        # Only recent records are kept in memory; the file has the full run.
+        self.records: collections.deque[Dict[str, Any]] = collections.deque(maxlen=RUN_LOG_MAX_RECORDS)
+        self.best_scores: collections.deque[float] = collections.deque(maxlen=window + 1)
+        self.best_hold: collections.deque[float] = collections.deque(maxlen=window + 1)
         self.seen_hashes: Set[str] = set()
+        self.sink = jsonl_sink(path, index_key=run_log_section)
         safe_mkdir(self.path.parent)
-        if self.path.exists() and not append:
-            self.path.unlink()
+        if not append:
+            self.sink.reset()
 
-    def _window_slice(self, vals: List[float]) -> List[float]:
-        if not vals:
-            return []
-        return vals[-self.window :]
+    def _window_slice(self, vals: Iterable[float]) -> List[float]:
+        return list(vals)[-self.window :]
+
+    def flush(self) -> None:
+        self.sink.flush()
 
     def log(
         self,
@@ -139,6 +423,7 @@ class RunLogger:
         library_size: Optional[int] = None,
         control_packet: Optional[Dict[str, Any]] = None,
         task_descriptor: Optional[Dict[str, Any]] = None,
+        checkpoint: Optional[Dict[str, Any]] = None,
     ) -> Dict[str, Any]:
         self.best_scores.append(score_hold)
         self.best_hold.append(score_hold)
@@ -174,9 +459,9 @@ class RunLogger:
             "library_size": library_size,
             "control_packet": control_packet or {},
             "task_descriptor": task_descriptor,
+            "checkpoint": checkpoint,
         }
-        with self.path.open("a", encoding="utf-8") as f:
-            f.write(json.dumps(record) + "\n")
+        self.sink.write(record)
         self.records.append(record)
         return record
 
@@ -186,26 +471,11 @@ class RunLogger:
 # ---------------------------
 
 def append_blackboard(path: Path, record: Dict[str, Any]) -> None:
-    safe_mkdir(path.parent)
-    with path.open("a", encoding="utf-8") as f:
-        f.write(json.dumps(record) + "\n")
+    jsonl_sink(path).write(record)
 
 
 def tail_blackboard(path: Path, k: int) -> List[Dict[str, Any]]:
-    if not path.exists():
-        return []
-    lines: collections.deque[str] = collections.deque(maxlen=k)
-    with path.open("r", encoding="utf-8") as f:
-        for line in f:
-            if line.strip():
-                lines.append(line)
-    records = []
-    for line in lines:
-        try:
-            records.append(json.loads(line))
-        except Exception:
-            continue
-    return records
+    return read_jsonl_tail(path, k)
 
 
 # ---------------------------
@@ -1090,7 +1360,8 @@ SAFE_FUNCS: Dict[str, Callable] = {
     "list": list,
 }
 
-GRAMMAR_PROBS: Dict[str, float] = {k: 1.0 for k in SAFE_FUNCS}
+# Versioned so the expression samplers rebuild only after induce_grammar/meta edits.
+GRAMMAR_PROBS: Dict[str, float] = VersionedWeights({k: 1.0 for k in SAFE_FUNCS})
 GRAMMAR_PROBS.update({"binop": 2.0, "call": 15.0, "const": 1.0, "var": 2.0})
 
 SAFE_BUILTINS = {
@@ -1362,9 +1633,14 @@ class CodeValidator(ast.NodeVisitor):
                 return
         super().generic_visit(node)
 
-def validate_code(code: str) -> Tuple[bool, str]:
+def _as_tree(code: Union[str, ast.AST]) -> ast.AST:
+    # AstGenome hands over ready-made trees; plain genomes still pass source text.
+    return code if isinstance(code, ast.AST) else ast.parse(code)
+
+
+def validate_code(code: Union[str, ast.AST]) -> Tuple[bool, str]:
     try:
-        tree = ast.parse(code)
+        tree = _as_tree(code)
         v = CodeValidator()
         v.visit(tree)
         return (v.ok, v.err or "")
@@ -1440,9 +1716,9 @@ class ProgramValidator(ast.NodeVisitor):
         super().generic_visit(node)
 
 
-def validate_program(code: str) -> Tuple[bool, str]:
+def validate_program(code: Union[str, ast.AST]) -> Tuple[bool, str]:
     try:
-        tree = ast.parse(code)
+        tree = _as_tree(code)
         v = ProgramValidator()
         v.visit(tree)
         return (v.ok, v.err or "")
@@ -1636,15 +1912,15 @@ def safe_eval(expr: str, x: Any, extra_funcs: Optional[Dict[str, Callable]] = No
         return float("nan")
 
 
-def node_count(code: str) -> int:
+def node_count(code: Union[str, ast.AST]) -> int:
     try:
-        return sum(1 for _ in ast.walk(ast.parse(code)))
+        return sum(1 for _ in ast.walk(_as_tree(code)))
     except Exception:
         return 999
 
-def ast_depth(code: str) -> int:
+def ast_depth(code: Union[str, ast.AST]) -> int:
     try:
-        tree = ast.parse(code)
+        tree = _as_tree(code)
     except Exception:
         return 0
     max_depth = 0
@@ -1657,13 +1933,13 @@ def ast_depth(code: str) -> int:
     return max_depth
 
 
-def program_limits_ok(code: str, max_nodes: int = 200, max_depth: int = 20, max_locals: int = 16) -> bool:
+def program_limits_ok(code: Union[str, ast.AST], max_nodes: int = 200, max_depth: int = 20, max_locals: int = 16) -> bool:
     try:
-        tree = ast.parse(code)
+        tree = _as_tree(code)
     except Exception:
         return False
     nodes = sum(1 for _ in ast.walk(tree))
-    depth = ast_depth(code)
+    depth = ast_depth(tree)
     locals_set = {n.id for n in ast.walk(tree) if isinstance(n, ast.Name)}
     return nodes <= max_nodes and depth <= max_depth and len(locals_set) <= max_locals
 
@@ -1692,6 +1968,30 @@ def safe_exec(code: str, x: Any, timeout_steps: int = 1000, extra_env: Optional[
         return float("nan")
 
 
+def load_run_fn(code_obj: Any, extra_env: Optional[Dict[str, Any]] = None) -> Callable[[Any], Any]:
+    """Exec an already compiled, step-limited run(x) once; the callable mirrors safe_exec per input."""
+    env: Dict[str, Any] = {"_steps": 0, "StepLimitExceeded": StepLimitExceeded}
+    env.update(SAFE_FUNCS)
+    env.update(SAFE_BUILTINS)
+    if extra_env:
+        env.update(extra_env)
+    try:
+        exec(code_obj, {"__builtins__": {}}, env)
+        fn = env.get("run")
+    except Exception:
+        fn = None
+
+    def call(x: Any) -> Any:
+        if fn is None:
+            return float("nan")
+        try:
+            return fn(x)
+        except Exception:
+            return float("nan")
+
+    return call
+
+
 def safe_exec_algo(
     code: str,
     inp: Any,
@@ -1725,6 +2025,23 @@ def safe_exec_algo(
         return (None, int(env.get("_steps", 0) if "env" in locals() else 0), True)
 
 
+def _engine_env() -> Dict[str, Any]:
+    env: Dict[str, Any] = {"_steps": 0, "StepLimitExceeded": StepLimitExceeded}
+    env.update({
+        "random": random,
+        "math": math,
+        "max": max,
+        "min": min,
+        "len": len,
+        "sum": sum,
+        "sorted": sorted,
+        "int": int,
+        "float": float,
+        "list": list,
+    })
+    return env
+
+
 def safe_exec_engine(code: str, context: Dict[str, Any], timeout_steps: int = 5000) -> Any:
     """Execute meta-engine code (selection/crossover) with safety limits."""
     try:
@@ -1733,19 +2050,7 @@ def safe_exec_engine(code: str, context: Dict[str, Any], timeout_steps: int = 50
         tree = transformer.visit(tree)
         ast.fix_missing_locations(tree)
 
-        env: Dict[str, Any] = {"_steps": 0, "StepLimitExceeded": StepLimitExceeded}
-        env.update({
-            "random": random,
-            "math": math,
-            "max": max,
-            "min": min,
-            "len": len,
-            "sum": sum,
-            "sorted": sorted,
-            "int": int,
-            "float": float,
-            "list": list,
-        })
+        env = _engine_env()
         env.update(context)
 
         exec(compile(tree, "<engine>", "exec"), env)
@@ -1756,6 +2061,42 @@ def safe_exec_engine(code: str, context: Dict[str, Any], timeout_steps: int = 50
         return None
 
 
+def compile_engine_fn(
+    code: str, arg_names: Tuple[str, ...], timeout_steps: int = 5000
+) -> Optional[Callable[..., Any]]:
+    """
+    Compile meta-engine code once into a step-limited callable.
+    A zero-argument `def run():` is rewritten to take `arg_names` positionally, so the
+    context is passed per call instead of being merged into a fresh globals dict.
+    The returned callable mirrors safe_exec_engine and yields None on any exception.
+    """
+    try:
+        tree = ast.parse(str(code))
+        run_def = None
+        for node in tree.body:
+            if isinstance(node, ast.FunctionDef) and node.name == "run":
+                run_def = node
+        if run_def is None:
+            return None
+        if not run_def.args.args and not run_def.args.vararg and not run_def.args.kwarg:
+            run_def.args.args = [ast.arg(arg=name) for name in arg_names]
+        tree = StepLimitTransformer(timeout_steps).visit(tree)
+        ast.fix_missing_locations(tree)
+        env = _engine_env()
+        exec(compile(tree, "<engine>", "exec"), env)
+        fn = env["run"]
+    except Exception:
+        return None
+
+    def call(*args: Any) -> Any:
+        try:
+            return fn(*args)
+        except Exception:
+            return None
+
+    return call
+
+
 def safe_load_module(code: str, timeout_steps: int = 5000) -> Optional[Dict[str, Any]]:
     """PHASE B: safely load a learner module with a restricted environment."""
     ok, err = validate_code(code)
@@ -1779,6 +2120,10 @@ def safe_load_module(code: str, timeout_steps: int = 5000) -> Optional[Dict[str,
 # Engine strategy (meta-evolvable selection/crossover policy)
 # ---------------------------
 
+SELECTION_ARGS = ("pool", "scores", "pop_size", "map_elites", "rng")
+CROSSOVER_ARGS = ("p1", "p2", "rng")
+
+
 @dataclass
 class EngineStrategy:
     selection_code: str
@@ -1786,6 +2131,27 @@ class EngineStrategy:
     mutation_policy_code: str
     gid: str = "default"
 
+    def _compiled(self, slot: str, code: str, arg_names: Tuple[str, ...]) -> Callable[..., Any]:
+        # Cache lives outside the dataclass fields so asdict/snapshots are unchanged;
+        # an entry is rebuilt only when its source text differs (e.g. after autopatch L2).
+        cache = self.__dict__.setdefault("_fn_cache", {})
+        hit = cache.get(slot)
+        if hit is not None and hit[0] == code:
+            return hit[1]
+        fn = compile_engine_fn(code, arg_names)
+        if fn is None:
+            fn = lambda *args: None
+        cache[slot] = (code, fn)
+        return fn
+
+    def selection_fn(self) -> Callable[..., Any]:
+        """Compiled selection: fn(pool, scores, pop_size, map_elites, rng)."""
+        return self._compiled("selection", self.selection_code, SELECTION_ARGS)
+
+    def crossover_fn(self) -> Callable[..., Any]:
+        """Compiled crossover: fn(p1, p2, rng)."""
+        return self._compiled("crossover", self.crossover_code, CROSSOVER_ARGS)
+
 
 DEFAULT_SELECTION_CODE = """
 def run():
@@ -2446,6 +2812,122 @@ class Genome:
             self.birth_ms = now_ms()
 
 
+def parse_body(lines: List[str]) -> Optional[List[ast.stmt]]:
+    """Parse genome statement lines into top-level statement ASTs (None if they do not parse)."""
+    # Parse inside the same template Genome.code uses, so embedded newlines fail exactly as they would there.
+    try:
+        fn = ast.parse("def run(x):\n    v0=x\n    " + "\n    ".join(lines)).body[0]
+        return fn.body[1:]
+    except Exception:
+        return None
+
+
+def render_body(body: List[ast.stmt]) -> List[str]:
+    lines: List[str] = []
+    for stmt in body:
+        # Freshly built nodes carry no positions; filling them in is harmless for shared nodes.
+        lines.extend(ast.unparse(ast.fix_missing_locations(stmt)).splitlines())
+    return lines
+
+
+class AstGenome(Genome):
+    """
+    Optional genome representation that keeps the body as parsed statement ASTs.
+    `statements` is rendered lazily, so asdict()/Universe.snapshot stay unchanged; AST_OPERATORS
+    edit the trees directly and evaluate() compiles them without re-parsing. Children share
+    untouched statement nodes with their parents, so nodes must never be mutated in place.
+    """
+
+    def __init__(
+        self,
+        statements: Optional[List[str]] = None,
+        gid: str = "",
+        parents: Optional[List[str]] = None,
+        op_tag: str = "init",
+        birth_ms: int = 0,
+        body: Optional[List[ast.stmt]] = None,
+    ):
+        if body is not None:
+            self._body: Optional[List[ast.stmt]] = list(body)
+            self._lines: Optional[List[str]] = None
+            self._tree: Optional[ast.Module] = None
+            self._compiled: Any = None
+        else:
+            self.statements = statements or []
+        self.gid = gid
+        self.parents = list(parents) if parents else []
+        self.op_tag = op_tag
+        self.birth_ms = birth_ms
+        if not self.gid:
+            self.gid = sha256(ast.dump(ast.Module(body=self._body or [], type_ignores=[])) + str(time.time()))[:12]
+        if not self.birth_ms:
+            self.birth_ms = now_ms()
+
+    @property
+    def statements(self) -> List[str]:
+        if self._lines is None:
+            self._lines = render_body(self._body or [])
+        return self._lines
+
+    @statements.setter
+    def statements(self, value: List[str]) -> None:
+        self._lines = list(value)
+        self._body = parse_body(self._lines)
+        self._tree = None
+        self._compiled = None
+
+    @property
+    def body(self) -> Optional[List[ast.stmt]]:
+        return self._body
+
+    def tree(self) -> Optional[ast.Module]:
+        """Module for `def run(x): v0=x; <body>`, structurally identical to parsing `code`."""
+        if self._body is None:
+            return None
+        if self._tree is None:
+            fn = ast.FunctionDef(
+                name="run",
+                args=ast.arguments(
+                    posonlyargs=[], args=[ast.arg(arg="x")], vararg=None,
+                    kwonlyargs=[], kw_defaults=[], kwarg=None, defaults=[],
+                ),
+                body=[ast.Assign(targets=[ast.Name(id="v0", ctx=ast.Store())], value=ast.Name(id="x", ctx=ast.Load()))]
+                + (self._body or [ast.Return(value=ast.Name(id="x", ctx=ast.Load()))]),
+                decorator_list=[],
+                returns=None,
+            )
+            self._tree = ast.fix_missing_locations(ast.Module(body=[fn], type_ignores=[]))
+        return self._tree
+
+    def compiled(self) -> Any:
+        """Step-limited code object, built once; the shared tree is copied before instrumentation."""
+        if self._compiled is None:
+            tree = self.tree()
+            if tree is None:
+                return None
+            inst = StepLimitTransformer(1000).visit(copy.deepcopy(tree))
+            ast.fix_missing_locations(inst)
+            self._compiled = compile(inst, "<lgp>", "exec")
+        return self._compiled
+
+    def run_fn(self, extra_env: Optional[Dict[str, Any]] = None) -> Optional[Callable[[Any], Any]]:
+        code_obj = self.compiled()
+        return load_run_fn(code_obj, extra_env) if code_obj is not None else None
+
+
+def as_ast_genome(g: Genome) -> Genome:
+    if isinstance(g, AstGenome):
+        return g
+    return AstGenome(statements=g.statements, gid=g.gid, parents=g.parents, op_tag=g.op_tag, birth_ms=g.birth_ms)
+
+
+def genome_source(g: Genome) -> Union[str, ast.Module]:
+    """Tree for AST genomes (no re-parse), source text otherwise."""
+    if isinstance(g, AstGenome) and g.body is not None:
+        return g.tree()
+    return g.code
+
+
 @dataclass
 class LearnerGenome:
     """PHASE B: learner genome with encode/predict/update/objective blocks."""
@@ -2600,32 +3082,49 @@ def calc_heuristic_loss(p: Any, t: Any, task_name: str, x: Any = None) -> float:
     return calc_error(p, t) + penalty
 
 
-def mse_exec(
+def case_errors_exec(
     code: str,
     xs: List[Any],
     ys: List[Any],
     task_name: str = "",
     extra_env: Optional[Dict[str, Any]] = None,
     validator: Callable[[str], Tuple[bool, str]] = validate_code,
-) -> Tuple[bool, float, str]:
+    run_fn: Optional[Callable[[Any], Any]] = None,
+) -> Tuple[bool, List[float], str]:
+    """Per-case errors of run(x) on (xs, ys); the vector lexicase selection works on."""
     ok, err = validator(code)
     if not ok:
-        return (False, float("inf"), err)
+        return (False, [], err)
     if validator == validate_program and not program_limits_ok(code):
-        return (False, float("inf"), "program_limits")
+        return (False, [], "program_limits")
     try:
-        total_err = 0.0
+        errors: List[float] = []
         for x, y in zip(xs, ys):
-            pred = safe_exec(code, x, extra_env=extra_env)
+            pred = run_fn(x) if run_fn is not None else safe_exec(code, x, extra_env=extra_env)
             if pred is None:
-                return (False, float("inf"), "No return")
+                return (False, [], "No return")
             if task_name in ("sort", "reverse", "max", "filter") or task_name.startswith("arc_"):
-                total_err += calc_heuristic_loss(pred, y, task_name, x=x)
+                errors.append(calc_heuristic_loss(pred, y, task_name, x=x))
             else:
-                total_err += calc_error(pred, y)
-        return (True, total_err / max(1, len(xs)), "")
+                errors.append(calc_error(pred, y))
+        return (True, errors, "")
     except Exception as e:
-        return (False, float("inf"), f"{type(e).__name__}: {str(e)}")
+        return (False, [], f"{type(e).__name__}: {str(e)}")
+
+
+def mse_exec(
+    code: str,
+    xs: List[Any],
+    ys: List[Any],
+    task_name: str = "",
+    extra_env: Optional[Dict[str, Any]] = None,
+    validator: Callable[[str], Tuple[bool, str]] = validate_code,
+    run_fn: Optional[Callable[[Any], Any]] = None,
+) -> Tuple[bool, float, str]:
+    ok, errors, err = case_errors_exec(code, xs, ys, task_name, extra_env=extra_env, validator=validator, run_fn=run_fn)
+    if not ok:
+        return (False, float("inf"), err)
+    return (True, sum(errors, 0.0) / max(1, len(xs)), "")
 
 
 def _algo_equal(a: Any, b: Any) -> bool:
@@ -2708,11 +3207,12 @@ def evaluate(
     extra_env: Optional[Dict[str, Any]] = None,
     validator: Callable[[str], Tuple[bool, str]] = validate_code,
 ) -> EvalResult:
-    code = g.code
-    ok1, tr, e1 = mse_exec(code, b.x_tr, b.y_tr, task_name, extra_env=extra_env)
-    ok2, ho, e2 = mse_exec(code, b.x_ho, b.y_ho, task_name, extra_env=extra_env)
-    ok3, st, e3 = mse_exec(code, b.x_st, b.y_st, task_name, extra_env=extra_env)
-    ok4, te, e4 = mse_exec(code, b.x_te, b.y_te, task_name, extra_env=extra_env)
+    code = genome_source(g)
+    run_fn = g.run_fn(extra_env) if isinstance(code, ast.AST) else None
+    ok1, tr, e1 = mse_exec(code, b.x_tr, b.y_tr, task_name, extra_env=extra_env, run_fn=run_fn)
+    ok2, ho, e2 = mse_exec(code, b.x_ho, b.y_ho, task_name, extra_env=extra_env, run_fn=run_fn)
+    ok3, st, e3 = mse_exec(code, b.x_st, b.y_st, task_name, extra_env=extra_env, run_fn=run_fn)
+    ok4, te, e4 = mse_exec(code, b.x_te, b.y_te, task_name, extra_env=extra_env, run_fn=run_fn)
     ok = ok1 and ok2 and ok3 and ok4 and all(math.isfinite(v) for v in (tr, ho, st, te))
     nodes = node_count(code)
     if not ok:
@@ -2725,6 +3225,73 @@ def evaluate(
     return EvalResult(ok, tr, ho, st, te, nodes, score, err or None)
 
 
+def evaluate_cases(
+    g: Genome,
+    b: Batch,
+    task_name: str,
+    case_idx: List[int],
+    extra_env: Optional[Dict[str, Any]] = None,
+) -> Tuple[bool, List[float], str]:
+    """Per-case train errors on the down-sampled cases `case_idx` (no hold/stress/test)."""
+    code = genome_source(g)
+    run_fn = g.run_fn(extra_env) if isinstance(code, ast.AST) else None
+    xs = [b.x_tr[i] for i in case_idx]
+    ys = [b.y_tr[i] for i in case_idx]
+    ok, errors, err = case_errors_exec(code, xs, ys, task_name, extra_env=extra_env, run_fn=run_fn)
+    if ok and not all(math.isfinite(e) for e in errors):
+        return (False, errors, err or "nan")
+    return (ok, errors, err)
+
+
+def downsample_cases(rng: random.Random, n_cases: int, rate: float) -> List[int]:
+    """Random subset of training-case indices, at least one case."""
+    if n_cases <= 0:
+        return []
+    k = max(1, min(n_cases, int(round(n_cases * rate))))
+    return sorted(rng.sample(range(n_cases), k))
+
+
+def _median(values: List[float]) -> float:
+    s = sorted(values)
+    mid = len(s) // 2
+    return s[mid] if len(s) % 2 else 0.5 * (s[mid - 1] + s[mid])
+
+
+def lexicase_select(
+    errors: List[List[float]],
+    n: int,
+    rng: random.Random,
+    epsilon: Optional[List[float]] = None,
+) -> List[int]:
+    """
+    Epsilon-lexicase parent selection: for each pick, shuffle the cases and keep only the
+    candidates within epsilon of the best on each case in turn. Default epsilon per case is the
+    median absolute deviation of that case's errors (exact lexicase when epsilon is all zeros).
+    """
+    if not errors or n <= 0:
+        return []
+    n_cases = min(len(e) for e in errors)
+    if epsilon is None:
+        epsilon = []
+        for c in range(n_cases):
+            col = [e[c] for e in errors]
+            med = _median(col)
+            epsilon.append(_median([abs(v - med) for v in col]))
+    everyone = list(range(len(errors)))
+    picks: List[int] = []
+    for _ in range(n):
+        pool = everyone
+        order = list(range(n_cases))
+        rng.shuffle(order)
+        for c in order:
+            cutoff = min(errors[i][c] for i in pool) + epsilon[c]
+            pool = [i for i in pool if errors[i][c] <= cutoff]
+            if len(pool) == 1:
+                break
+        picks.append(rng.choice(pool))
+    return picks
+
+
 def evaluate_learner(
     learner: LearnerGenome,
     b: Batch,
@@ -2807,19 +3374,18 @@ def _to_src(body: ast.AST) -> str:
     except Exception:
         return "x"
 
+_EXPR_KIND_SAMPLER = WeightedSampler(["binop", "call", "const", "var"], default=1.0)
+_EXPR_FUNC_SAMPLER = WeightedSampler(list(SAFE_FUNCS.keys()), default=0.5)
+
 def _random_expr(rng: random.Random, depth: int = 0) -> str:
     if depth > 2:
         return rng.choice(["x", "v0", str(rng.randint(0, 9))])
-    options = ["binop", "call", "const", "var"]
-    weights = [GRAMMAR_PROBS.get(k, 1.0) for k in options]
-    mtype = rng.choices(options, weights=weights, k=1)[0]
+    mtype = _EXPR_KIND_SAMPLER.sample(rng, GRAMMAR_PROBS)
     if mtype == "binop":
         op = rng.choice(["+", "-", "*", "/", "**", "%"])
         return f"({_random_expr(rng, depth + 1)} {op} {_random_expr(rng, depth + 1)})"
     if mtype == "call":
-        funcs = list(SAFE_FUNCS.keys())
-        f_weights = [GRAMMAR_PROBS.get(f, 0.5) for f in funcs]
-        fname = rng.choices(funcs, weights=f_weights, k=1)[0]
+        fname = _EXPR_FUNC_SAMPLER.sample(rng, GRAMMAR_PROBS)
         return f"{fname}({_random_expr(rng, depth + 1)})"
     if mtype == "const":
         return f"{rng.uniform(-2, 2):.2f}"
@@ -2871,27 +3437,44 @@ def op_modify_line(rng: random.Random, stmts: List[str]) -> List[str]:
         new_stmts[idx] = f"{var} = {_random_expr(rng)}"
     return new_stmts
 
+class _TweakConstTransformer(ast.NodeTransformer):
+    def __init__(self, rng: random.Random):
+        self.rng = rng
+
+    def visit_Constant(self, node):
+        rng = self.rng
+        if isinstance(node.value, (int, float)) and not isinstance(node.value, bool):
+            val = float(node.value)
+            new_val = val + rng.gauss(0, 0.1 * abs(val) + 0.01)
+            if rng.random() < 0.05:
+                new_val = -val
+            if rng.random() < 0.05:
+                new_val = 0.0
+            return ast.Constant(value=new_val)
+        return node
+
+
+class _ChangeBinOpTransformer(ast.NodeTransformer):
+    _pops = [ast.Add, ast.Sub, ast.Mult, ast.Div, ast.Pow, ast.Mod]
+
+    def __init__(self, rng: random.Random):
+        self.rng = rng
+
+    def visit_BinOp(self, node):
+        node = self.generic_visit(node)
+        if self.rng.random() < 0.5:
+            node.op = self.rng.choice(self._pops)()
+        return node
+
+
 def op_tweak_const(rng: random.Random, stmts: List[str]) -> List[str]:
     if not stmts:
         return stmts
     new_stmts = stmts[:]
     idx = rng.randint(0, len(new_stmts) - 1)
-
-    class TweakTransformer(ast.NodeTransformer):
-        def visit_Constant(self, node):
-            if isinstance(node.value, (int, float)) and not isinstance(node.value, bool):
-                val = float(node.value)
-                new_val = val + rng.gauss(0, 0.1 * abs(val) + 0.01)
-                if rng.random() < 0.05:
-                    new_val = -val
-                if rng.random() < 0.05:
-                    new_val = 0.0
-                return ast.Constant(value=new_val)
-            return node
-
     try:
         tree = ast.parse(new_stmts[idx], mode="exec")
-        new_tree = TweakTransformer().visit(tree)
+        new_tree = _TweakConstTransformer(rng).visit(tree)
         ast.fix_missing_locations(new_tree)
         new_stmts[idx] = ast.unparse(new_tree).strip()
     except Exception:
@@ -2903,18 +3486,9 @@ def op_change_binary(rng: random.Random, stmts: List[str]) -> List[str]:
         return stmts
     new_stmts = stmts[:]
     idx = rng.randint(0, len(new_stmts) - 1)
-    pops = [ast.Add, ast.Sub, ast.Mult, ast.Div, ast.Pow, ast.Mod]
-
-    class OpTransformer(ast.NodeTransformer):
-        def visit_BinOp(self, node):
-            node = self.generic_visit(node)
-            if rng.random() < 0.5:
-                node.op = rng.choice(pops)()
-            return node
-
     try:
         tree = ast.parse(new_stmts[idx], mode="exec")
-        new_tree = OpTransformer().visit(tree)
+        new_tree = _ChangeBinOpTransformer(rng).visit(tree)
         ast.fix_missing_locations(new_tree)
         new_stmts[idx] = ast.unparse(new_tree).strip()
     except Exception:
@@ -2991,11 +3565,17 @@ OPERATORS_LIB: Dict[str, Dict] = {}
 # @@OPERATORS_LIB_END@@
 
 
-def apply_synthesized_op(rng: random.Random, stmts: List[str], steps: List[str]) -> List[str]:
+def apply_synthesized_op(
+    rng: random.Random,
+    stmts: List[Any],
+    steps: List[str],
+    ops: Optional[Dict[str, Callable[[random.Random, List[Any]], List[Any]]]] = None,
+) -> List[Any]:
+    ops = OPERATORS if ops is None else ops
     result = stmts
     for step in steps:
-        if step in OPERATORS:
-            result = OPERATORS[step](rng, result)
+        if step in ops:
+            result = ops[step](rng, result)
     return result
 
 def synthesize_new_operator(rng: random.Random) -> Tuple[str, Dict]:
@@ -3005,81 +3585,432 @@ def synthesize_new_operator(rng: random.Random) -> Tuple[str, Dict]:
     return (name, {"steps": steps, "score": 0.0})
 
 
-def mutate_learner(rng: random.Random, learner: LearnerGenome, meta: "MetaState") -> LearnerGenome:
-    """PHASE B: mutate a learner genome by selecting a block."""
-    blocks = ["encode", "predict", "update", "objective"]
-    block = rng.choice(blocks)
-    op = meta.sample_op(rng)
-
-    def apply_block(stmts: List[str]) -> List[str]:
-        if op in OPERATORS:
-            return OPERATORS[op](rng, stmts)
-        return stmts
-
-    if block == "encode":
-        new_encode = apply_block(learner.encode_stmts)
-        return LearnerGenome(new_encode, learner.predict_stmts, learner.update_stmts, learner.objective_stmts, parents=[learner.gid], op_tag=f"mut:{block}:{op}")
-    if block == "predict":
-        new_predict = apply_block(learner.predict_stmts)
-        return LearnerGenome(learner.encode_stmts, new_predict, learner.update_stmts, learner.objective_stmts, parents=[learner.gid], op_tag=f"mut:{block}:{op}")
-    if block == "update":
-        new_update = apply_block(learner.update_stmts)
-        return LearnerGenome(learner.encode_stmts, learner.predict_stmts, new_update, learner.objective_stmts, parents=[learner.gid], op_tag=f"mut:{block}:{op}")
-    new_objective = apply_block(learner.objective_stmts)
-    return LearnerGenome(learner.encode_stmts, learner.predict_stmts, learner.update_stmts, new_objective, parents=[learner.gid], op_tag=f"mut:{block}:{op}")
-
-
 # ---------------------------
-# Surrogate + MAP-Elites
+# AST-native mutation operators (AstGenome)
 # ---------------------------
 
-class SurrogateModel:
-    def __init__(self, k: int = 5):
-        self.k = k
-        self.memory: List[Tuple[List[float], float]] = []
+def _load(name: str) -> ast.Name:
+    return ast.Name(id=name, ctx=ast.Load())
 
-    def _extract_features(self, code: str) -> List[float]:
-        return [
-            len(code),
-            code.count("\n"),
-            code.count("if "),
-            code.count("while "),
-            code.count("="),
-            code.count("return "),
-            code.count("("),
-        ]
+def _store(name: str) -> ast.Name:
+    return ast.Name(id=name, ctx=ast.Store())
 
-    def train(self, history: List[Dict]):
-        self.memory = []
-        for h in history[-200:]:
-            src = h.get("code") or h.get("expr")
-            if src and "score" in h and isinstance(h["score"], (int, float)):
-                feat = self._extract_features(src)
-                self.memory.append((feat, float(h["score"])))
+def _random_expr_ast(rng: random.Random, depth: int = 0) -> ast.expr:
+    """Tree-building counterpart of _random_expr."""
+    if depth > 2:
+        leaf = rng.choice(["x", "v0", rng.randint(0, 9)])
+        return ast.Constant(value=leaf) if isinstance(leaf, int) else _load(leaf)
+    mtype = _EXPR_KIND_SAMPLER.sample(rng, GRAMMAR_PROBS)
+    if mtype == "binop":
+        op = rng.choice([ast.Add, ast.Sub, ast.Mult, ast.Div, ast.Pow, ast.Mod])()
+        return ast.BinOp(left=_random_expr_ast(rng, depth + 1), op=op, right=_random_expr_ast(rng, depth + 1))
+    if mtype == "call":
+        fname = _EXPR_FUNC_SAMPLER.sample(rng, GRAMMAR_PROBS)
+        return ast.Call(func=_load(fname), args=[_random_expr_ast(rng, depth + 1)], keywords=[])
+    if mtype == "const":
+        return ast.Constant(value=round(rng.uniform(-2, 2), 2))
+    return _load(rng.choice(["x", "v0"]))
+
+def _var_lt_const(rng: random.Random) -> ast.Compare:
+    return ast.Compare(
+        left=_load(f"v{rng.randint(0, 3)}"),
+        ops=[ast.Lt()],
+        comparators=[ast.Constant(value=rng.randint(0, 10))],
+    )
 
-    def predict(self, code: str) -> float:
-        if not self.memory:
-            return 0.0
-        target = self._extract_features(code)
-        dists = []
-        for feat, score in self.memory:
-            d = sum((f1 - f2) ** 2 for f1, f2 in zip(target, feat)) ** 0.5
-            dists.append((d, score))
-        dists.sort(key=lambda x: x[0])
-        nearest = dists[: self.k]
-        total_w = 0.0
-        weighted = 0.0
-        for d, s in nearest:
-            w = 1.0 / (d + 1e-6)
-            weighted += s * w
-            total_w += w
-        return weighted / total_w if total_w > 0 else 0.0
+def ast_op_insert_assign(rng: random.Random, body: List[ast.stmt]) -> List[ast.stmt]:
+    new_body = body[:]
+    idx = rng.randint(0, len(new_body))
+    var = f"v{rng.randint(0, 3)}"
+    new_body.insert(idx, ast.Assign(targets=[_store(var)], value=_random_expr_ast(rng)))
+    return new_body
+
+def ast_op_insert_if(rng: random.Random, body: List[ast.stmt]) -> List[ast.stmt]:
+    if not body:
+        return body
+    new_body = body[:]
+    idx = rng.randint(0, len(new_body) - 1)
+    new_body[idx: idx + 2] = [ast.If(test=_var_lt_const(rng), body=new_body[idx: idx + 2], orelse=[])]
+    return new_body
+
+def ast_op_insert_while(rng: random.Random, body: List[ast.stmt]) -> List[ast.stmt]:
+    if not body:
+        return body
+    new_body = body[:]
+    idx = rng.randint(0, len(new_body) - 1)
+    new_body[idx: idx + 2] = [ast.While(test=_var_lt_const(rng), body=new_body[idx: idx + 2], orelse=[])]
+    return new_body
+
+def ast_op_delete_stmt(rng: random.Random, body: List[ast.stmt]) -> List[ast.stmt]:
+    if not body:
+        return body
+    new_body = body[:]
+    new_body.pop(rng.randint(0, len(new_body) - 1))
+    return new_body
+
+def ast_op_modify_line(rng: random.Random, body: List[ast.stmt]) -> List[ast.stmt]:
+    if not body:
+        return body
+    new_body = body[:]
+    idx = rng.randint(0, len(new_body) - 1)
+    stmt = new_body[idx]
+    if isinstance(stmt, ast.Assign):
+        new_body[idx] = ast.Assign(targets=stmt.targets, value=_random_expr_ast(rng))
+    return new_body
+
+def ast_op_tweak_const(rng: random.Random, body: List[ast.stmt]) -> List[ast.stmt]:
+    if not body:
+        return body
+    new_body = body[:]
+    idx = rng.randint(0, len(new_body) - 1)
+    # Copy only the edited statement; the rest stay shared with the parent.
+    new_body[idx] = _TweakConstTransformer(rng).visit(copy.deepcopy(new_body[idx]))
+    return new_body
+
+def ast_op_change_binary(rng: random.Random, body: List[ast.stmt]) -> List[ast.stmt]:
+    if not body:
+        return body
+    new_body = body[:]
+    idx = rng.randint(0, len(new_body) - 1)
+    new_body[idx] = _ChangeBinOpTransformer(rng).visit(copy.deepcopy(new_body[idx]))
+    return new_body
+
+def ast_op_list_manipulation(rng: random.Random, body: List[ast.stmt]) -> List[ast.stmt]:
+    if not body:
+        return body
+    new_body = body[:]
+    idx = rng.randint(0, len(new_body))
+    ops = [
+        lambda: ast.Assign(
+            targets=[_store(f"v{rng.randint(0, 3)}")],
+            value=ast.Subscript(value=_load("x"), slice=ast.Constant(value=rng.randint(0, 2)), ctx=ast.Load()),
+        ),
+        lambda: ast.If(
+            test=ast.Compare(
+                left=ast.Call(func=_load("len"), args=[_load("x")], keywords=[]),
+                ops=[ast.Gt()],
+                comparators=[ast.Constant(value=rng.randint(1, 5))],
+            ),
+            body=[ast.Assign(
+                targets=[_store(f"v{rng.randint(0, 3)}")],
+                value=ast.Subscript(value=_load("x"), slice=ast.Constant(value=0), ctx=ast.Load()),
+            )],
+            orelse=[],
+        ),
+        lambda: ast.Assign(
+            targets=[ast.Tuple(elts=[_store("v0"), _store("v1")], ctx=ast.Store())],
+            value=ast.Tuple(elts=[_load("v1"), _load("v0")], ctx=ast.Load()),
+        ),
+        lambda: ast.Assign(
+            targets=[_store(f"v{rng.randint(0, 3)}")],
+            value=ast.Call(func=_load("sorted"), args=[_load("x")], keywords=[]),
+        ),
+    ]
+    new_body.insert(idx, rng.choice(ops)())
+    return new_body
 
+def ast_op_modify_return(rng: random.Random, body: List[ast.stmt]) -> List[ast.stmt]:
+    new_body = body[:]
+    active_vars = ["x"] + [f"v{i}" for i in range(4)]
+    for i in range(len(new_body) - 1, -1, -1):
+        if isinstance(new_body[i], ast.Return):
+            new_body[i] = ast.Return(value=_load(rng.choice(active_vars)))
+            return new_body
+    new_body.append(ast.Return(value=_load(rng.choice(active_vars))))
+    return new_body
+
+def _ast_fallback(op: Callable[[random.Random, List[str]], List[str]]) -> Callable[[random.Random, List[ast.stmt]], List[ast.stmt]]:
+    """Run a string operator on the rendered body (learner-only ops have no tree form)."""
+    def apply(rng: random.Random, body: List[ast.stmt]) -> List[ast.stmt]:
+        parsed = parse_body(op(rng, render_body(body)))
+        return parsed if parsed is not None else body
+    return apply
+
+
+AST_OPERATORS: Dict[str, Callable[[random.Random, List[ast.stmt]], List[ast.stmt]]] = {
+    "insert_assign": ast_op_insert_assign,
+    "insert_if": ast_op_insert_if,
+    "insert_while": ast_op_insert_while,
+    "delete_stmt": ast_op_delete_stmt,
+    "modify_line": ast_op_modify_line,
+    "tweak_const": ast_op_tweak_const,
+    "change_binary": ast_op_change_binary,
+    "list_manip": ast_op_list_manipulation,
+    "modify_return": ast_op_modify_return,
+    "learner_update": _ast_fallback(op_learner_update_step),
+    "learner_objective": _ast_fallback(op_learner_objective_tweak),
+}
 
-SURROGATE = SurrogateModel()
 
+def coerce_body(stmts: Any) -> Optional[List[ast.stmt]]:
+    """Accept crossover output as statement ASTs or as source lines."""
+    if not isinstance(stmts, list):
+        return None
+    if all(isinstance(s, ast.stmt) for s in stmts):
+        return stmts
+    if all(isinstance(s, str) for s in stmts):
+        return parse_body(stmts)
+    return None
 
-class MAPElitesArchive:
+
+# ---------------------------
+# Genome simplifier (semantics-preserving canonicalization)
+# ---------------------------
+
+# f(f(e)) == f(e) and list(f(e)) == f(e) for these list-returning/idempotent calls.
+# Calls are never folded to constants: safe_exec runs run() with empty globals, so a call
+# raises at run time and replacing it by its value would change the genome's fitness.
+_IDEMPOTENT_FUNCS: Set[str] = {"sorted", "abs", "list", "ceil", "floor", "sign"}
+_LIST_RETURNING_FUNCS: Set[str] = {"sorted", "list"}
+_FOLD_BINOPS: Dict[type, Callable[[Any, Any], Any]] = {
+    ast.Add: lambda a, b: a + b,
+    ast.Sub: lambda a, b: a - b,
+    ast.Mult: lambda a, b: a * b,
+    ast.Div: lambda a, b: a / b,
+    ast.Mod: lambda a, b: a % b,
+    ast.Pow: lambda a, b: a ** b,
+}
+
+
+def _is_num_const(node: ast.AST) -> bool:
+    return isinstance(node, ast.Constant) and isinstance(node.value, (int, float)) and not isinstance(node.value, bool)
+
+
+def _fold_value(value: Any) -> Optional[ast.Constant]:
+    # Only keep results that unparse/re-parse to the same value.
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        return None
+    if not math.isfinite(value) or abs(value) > 1e12:
+        return None
+    return ast.Constant(value=value)
+
+
+class _SimplifyTransformer(ast.NodeTransformer):
+    """Arithmetic constant folding and removal of redundant wraps like list(sorted(e))."""
+
+    def __init__(self, shadowed: Set[str]):
+        self.shadowed = shadowed
+
+    def visit_BinOp(self, node):
+        node = self.generic_visit(node)
+        fn = _FOLD_BINOPS.get(type(node.op))
+        if fn is None or not (_is_num_const(node.left) and _is_num_const(node.right)):
+            return node
+        if isinstance(node.op, ast.Pow) and abs(node.right.value) > 64:
+            return node
+        try:
+            return _fold_value(fn(node.left.value, node.right.value)) or node
+        except Exception:
+            return node  # keep expressions that raise: the failure is part of the semantics
+
+    def visit_UnaryOp(self, node):
+        node = self.generic_visit(node)
+        if isinstance(node.op, (ast.USub, ast.UAdd)) and _is_num_const(node.operand):
+            val = node.operand.value
+            return _fold_value(-val if isinstance(node.op, ast.USub) else +val) or node
+        return node
+
+    def visit_Call(self, node):
+        node = self.generic_visit(node)
+        if not isinstance(node.func, ast.Name) or node.keywords or len(node.args) != 1:
+            return node
+        name = node.func.id
+        if name in self.shadowed:
+            return node
+        arg = node.args[0]
+        if isinstance(arg, ast.Call) and isinstance(arg.func, ast.Name) and arg.func.id not in self.shadowed:
+            inner = arg.func.id
+            if inner == name and name in _IDEMPOTENT_FUNCS and not arg.keywords and len(arg.args) == 1:
+                return arg
+            if name == "list" and inner in _LIST_RETURNING_FUNCS:
+                return arg
+        return node
+
+
+def _loaded_names(node: ast.AST) -> Set[str]:
+    return {n.id for n in ast.walk(node) if isinstance(n, ast.Name) and isinstance(n.ctx, ast.Load)}
+
+
+def _stored_names(nodes: Iterable[ast.AST]) -> Set[str]:
+    return {n.id for node in nodes for n in ast.walk(node) if isinstance(n, ast.Name) and isinstance(n.ctx, ast.Store)}
+
+
+def _truncate_after_return(stmts: List[ast.stmt]) -> List[ast.stmt]:
+    out: List[ast.stmt] = []
+    for stmt in stmts:
+        if isinstance(stmt, (ast.If, ast.While, ast.For)):
+            stmt = copy.copy(stmt)
+            stmt.body = _truncate_after_return(stmt.body)
+            stmt.orelse = _truncate_after_return(stmt.orelse)
+        out.append(stmt)
+        if isinstance(stmt, ast.Return):
+            break
+    return out
+
+
+def _total(node: ast.AST, bound: Set[str]) -> bool:
+    """True if evaluating `node` can neither raise nor have side effects."""
+    if isinstance(node, ast.Constant):
+        return True
+    if isinstance(node, ast.Name):
+        return node.id in bound
+    if isinstance(node, (ast.Tuple, ast.List)):
+        return all(_total(e, bound) for e in node.elts)
+    return False
+
+
+def _eliminate_dead(stmts: List[ast.stmt], live: Set[str], bound: Set[str]) -> Tuple[List[ast.stmt], Set[str]]:
+    """
+    Backward liveness pass: drop assignments to names that are never read afterwards and
+    expression statements without effect. Right-hand sides that might raise are kept, since a
+    raising statement turns the whole prediction into NaN and removing it would change fitness.
+    """
+    out: List[ast.stmt] = []
+    live = set(live)
+    for stmt in reversed(stmts):
+        if isinstance(stmt, ast.Return):
+            live = _loaded_names(stmt)
+        elif isinstance(stmt, ast.Assign) and len(stmt.targets) == 1 and isinstance(stmt.targets[0], ast.Name):
+            target = stmt.targets[0].id
+            if target not in live and _total(stmt.value, bound):
+                continue
+            if isinstance(stmt.value, ast.Name) and stmt.value.id == target and target in bound:
+                continue
+            live = (live - {target}) | _loaded_names(stmt.value)
+        elif isinstance(stmt, ast.Expr):
+            if _total(stmt.value, bound):
+                continue
+            live |= _loaded_names(stmt)
+        elif isinstance(stmt, ast.If):
+            body, live_b = _eliminate_dead(stmt.body, live, bound)
+            orelse, live_o = _eliminate_dead(stmt.orelse, live, bound)
+            if body:
+                stmt = copy.copy(stmt)
+                stmt.body, stmt.orelse = body, orelse
+                live = live_b | live_o | _loaded_names(stmt.test)
+            else:
+                live |= _loaded_names(stmt)  # an empty body needs `pass`, which the validators reject
+        elif isinstance(stmt, (ast.While, ast.For)):
+            # Conservative loop handling: everything read anywhere in the loop stays live.
+            loop_live = live | _loaded_names(stmt)
+            body, _ = _eliminate_dead(stmt.body, loop_live, bound)
+            if body:
+                stmt = copy.copy(stmt)
+                stmt.body = body
+            live = loop_live
+        else:
+            live |= _loaded_names(stmt)
+        out.append(stmt)
+    out.reverse()
+    return out, live
+
+
+def simplify_body(body: List[ast.stmt]) -> List[ast.stmt]:
+    """
+    Canonicalize a genome body (the statements after `v0=x`): fold constants, unwrap redundant
+    calls, truncate after return and remove dead assignments. Nodes are copied, never edited in place.
+    """
+    if not body:
+        return body
+    shadowed = _stored_names(body)
+    folded = [_SimplifyTransformer(shadowed).visit(copy.deepcopy(stmt)) for stmt in body]
+    truncated = _truncate_after_return(folded)
+    # Names definitely bound at every point: the argument, the prelude and loop-free top-level assigns.
+    bound = {"x", "v0"}
+    for stmt in truncated:
+        if isinstance(stmt, (ast.If, ast.While, ast.For)):
+            break
+        if isinstance(stmt, ast.Assign) and len(stmt.targets) == 1 and isinstance(stmt.targets[0], ast.Name):
+            if not _total(stmt.value, bound):
+                break
+            bound.add(stmt.targets[0].id)
+    simplified, _ = _eliminate_dead(truncated, set(), bound)
+    return simplified or truncated
+
+
+def simplify_statements(stmts: List[str]) -> List[str]:
+    """String-genome entry point; statements that do not parse are returned unchanged."""
+    body = parse_body(stmts)
+    if body is None:
+        return stmts
+    return render_body(simplify_body(body))
+
+
+def mutate_learner(rng: random.Random, learner: LearnerGenome, meta: "MetaState") -> LearnerGenome:
+    """PHASE B: mutate a learner genome by selecting a block."""
+    blocks = ["encode", "predict", "update", "objective"]
+    block = rng.choice(blocks)
+    op = meta.sample_op(rng)
+
+    def apply_block(stmts: List[str]) -> List[str]:
+        if op in OPERATORS:
+            return OPERATORS[op](rng, stmts)
+        return stmts
+
+    if block == "encode":
+        new_encode = apply_block(learner.encode_stmts)
+        return LearnerGenome(new_encode, learner.predict_stmts, learner.update_stmts, learner.objective_stmts, parents=[learner.gid], op_tag=f"mut:{block}:{op}")
+    if block == "predict":
+        new_predict = apply_block(learner.predict_stmts)
+        return LearnerGenome(learner.encode_stmts, new_predict, learner.update_stmts, learner.objective_stmts, parents=[learner.gid], op_tag=f"mut:{block}:{op}")
+    if block == "update":
+        new_update = apply_block(learner.update_stmts)
+        return LearnerGenome(learner.encode_stmts, learner.predict_stmts, new_update, learner.objective_stmts, parents=[learner.gid], op_tag=f"mut:{block}:{op}")
+    new_objective = apply_block(learner.objective_stmts)
+    return LearnerGenome(learner.encode_stmts, learner.predict_stmts, learner.update_stmts, new_objective, parents=[learner.gid], op_tag=f"mut:{block}:{op}")
+
+
+# ---------------------------
+# Surrogate + MAP-Elites
+# ---------------------------
+
+class SurrogateModel:
+    def __init__(self, k: int = 5):
+        self.k = k
+        self.memory: List[Tuple[List[float], float]] = []
+
+    def _extract_features(self, code: str) -> List[float]:
+        return [
+            len(code),
+            code.count("\n"),
+            code.count("if "),
+            code.count("while "),
+            code.count("="),
+            code.count("return "),
+            code.count("("),
+        ]
+
+    def train(self, history: List[Dict]):
+        self.memory = []
+        for h in history[-200:]:
+            src = h.get("code") or h.get("expr")
+            if src and "score" in h and isinstance(h["score"], (int, float)):
+                feat = self._extract_features(src)
+                self.memory.append((feat, float(h["score"])))
+
+    def predict(self, code: str) -> float:
+        if not self.memory:
+            return 0.0
+        target = self._extract_features(code)
+        dists = []
+        for feat, score in self.memory:
+            d = sum((f1 - f2) ** 2 for f1, f2 in zip(target, feat)) ** 0.5
+            dists.append((d, score))
+        dists.sort(key=lambda x: x[0])
+        nearest = dists[: self.k]
+        total_w = 0.0
+        weighted = 0.0
+        for d, s in nearest:
+            w = 1.0 / (d + 1e-6)
+            weighted += s * w
+            total_w += w
+        return weighted / total_w if total_w > 0 else 0.0
+
+
+SURROGATE = SurrogateModel()
+
+
+class MAPElitesArchive:
     def __init__(self, genome_cls: type = Genome):
         self.grid: Dict[Tuple[int, int], Tuple[float, Any]] = {}
         self.genome_cls = genome_cls
@@ -3468,6 +4399,23 @@ def inject_helpers_into_statements(rng: random.Random, stmts: List[str], library
     return new_stmts
 
 
+def inject_helpers_into_body(rng: random.Random, body: List[ast.stmt], library: FunctionLibrary) -> List[ast.stmt]:
+    """AST counterpart of inject_helpers_into_statements; only the return expression is rendered."""
+    if not library.funcs:
+        return body
+    for i, stmt in enumerate(body):
+        if isinstance(stmt, ast.Return) and stmt.value is not None:
+            new_expr, helper_name = library.maybe_inject(rng, ast.unparse(stmt.value))
+            if helper_name:
+                try:
+                    new_body = body[:]
+                    new_body[i] = ast.Return(value=ast.parse(new_expr, mode="eval").body)
+                    return new_body
+                except Exception:
+                    return body
+    return body
+
+
 # ---------------------------
 # MetaState (L0/L1 source-patchable)
 # ---------------------------
@@ -3523,7 +4471,7 @@ class UpdateRuleGenome:
 
 @dataclass
 class MetaState:
-    op_weights: Dict[str, float] = field(default_factory=lambda: dict(OP_WEIGHT_INIT))
+    op_weights: Dict[str, float] = field(default_factory=lambda: VersionedWeights(OP_WEIGHT_INIT))
     op_velocity: Dict[str, float] = field(default_factory=dict)
     mutation_rate: float = 0.8863
     crossover_rate: float = 0.1971
@@ -3541,14 +4489,13 @@ class MetaState:
     def sample_op(self, rng: random.Random) -> str:
         if rng.random() < self.epsilon_explore:
             return rng.choice(list(OPERATORS.keys()))
-        total = sum(max(0.01, w) for w in self.op_weights.values())
-        r = rng.random() * total
-        acc = 0.0
-        for k, w in self.op_weights.items():
-            acc += max(0.01, w)
-            if r <= acc:
-                return k
-        return rng.choice(list(OPERATORS.keys()))
+        if not self.op_weights:
+            return rng.choice(list(OPERATORS.keys()))
+        # Alias table cached on the instance (not a field), rebuilt only when op_weights change.
+        sampler = self.__dict__.get("_op_sampler")
+        if sampler is None:
+            sampler = self.__dict__["_op_sampler"] = WeightedSampler(floor=0.01)
+        return sampler.sample(rng, self.op_weights)
 
     def update(self, op: str, delta: float, accepted: bool):
         if op in self.op_weights:
@@ -3701,6 +4648,9 @@ class Universe:
     best_stress: float = float("inf")
     best_test: float = float("inf")
     history: List[Dict] = field(default_factory=list)
+    genome_repr: str = "str"  # "str" (statement lines) or "ast" (AstGenome)
+    selection_mode: str = "score"  # "score" (strategy selection on EvalResult.score) or "lexicase"
+    lexicase_rate: float = 0.25  # fraction of x_tr cases sampled per generation in lexicase mode
 
     def step(
         self,
@@ -3714,6 +4664,9 @@ class Universe:
         if batch is None:
             self.pool = [seed_genome(rng) for _ in range(pop_size)]
             return {"gen": gen, "accepted": False, "reason": "no_batch"}
+        ast_mode = self.genome_repr == "ast"
+        if ast_mode:
+            self.pool = [as_ast_genome(g) for g in self.pool]
 
         helper_env = self.library.get_helpers()
         if policy_controls:
@@ -3729,16 +4682,25 @@ class Universe:
             novelty_weight = 0.0
             branch_rate = 0.0
 
+        # Down-sampled lexicase: everyone is screened on a random subset of x_tr; only the
+        # screening leaders (elites / best-so-far candidates) get the full train/hold/stress/test run.
+        lexicase = self.selection_mode == "lexicase" and self.eval_mode != "algo"
+        case_idx = downsample_cases(rng, len(batch.x_tr), self.lexicase_rate) if lexicase else []
+        screened: List[Tuple[Genome, List[float], float]] = []
+        n_elite = max(4, pop_size // 10)
+
         scored: List[Tuple[Genome, EvalResult]] = []
         all_results: List[Tuple[Genome, EvalResult]] = []
         for g in self.pool:
+            src = genome_source(g) if self.eval_mode != "algo" else g.code
             # Hard gate: enforce input dependence before any scoring/selection.
             gate_ok, gate_reason = _hard_gate_ok(
-                g.code,
+                src,
                 batch,
                 self.eval_mode if self.eval_mode != "program" else "solver",
                 task.name,
                 extra_env=helper_env,
+                run_fn=g.run_fn(helper_env) if isinstance(src, ast.AST) else None,
             )
             if not gate_ok:
                 res = EvalResult(
@@ -3747,12 +4709,21 @@ class Universe:
                     float("inf"),
                     float("inf"),
                     float("inf"),
-                    node_count(g.code),
+                    node_count(src),
                     float("inf"),
                     f"hard_gate:{gate_reason}",
                 )
                 all_results.append((g, res))
                 continue
+            if lexicase:
+                ok, errs, err = evaluate_cases(g, batch, task.name, case_idx, extra_env=helper_env)
+                nodes = node_count(src)
+                sub = sum(errs) / max(1, len(errs)) if ok else float("inf")
+                inf = float("inf")
+                all_results.append((g, EvalResult(ok, sub, inf, inf, inf, nodes, inf, err or None)))
+                if ok:
+                    screened.append((g, errs, sub + self.meta.complexity_lambda * nodes))
+                continue
             if self.eval_mode == "algo":
                 res = evaluate_algo(g, batch, task.name, self.meta.complexity_lambda)
             else:
@@ -3762,6 +4733,15 @@ class Universe:
             if res.ok:
                 scored.append((g, res))
 
+        if lexicase:
+            screened.sort(key=lambda t: t[2])
+            validator = validate_program if self.eval_mode == "program" else validate_code
+            for g, _, _ in screened[:n_elite]:
+                res = evaluate(g, batch, task.name, self.meta.complexity_lambda, extra_env=helper_env, validator=validator)
+                if res.ok:
+                    scored.append((g, res))
+        full_evals = len(screened[:n_elite]) if lexicase else len(all_results)
+
         MetaCognitiveEngine.analyze_execution(all_results, self.meta)
 
         if not scored:
@@ -3770,7 +4750,7 @@ class Universe:
             return {"gen": gen, "accepted": False, "reason": "reseed"}
 
         scored.sort(key=lambda t: t[1].score)
-        timeout_rate = 1.0 - (len(scored) / max(1, len(all_results)))
+        timeout_rate = 1.0 - ((len(screened) if lexicase else len(scored)) / max(1, len(all_results)))
         avg_nodes = sum(r.nodes for _, r in scored) / max(1, len(scored))
 
         # MAP-Elites add
@@ -3784,15 +4764,20 @@ class Universe:
                 if adopted:
                     break
 
-        # selection via strategy
-        sel_ctx = {
-            "pool": [g for g, _ in scored],
-            "scores": [res.score for _, res in scored],
-            "pop_size": pop_size,
-            "map_elites": MAP_ELITES,
-            "rng": rng,
-        }
-        sel_res = safe_exec_engine(self.meta.strategy.selection_code, sel_ctx)
+        # selection via strategy (lexicase mode: parents from per-case errors, elites from full scores)
+        if lexicase:
+            sel_res = (
+                [g for g, _ in scored[:n_elite]],
+                [screened[i][0] for i in lexicase_select([e for _, e, _ in screened], max(0, pop_size - n_elite), rng)],
+            )
+        else:
+            sel_res = self.meta.strategy.selection_fn()(
+                [g for g, _ in scored],
+                [res.score for _, res in scored],
+                pop_size,
+                MAP_ELITES,
+                rng,
+            )
         if sel_res and isinstance(sel_res, (tuple, list)) and len(sel_res) == 2:
             elites, parenting_pool = sel_res
         else:
@@ -3803,6 +4788,15 @@ class Universe:
         needed = pop_size - len(elites)
         attempts_needed = max(needed * 2, needed + 8)
         mate_pool = list(elites) + list(parenting_pool)
+        crossover = self.meta.strategy.crossover_fn()
+        ops_table = AST_OPERATORS if ast_mode else OPERATORS
+
+        def parts(g: Genome) -> List[Any]:
+            # AST mode breeds on statement trees; genomes whose lines do not parse fall back to "return x".
+            if ast_mode:
+                body = as_ast_genome(g).body
+                return list(body) if body is not None else []
+            return g.statements
 
         while len(candidates) < attempts_needed:
             parent = rng.choice(parenting_pool) if parenting_pool else rng.choice(elites)
@@ -3812,15 +4806,16 @@ class Universe:
             # crossover
             if rng.random() < self.meta.crossover_rate and len(mate_pool) > 1:
                 p2 = rng.choice(mate_pool)
-                cross_ctx = {"p1": parent.statements, "p2": p2.statements, "rng": rng}
-                new_stmts = safe_exec_engine(self.meta.strategy.crossover_code, cross_ctx)
+                new_stmts = crossover(parts(parent), parts(p2), rng)
+                if ast_mode:
+                    new_stmts = coerce_body(new_stmts)
                 if new_stmts and isinstance(new_stmts, list):
                     op_tag = "crossover"
                 else:
                     new_stmts = None
 
             if not new_stmts:
-                new_stmts = parent.statements[:]
+                new_stmts = parts(parent)[:]
 
             # mutation
             if op_tag in ("copy", "crossover") and rng.random() < self.meta.mutation_rate:
@@ -3828,21 +4823,26 @@ class Universe:
                 if use_synth:
                     synth_name = rng.choice(list(OPERATORS_LIB.keys()))
                     steps = OPERATORS_LIB[synth_name].get("steps", [])
-                    new_stmts = apply_synthesized_op(rng, new_stmts, steps)
+                    new_stmts = apply_synthesized_op(rng, new_stmts, steps, ops_table)
                     op_tag = f"synth:{synth_name}"
                 else:
                     op = self.meta.sample_op(rng)
-                    if op in OPERATORS:
-                        new_stmts = OPERATORS[op](rng, new_stmts)
+                    if op in ops_table:
+                        new_stmts = ops_table[op](rng, new_stmts)
                     op_tag = f"mut:{op}"
 
             if rng.random() < branch_rate:
                 extra = rng.choice(seed_genome(rng).statements)
-                new_stmts = list(new_stmts) + [extra]
+                new_stmts = list(new_stmts) + ((parse_body([extra]) or []) if ast_mode else [extra])
                 op_tag = f"{op_tag}|branch"
 
-            new_stmts = inject_helpers_into_statements(rng, list(new_stmts), self.library)
-            candidates.append(Genome(statements=new_stmts, parents=[parent.gid], op_tag=op_tag))
+            # Children are canonicalized once here; execution, hashing and node_count all see the simplified body.
+            if ast_mode:
+                new_body = simplify_body(inject_helpers_into_body(rng, list(new_stmts), self.library))
+                candidates.append(AstGenome(body=new_body, parents=[parent.gid], op_tag=op_tag))
+            else:
+                new_stmts = simplify_statements(inject_helpers_into_statements(rng, list(new_stmts), self.library))
+                candidates.append(Genome(statements=new_stmts, parents=[parent.gid], op_tag=op_tag))
 
         # surrogate ranking
         with_pred = [(c, SURROGATE.predict(c.code) + novelty_weight * rng.random()) for c in candidates]
@@ -3891,6 +4891,7 @@ class Universe:
             "novelty_weight": novelty_weight,
             "timeout_rate": timeout_rate,
             "avg_nodes": avg_nodes,
+            "full_evals": full_evals,
         }
         self.history.append(log)
         if gen % 5 == 0:
@@ -3912,6 +4913,9 @@ class Universe:
             "library": self.library.snapshot(),
             "history": self.history[-50:],
             "eval_mode": self.eval_mode,
+            "genome_repr": self.genome_repr,
+            "selection_mode": self.selection_mode,
+            "lexicase_rate": self.lexicase_rate,
         }
 
     @staticmethod
@@ -3922,12 +4926,13 @@ class Universe:
         if "update_rule" in meta_data and isinstance(meta_data["update_rule"], dict):
             meta_data["update_rule"] = UpdateRuleGenome.from_dict(meta_data["update_rule"])
         meta = MetaState(**{k: v for k, v in meta_data.items() if k != "op_weights"})
-        meta.op_weights = meta_data.get("op_weights", dict(OP_WEIGHT_INIT))
-        pool = [Genome(**g) for g in s.get("pool", [])]
+        meta.op_weights = VersionedWeights(meta_data.get("op_weights", OP_WEIGHT_INIT))
+        genome_cls = AstGenome if s.get("genome_repr", "str") == "ast" else Genome
+        pool = [genome_cls(**g) for g in s.get("pool", [])]
         lib = FunctionLibrary.from_snapshot(s.get("library", {}))
         u = Universe(uid=s.get("uid", 0), seed=s.get("seed", 0), meta=meta, pool=pool, library=lib)
         if s.get("best"):
-            u.best = Genome(**s["best"])
+            u.best = genome_cls(**s["best"])
         u.best_score = s.get("best_score", float("inf"))
         u.best_train = s.get("best_train", float("inf"))
         u.best_hold = s.get("best_hold", float("inf"))
@@ -3935,6 +4940,9 @@ class Universe:
         u.best_test = s.get("best_test", float("inf"))
         u.history = s.get("history", [])
         u.eval_mode = s.get("eval_mode", "solver")
+        u.genome_repr = s.get("genome_repr", "str")
+        u.selection_mode = s.get("selection_mode", "score")
+        u.lexicase_rate = s.get("lexicase_rate", 0.25)
         return u
 
 
@@ -3995,14 +5003,13 @@ class UniverseLearner:
         best_g0, best_res0 = scored[0]
         MAP_ELITES_LEARNER.add(best_g0, best_res0.score)
 
-        sel_ctx = {
-            "pool": [g for g, _ in scored],
-            "scores": [res.score for _, res in scored],
-            "pop_size": pop_size,
-            "map_elites": MAP_ELITES_LEARNER,
-            "rng": rng,
-        }
-        sel_res = safe_exec_engine(self.meta.strategy.selection_code, sel_ctx)
+        sel_res = self.meta.strategy.selection_fn()(
+            [g for g, _ in scored],
+            [res.score for _, res in scored],
+            pop_size,
+            MAP_ELITES_LEARNER,
+            rng,
+        )
         if sel_res and isinstance(sel_res, (tuple, list)) and len(sel_res) == 2:
             elites, parenting_pool = sel_res
         else:
@@ -4013,6 +5020,7 @@ class UniverseLearner:
         needed = pop_size - len(elites)
         attempts_needed = max(needed * 2, needed + 8)
         mate_pool = list(elites) + list(parenting_pool)
+        crossover = self.meta.strategy.crossover_fn()
 
         while len(candidates) < attempts_needed:
             parent = rng.choice(parenting_pool) if parenting_pool else rng.choice(elites)
@@ -4021,10 +5029,10 @@ class UniverseLearner:
 
             if rng.random() < self.meta.crossover_rate and len(mate_pool) > 1:
                 p2 = rng.choice(mate_pool)
-                new_encode = safe_exec_engine(self.meta.strategy.crossover_code, {"p1": parent.encode_stmts, "p2": p2.encode_stmts, "rng": rng})
-                new_predict = safe_exec_engine(self.meta.strategy.crossover_code, {"p1": parent.predict_stmts, "p2": p2.predict_stmts, "rng": rng})
-                new_update = safe_exec_engine(self.meta.strategy.crossover_code, {"p1": parent.update_stmts, "p2": p2.update_stmts, "rng": rng})
-                new_objective = safe_exec_engine(self.meta.strategy.crossover_code, {"p1": parent.objective_stmts, "p2": p2.objective_stmts, "rng": rng})
+                new_encode = crossover(parent.encode_stmts, p2.encode_stmts, rng)
+                new_predict = crossover(parent.predict_stmts, p2.predict_stmts, rng)
+                new_update = crossover(parent.update_stmts, p2.update_stmts, rng)
+                new_objective = crossover(parent.objective_stmts, p2.objective_stmts, rng)
                 if all(isinstance(v, list) for v in (new_encode, new_predict, new_update, new_objective)):
                     child = LearnerGenome(new_encode, new_predict, new_update, new_objective, parents=[parent.gid], op_tag="crossover")
                     op_tag = "crossover"
@@ -4097,7 +5105,7 @@ class UniverseLearner:
         if "update_rule" in meta_data and isinstance(meta_data["update_rule"], dict):
             meta_data["update_rule"] = UpdateRuleGenome.from_dict(meta_data["update_rule"])
         meta = MetaState(**{k: v for k, v in meta_data.items() if k != "op_weights"})
-        meta.op_weights = meta_data.get("op_weights", dict(OP_WEIGHT_INIT))
+        meta.op_weights = VersionedWeights(meta_data.get("op_weights", OP_WEIGHT_INIT))
         pool = [LearnerGenome(**g) for g in s.get("pool", [])]
         lib = FunctionLibrary.from_snapshot(s.get("library", {}))
         u = UniverseLearner(uid=s.get("uid", 0), seed=s.get("seed", 0), meta=meta, pool=pool, library=lib)
@@ -4153,23 +5161,482 @@ def load_operators_lib(path: Path):
         except Exception:
             pass
 
-def save_state(gs: GlobalState):
+def _json_diff(old: Any, new: Any) -> Optional[Dict[str, Any]]:
+    """
+    Patch turning JSON value `old` into `new` (None if equal). Dicts patch per key, lists either shift
+    (drop a prefix, append a tail: rolling histories) or patch per index; anything else is replaced.
+    """
+    if old == new:
+        return None
+    if isinstance(old, dict) and isinstance(new, dict):
+        changed: Dict[str, Any] = {}
+        for k, v in new.items():
+            if k not in old:
+                changed[k] = {"=": v}
+            else:
+                sub = _json_diff(old[k], v)
+                if sub is not None:
+                    changed[k] = sub
+        patch: Dict[str, Any] = {"{": changed}
+        removed = [k for k in old if k not in new]
+        if removed:
+            patch["-"] = removed
+        return patch
+    if isinstance(old, list) and isinstance(new, list) and old and new:
+        for drop in range(len(old)):
+            keep = len(old) - drop
+            if keep <= len(new) and old[drop] == new[0] and old[drop:] == new[:keep]:
+                return {"[": [drop, new[keep:]]}
+        if len(old) == len(new):
+            return {"i": {str(i): d for i, (a, b) in enumerate(zip(old, new)) if (d := _json_diff(a, b)) is not None}}
+    return {"=": new}
+
+
+def _json_apply(old: Any, patch: Dict[str, Any]) -> Any:
+    if "=" in patch:
+        return patch["="]
+    if "[" in patch:
+        drop, tail = patch["["]
+        return old[drop:] + tail
+    if "i" in patch:
+        out = list(old)
+        for i, sub in patch["i"].items():
+            out[int(i)] = _json_apply(out[int(i)], sub)
+        return out
+    out = dict(old)
+    for k, sub in patch.get("{", {}).items():
+        out[k] = _json_apply(out.get(k), sub)
+    for k in patch.get("-", []):
+        out.pop(k, None)
+    return out
+
+
+CHECKPOINT_FULL_EVERY = 50
+CHECKPOINT_MAX_RECORDS = 400
+
+
+def _stat_or_none(path: Path) -> Optional[os.stat_result]:
+    try:
+        return path.stat()
+    except OSError:
+        return None
+
+
+class CheckpointStore:
+    """
+    Append-only checkpoint store in <state_dir>/checkpoints. Genomes, libraries and the operator
+    library go to objects.jsonl once, keyed by the sha256 of their canonical JSON; log.jsonl holds
+    per-save records that reference them: a full document every CHECKPOINT_FULL_EVERY saves and
+    JSON patches (_json_diff) against the previous document otherwise, so a save writes only what
+    changed. Past CHECKPOINT_MAX_RECORDS records the log is compacted to one full record and
+    unreferenced objects are dropped. Replay skips torn lines, so a crash loses at most one save.
+
+    The document is {"state": GlobalState dict with universes keyed by uid and pools/best/library
+    as {"#": hash} refs, "operators_lib": ref, "map_elites": {"solver"|"learner": cell -> [score, ref]}}.
+
+    Hashes are remembered per genome gid (or per slot for libraries): an object equal to the stored
+    copy under its remembered hash is not serialised again, so a save only hashes what changed.
+    """
+
+    def __init__(self, root: Path):
+        self.root = root
+        self.log_path = root / "log.jsonl"
+        self.objects_path = root / "objects.jsonl"
+        self.doc: Optional[Dict[str, Any]] = None
+        self.objects: Dict[str, Any] = {}
+        self.records = 0
+        self.since_full = 0
+        self._sizes: Tuple[Any, ...] = ()
+        self._hashes: Dict[Any, str] = {}
+        self._lock = threading.RLock()
+
+    def _disk_sizes(self) -> Tuple[Any, ...]:
+        return tuple((st.st_size, st.st_mtime_ns) if (st := _stat_or_none(p)) else None for p in (self.log_path, self.objects_path))
+
+    @staticmethod
+    def _read_lines(path: Path) -> List[Dict[str, Any]]:
+        out = []
+        if path.exists():
+            for line in path.read_text(encoding="utf-8").splitlines():
+                try:
+                    out.append(json.loads(line))
+                except ValueError:
+                    continue
+        return out
+
+    def _refresh(self) -> None:
+        """Replay from disk unless this instance wrote the files last."""
+        sizes = self._disk_sizes()
+        if sizes == self._sizes:
+            return
+        self.objects = {rec["h"]: rec["o"] for rec in self._read_lines(self.objects_path) if "h" in rec}
+        self.doc, self.records, self.since_full = None, 0, 0
+        for rec in self._read_lines(self.log_path):
+            try:
+                if "full" in rec:
+                    self.doc, self.since_full = rec["full"], 0
+                elif self.doc is not None:
+                    self.doc = _json_apply(self.doc, rec["patch"])
+                    self.since_full += 1
+                self.records += 1
+            except (KeyError, IndexError, TypeError, ValueError):
+                continue
+        self._sizes = sizes
+
+    def exists(self) -> bool:
+        return self.log_path.exists()
+
+    def _ref(self, obj: Any, pending: Dict[str, Any], key: Any = None) -> Dict[str, str]:
+        if key is None and isinstance(obj, dict) and obj.get("gid"):
+            key = ("gid", obj["gid"])
+        h = self._hashes.get(key) if key is not None else None
+        if h is not None:
+            known = pending[h] if h in pending else self.objects.get(h)
+            if known is not None and known == obj:
+                return {"#": h}
+        h = sha256(json.dumps(obj, sort_keys=True, separators=(",", ":"), default=str))[:24]
+        if h not in self.objects and h not in pending:
+            pending[h] = obj
+        if key is not None:
+            self._hashes[key] = h
+        return {"#": h}
+
+    def _deref(self, value: Any) -> Any:
+        if isinstance(value, dict) and set(value) == {"#"}:
+            return copy.deepcopy(self.objects[value["#"]])
+        return value
+
+    def _encode_state(self, state: Dict[str, Any], pending: Dict[str, Any]) -> Dict[str, Any]:
+        out = {k: v for k, v in state.items() if k != "universes"}
+        universes: Dict[str, Any] = {}
+        for i, u in enumerate(state.get("universes", [])):
+            eu = dict(u)
+            eu["pool"] = [self._ref(g, pending) for g in u.get("pool", [])]
+            uid = str(u.get("uid", i))
+            for key in ("best", "library"):
+                if eu.get(key) is not None:
+                    eu[key] = self._ref(u[key], pending, None if key == "best" else (key, uid))
+            universes[uid if uid not in universes else f"{uid}#{i}"] = eu
+        out["universes"] = universes
+        out["universe_order"] = list(universes)
+        return out
+
+    def _decode_state(self, enc: Dict[str, Any]) -> Dict[str, Any]:
+        out = {k: v for k, v in enc.items() if k not in ("universes", "universe_order")}
+        universes = []
+        for key in enc.get("universe_order", []):
+            u = dict(enc["universes"][key])
+            u["pool"] = [self._deref(g) for g in u.get("pool", [])]
+            for k in ("best", "library"):
+                if k in u:
+                    u[k] = self._deref(u[k])
+            universes.append(u)
+        out["universes"] = universes
+        return copy.deepcopy(out)
+
+    def latest(self) -> Optional[Dict[str, Any]]:
+        """Decoded latest document: {"state", "operators_lib", "map_elites": {kind: archive snapshot}}."""
+        with self._lock:
+            return self._latest()
+
+    def _latest(self) -> Optional[Dict[str, Any]]:
+        self._refresh()
+        if self.doc is None:
+            return None
+        out: Dict[str, Any] = {"state": self._decode_state(self.doc["state"]) if self.doc.get("state") else None}
+        out["operators_lib"] = self._deref(self.doc.get("operators_lib"))
+        out["map_elites"] = {
+            kind: {"grid_size": len(grid), "entries": [[json.loads(cell), score, self._deref(g)] for cell, (score, g) in grid.items()]}
+            for kind, grid in self.doc.get("map_elites", {}).items()
+        }
+        return out
+
+    def commit(
+        self,
+        state: Optional[Dict[str, Any]] = None,
+        operators_lib: Optional[Dict[str, Any]] = None,
+        map_elites: Optional[Dict[str, Dict[str, Any]]] = None,
+    ) -> int:
+        """Record a save (omitted parts keep their previous value). Returns the bytes appended."""
+        with self._lock:
+            return self._commit(state, operators_lib, map_elites)
+
+    def _commit(
+        self,
+        state: Optional[Dict[str, Any]],
+        operators_lib: Optional[Dict[str, Any]],
+        map_elites: Optional[Dict[str, Dict[str, Any]]],
+    ) -> int:
+        self._refresh()
+        pending: Dict[str, Any] = {}
+        doc = dict(self.doc or {})
+        if state is not None:
+            doc["state"] = self._encode_state(state, pending)
+        if operators_lib is not None:
+            doc["operators_lib"] = self._ref(operators_lib, pending, "operators_lib")
+        if map_elites is not None:
+            grids = dict(doc.get("map_elites", {}))
+            for kind, snap in map_elites.items():
+                grids[kind] = {json.dumps(cell): [score, self._ref(g, pending)] for cell, score, g in snap.get("entries", [])}
+            doc["map_elites"] = grids
+        # Round-trip so the in-memory document compares equal to a replayed one (tuples, int keys).
+        doc = json.loads(json.dumps(doc, default=str))
+        pending = json.loads(json.dumps(pending, default=str))
+        if self.doc is None or self.since_full + 1 >= CHECKPOINT_FULL_EVERY:
+            record: Dict[str, Any] = {"full": doc}
+        else:
+            patch = _json_diff(self.doc, doc)
+            if patch is None:
+                return 0
+            record = {"patch": patch}
+        record["ms"] = now_ms()
+        safe_mkdir(self.root)
+        written = 0
+        if pending:
+            written += self._append(self.objects_path, [{"h": h, "o": o} for h, o in pending.items()])
+            self.objects.update(pending)
+        written += self._append(self.log_path, [record])
+        self.doc = doc
+        self.records += 1
+        self.since_full = 0 if "full" in record else self.since_full + 1
+        self._sizes = self._disk_sizes()
+        if self.records > CHECKPOINT_MAX_RECORDS:
+            self.compact()
+        return written
+
+    @staticmethod
+    def _append(path: Path, records: List[Dict[str, Any]]) -> int:
+        text = "".join(json.dumps(r, separators=(",", ":"), default=str) + "\n" for r in records)
+        with path.open("a+b") as f:
+            if f.tell() > 0:
+                f.seek(-1, os.SEEK_END)
+                if f.read(1) != b"\n":
+                    text = "\n" + text  # terminate a line torn by a crash
+            f.write(text.encode("utf-8"))
+            f.flush()
+            os.fsync(f.fileno())
+        return len(text)
+
+    def compact(self) -> None:
+        """Rewrite the log as one full record and drop objects it no longer references."""
+        with self._lock:
+            self._compact()
+
+    def _compact(self) -> None:
+        self._refresh()
+        if self.doc is None:
+            return
+        live: Set[str] = set()
+        stack: List[Any] = [self.doc]
+        while stack:
+            v = stack.pop()
+            if isinstance(v, dict):
+                if set(v) == {"#"}:
+                    live.add(v["#"])
+                else:
+                    stack.extend(v.values())
+            elif isinstance(v, list):
+                stack.extend(v)
+        # Log first: a crash between the two replaces leaves extra objects, never missing ones.
+        for path, records in (
+            (self.log_path, [{"full": self.doc, "ms": now_ms()}]),
+            (self.objects_path, [{"h": h, "o": o} for h, o in self.objects.items() if h in live]),
+        ):
+            write_text_atomic(path, "".join(json.dumps(r, separators=(",", ":"), default=str) + "\n" for r in records))
+        self.objects = {h: o for h, o in self.objects.items() if h in live}
+        self._hashes = {k: h for k, h in self._hashes.items() if h in live}
+        self.records, self.since_full = 1, 0
+        self._sizes = self._disk_sizes()
+
+
+_CHECKPOINT_STORE: Optional[CheckpointStore] = None
+
+
+def checkpoint_store(state_dir: Path) -> CheckpointStore:
+    """
+    Store for `state_dir`. Only STATE_DIR's store is cached, since a store holds the decoded state
+    and its objects in memory; other dirs (autopatch candidates, pipeline snapshots) get a fresh
+    store that replays from disk and is dropped with the caller.
+    """
+    global _CHECKPOINT_STORE
+    root = Path(state_dir) / "checkpoints"
+    if Path(state_dir).resolve() != STATE_DIR.resolve():
+        return CheckpointStore(root)
+    if _CHECKPOINT_STORE is None or _CHECKPOINT_STORE.root.resolve() != root.resolve():
+        _CHECKPOINT_STORE = CheckpointStore(root)
+    return _CHECKPOINT_STORE
+
+
+CHECKPOINT_BACKGROUND = True
+CHECKPOINT_QUEUE_SIZE = 2
+
+
+class CheckpointWriter:
+    """
+    Daemon thread that runs checkpoint writes off the generation loop. Jobs are keyed by state dir
+    and must only touch data captured at submit time. A job submitted while an earlier one for the
+    same key is still queued replaces it (back-to-back saves coalesce, only the newest is written);
+    at most `maxsize` keys wait at once and submit() blocks beyond that.
+
+    last_ms is the duration of the latest completed write, wait_ms the total time submit() blocked.
+    """
+
+    def __init__(self, maxsize: int = CHECKPOINT_QUEUE_SIZE):
+        self.maxsize = max(1, maxsize)
+        self._pending: "collections.OrderedDict[str, Callable[[], Any]]" = collections.OrderedDict()
+        self._cond = threading.Condition()
+        self._busy = False
+        self._closed = False
+        self.written = 0
+        self.coalesced = 0
+        self.last_ms: Optional[float] = None
+        self.wait_ms = 0.0
+        self.last_error: Optional[str] = None
+        self._thread = threading.Thread(target=self._run, name="checkpoint-writer", daemon=True)
+        self._thread.start()
+
+    def submit(self, key: str, job: Callable[[], Any]) -> None:
+        t0 = time.perf_counter()
+        with self._cond:
+            closed = self._closed
+            if not closed:
+                if key in self._pending:
+                    self._pending[key] = job
+                    self.coalesced += 1
+                else:
+                    while len(self._pending) >= self.maxsize:
+                        self._cond.wait()
+                    self._pending[key] = job
+                self._cond.notify_all()
+        if closed:
+            job()  # shutting down: write inline
+            return
+        self.wait_ms += (time.perf_counter() - t0) * 1000.0
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                while not self._pending and not self._closed:
+                    self._cond.wait()
+                if not self._pending:
+                    return
+                key, job = self._pending.popitem(last=False)
+                self._busy = True
+                self._cond.notify_all()
+            t0 = time.perf_counter()
+            try:
+                job()
+            except Exception as exc:
+                self.last_error = f"{key}: {exc!r}"
+                print(f"[CHECKPOINT] Write to {key} failed: {exc!r}", file=sys.stderr)
+            with self._cond:
+                self._busy = False
+                self.written += 1
+                self.last_ms = (time.perf_counter() - t0) * 1000.0
+                self._cond.notify_all()
+
+    def flush(self) -> None:
+        """Block until every submitted checkpoint is on disk."""
+        with self._cond:
+            while self._pending or self._busy:
+                self._cond.wait()
+
+    def close(self) -> None:
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+        self._thread.join()
+
+
+_CHECKPOINT_WRITER: Optional[CheckpointWriter] = None
+
+
+def checkpoint_writer() -> Optional[CheckpointWriter]:
+    """Shared writer thread, started on first use; None when CHECKPOINT_BACKGROUND is off."""
+    global _CHECKPOINT_WRITER
+    if not CHECKPOINT_BACKGROUND:
+        return None
+    if _CHECKPOINT_WRITER is None:
+        _CHECKPOINT_WRITER = CheckpointWriter()
+        atexit.register(_CHECKPOINT_WRITER.close)
+    return _CHECKPOINT_WRITER
+
+
+def submit_checkpoint(state_dir: Path, job: Callable[[], Any], wait: bool = False) -> None:
+    writer = checkpoint_writer()
+    if writer is None:
+        job()
+        return
+    writer.submit(str(Path(state_dir).resolve()), job)
+    if wait:
+        writer.flush()
+
+
+def flush_checkpoints() -> None:
+    if _CHECKPOINT_WRITER is not None:
+        _CHECKPOINT_WRITER.flush()
+
+
+def checkpoint_stats() -> Optional[Dict[str, Any]]:
+    """Checkpoint latency for run logs, kept apart from the generation's runtime_ms."""
+    w = _CHECKPOINT_WRITER
+    if w is None:
+        return None
+    return {"last_ms": w.last_ms, "wait_ms": round(w.wait_ms, 3), "written": w.written, "coalesced": w.coalesced}
+
+
+def save_state(gs: GlobalState, wait: bool = False) -> None:
+    """Snapshot `gs`, the operator library and the active archive now; write them on the checkpoint thread."""
     gs.updated_ms = now_ms()
-    write_json(STATE_DIR / "state.json", asdict(gs))
-    save_operators_lib(STATE_DIR / "operators_lib.json")
+    kind = "learner" if gs.mode == "learner" else "solver"
+    archive = MAP_ELITES_LEARNER if kind == "learner" else MAP_ELITES
+    state_dir = STATE_DIR
+    # Universe.snapshot() builds fresh containers (history entries are never mutated once logged), so
+    # a shallow copy is enough to hand the state to the checkpoint thread; asdict would deep-copy it.
+    state = {f.name: getattr(gs, f.name) for f in fields(gs)}
+    state["universes"] = [dict(u) for u in gs.universes]
+    operators_lib, grids = copy.deepcopy(dict(OPERATORS_LIB)), {kind: archive.snapshot()}
+    rule: Optional[Dict[str, Any]] = None
     if gs.universes:
         meta_snapshot = gs.universes[0].get("meta", {})
         if isinstance(meta_snapshot, dict) and "update_rule" in meta_snapshot:
             try:
-                save_update_rule(STATE_DIR / "update_rule.json", UpdateRuleGenome.from_dict(meta_snapshot["update_rule"]))
+                rule = asdict(UpdateRuleGenome.from_dict(meta_snapshot["update_rule"]))
             except Exception:
-                pass
-    if gs.mode == "learner":
-        save_map_elites(STATE_DIR / map_elites_filename("learner"), MAP_ELITES_LEARNER)
-    else:
-        save_map_elites(STATE_DIR / map_elites_filename("solver"), MAP_ELITES)
+                rule = None
+
+    def job() -> None:
+        checkpoint_store(state_dir).commit(state, operators_lib, grids)
+        if rule is not None:
+            path = state_dir / "update_rule.json"
+            text = json.dumps(rule, ensure_ascii=False, indent=2, default=str)
+            if not path.exists() or path.read_text(encoding="utf-8") != text:
+                write_text_atomic(path, text)
+
+    submit_checkpoint(state_dir, job, wait=wait)
 
 def load_state() -> Optional[GlobalState]:
+    flush_checkpoints()
+    store = checkpoint_store(STATE_DIR)
+    if store.exists():
+        try:
+            doc = store.latest()
+            if not doc or not doc["state"]:
+                return None
+            data = doc["state"]
+            mode = data.get("mode", "solver")
+            if doc["operators_lib"]:
+                OPERATORS_LIB.update(doc["operators_lib"])
+            kind = "learner" if mode == "learner" else "solver"
+            archive = MAP_ELITES_LEARNER if kind == "learner" else MAP_ELITES
+            if kind in doc["map_elites"]:
+                archive.grid = archive.from_snapshot(doc["map_elites"][kind]).grid
+            data["mode"] = mode
+            return GlobalState(**data)
+        except Exception as exc:
+            print(f"[CHECKPOINT] Could not restore {store.root}: {exc!r}", file=sys.stderr)
+            return None
+    # Legacy layout: full state.json plus side files.
     p = STATE_DIR / "state.json"
     if not p.exists():
         return None
@@ -4186,7 +5653,6 @@ def load_state() -> Optional[GlobalState]:
     except Exception:
         return None
 
-
 def run_multiverse(
     seed: int,
     task: TaskSpec,
@@ -4197,6 +5663,9 @@ def run_multiverse(
     save_every: int = 5,
     mode: str = "solver",
     freeze_eval: bool = True,
+    genome_repr: str = "str",
+    selection_mode: str = "score",
+    lexicase_rate: float = 0.25,
 ) -> GlobalState:
     safe_mkdir(STATE_DIR)
     logger = RunLogger(STATE_DIR / "run_log.jsonl", append=resume)
@@ -4238,11 +5707,15 @@ def run_multiverse(
                     pool=[seed_genome(random.Random(seed + i), hint) for _ in range(pop)],
                     library=FunctionLibrary(),
                     eval_mode=eval_mode,
+                    genome_repr=genome_repr,
+                    selection_mode=selection_mode,
+                    lexicase_rate=lexicase_rate,
                 )
                 for i in range(n_univ)
             ]
         start = 0
 
+    rolling = FewShotWindow(logger.window, rolling=True)
     for gen in range(start, start + gens):
         start_ms = now_ms()
         batch = get_task_batch(task, seed, freeze_eval=freeze_eval)
@@ -4293,13 +5766,20 @@ def run_multiverse(
             library_size=len(OPERATORS_LIB),
             control_packet=control_packet,
             task_descriptor=task.descriptor.snapshot() if task.descriptor else None,
+            checkpoint=checkpoint_stats(),
         )
         print(
             f"[Gen {gen + 1:4d}] Score: {best.best_score:.4f} | Hold: {best.best_hold:.4f} | Stress: {best.best_stress:.4f} | Test: {best.best_test:.4f} | "
             f"{(best.best.code if best.best else 'none')}"
         )
+        rolling.add(gen, gen, best.best_hold, getattr(best, "best_test", float("inf")))
 
         if save_every > 0 and (gen + 1) % save_every == 0:
+            m = rolling.metrics()
+            print(
+                f"[METRICS] last {len(rolling.items())} gens: AUC {m['auc']:.4f} | regret {m['regret']:.4f} | "
+                f"gap {m['generalization_gap']:.4f} | recovery {m['recovery_time']} | delta {m['few_shot_delta']:.4f}"
+            )
             gs = GlobalState(
                 "RSI_EXTENDED_v2",
                 now_ms(),
@@ -4324,7 +5804,8 @@ def run_multiverse(
         start + gens,
         mode=mode,
     )
-    save_state(gs)
+    logger.flush()
+    save_state(gs, wait=True)
     return gs
 
 
@@ -4416,108 +5897,199 @@ def run_policy_episode(
 def compute_transfer_metrics(history: List[Dict[str, Any]], window: int) -> Dict[str, float]:
     if not history:
         return {"auc": float("inf"), "regret": float("inf"), "gap": float("inf"), "recovery_time": float("inf")}
-    holds = [h.get("hold", float("inf")) for h in history[:window]]
-    tests = [h.get("test", float("inf")) for h in history[:window]]
-    auc = sum(holds) / max(1, len(holds))
-    best = min(holds)
-    regret = sum(h - best for h in holds) / max(1, len(holds))
-    gap = (tests[-1] - holds[-1]) if holds and tests else float("inf")
-    threshold = best * 1.1 if math.isfinite(best) else float("inf")
-    recovery_time = float("inf")
-    for i, h in enumerate(holds):
-        if h <= threshold:
-            recovery_time = i + 1
-            break
-    return {"auc": auc, "regret": regret, "gap": gap, "recovery_time": recovery_time}
+    metrics = _few_shot_metrics(
+        [h.get("hold", float("inf")) for h in history[:window]], [h.get("test", float("inf")) for h in history[:window]]
+    )
+    return {"auc": metrics["auc"], "regret": metrics["regret"], "gap": metrics["generalization_gap"], "recovery_time": metrics["recovery_time"]}
 
 
-def run_meta_meta(
-    seed: int,
-    episodes: int,
-    gens_per_episode: int,
-    pop: int,
-    n_univ: int,
-    policy_pop: int,
-    freeze_eval: bool,
-    state_dir: Path,
-    eval_every: int,
-    few_shot_gens: int,
-) -> None:
-    rng = random.Random(seed)
-    meta_train, meta_test = split_meta_tasks(seed)
-    n_inputs = len(TaskSpec().ensure_descriptor().vector()) + 4
-    policies = [MetaPolicy.seed(rng, n_outputs=5, n_inputs=n_inputs) for _ in range(policy_pop)]
-    policy_scores = {p.pid: float("inf") for p in policies}
-    archive = LibraryArchive(k=2)
-    logger = RunLogger(state_dir / "run_log.jsonl")
+class _EpisodeLog:
+    """Stands in for RunLogger inside policy workers; records are replayed into the real logger on merge."""
 
-    for episode in range(episodes):
-        task = rng.choice(meta_train)
-        policy = policies[episode % len(policies)]
-        history, best = run_policy_episode(
-            seed + episode * 31,
-            task,
-            policy,
-            gens_per_episode,
-            pop,
-            n_univ,
-            freeze_eval,
-            archive,
-            logger,
-            mode="meta-train",
-            update_archive=True,
-        )
-        metrics = compute_transfer_metrics(history, window=min(few_shot_gens, len(history)))
-        reward = metrics["auc"]
-        policy_scores[policy.pid] = min(policy_scores[policy.pid], reward)
+    def __init__(self):
+        self.records: List[Dict[str, Any]] = []
+        self.seen_hashes: Set[str] = set()
 
-        if (episode + 1) % eval_every == 0:
-            transfer_scores = []
-            for task_test in meta_test:
-                warmup_task = rng.choice(meta_train) if meta_train else task_test
-                warmup_gens = max(1, few_shot_gens // 2)
-                run_policy_episode(
-                    seed + episode * 73,
-                    warmup_task,
-                    policy,
-                    warmup_gens,
-                    pop,
-                    n_univ,
-                    freeze_eval,
-                    archive,
-                    logger,
-                    mode="meta-transfer-train",
-                    update_archive=True,
-                )
-                hist, _ = run_policy_episode(
-                    seed + episode * 73 + 1,
-                    task_test,
-                    policy,
-                    few_shot_gens,
-                    pop,
-                    n_univ,
-                    freeze_eval,
-                    archive,
-                    logger,
-                    mode="meta-transfer-test",
-                    update_archive=False,
+    def log(self, **record: Any) -> None:
+        self.records.append(record)
+
+
+def _learned_globals() -> Dict[str, Any]:
+    return {
+        "grammar": dict(GRAMMAR_PROBS),
+        "surrogate": list(SURROGATE.memory),
+        "operators": copy.deepcopy(OPERATORS_LIB),
+        "map_elites": dict(MAP_ELITES.grid),
+        "map_elites_learner": dict(MAP_ELITES_LEARNER.grid),
+    }
+
+
+def _restore_learned_globals(snapshot: Dict[str, Any]) -> None:
+    GRAMMAR_PROBS.clear()
+    GRAMMAR_PROBS.update(snapshot["grammar"])
+    SURROGATE.memory = list(snapshot["surrogate"])
+    OPERATORS_LIB.clear()
+    OPERATORS_LIB.update(copy.deepcopy(snapshot["operators"]))
+    MAP_ELITES.grid = dict(snapshot["map_elites"])
+    MAP_ELITES_LEARNER.grid = dict(snapshot["map_elites_learner"])
+
+
+def _policy_episodes_job(spec: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Run a chain of policy episodes (in a policy worker or inline) against a private LibraryArchive
+    view. Process-global learned state starts from the dispatch snapshot, so the outcome does not
+    depend on which worker ran the job or what it ran before.
+    """
+    _restore_learned_globals(spec["globals"])
+    view = LibraryArchive(k=spec["k"])
+    view.records = list(spec["records"])
+    log = _EpisodeLog()
+    histories = []
+    for seed, task, policy, gens, mode, update_archive in spec["episodes"]:
+        history, _ = run_policy_episode(
+            seed, task, policy, gens, spec["pop"], spec["n_univ"], spec["freeze_eval"], view, log, mode, update_archive
+        )
+        histories.append(history)
+    return {
+        "histories": histories,
+        "records": view.records[len(spec["records"]) :],
+        "log": log.records,
+        "globals": _learned_globals(),
+    }
+
+
+def _run_policy_jobs(
+    executor: Optional[concurrent.futures.ProcessPoolExecutor],
+    specs: List[Dict[str, Any]],
+    archive: LibraryArchive,
+    logger: Optional[RunLogger],
+) -> List[List[List[Dict[str, Any]]]]:
+    """
+    Dispatch episode chains and merge them in submission order: new archive records are appended,
+    logs replayed (novelty recomputed against the real logger), MAP-Elites cells merged and the
+    remaining learned globals of the last job adopted. Returns each job's episode histories.
+    """
+    snapshot = _learned_globals()
+    for spec in specs:
+        spec["globals"] = snapshot
+    if executor is None:
+        outs = [_policy_episodes_job(spec) for spec in specs]
+    else:
+        futures = {executor.submit(_policy_episodes_job, spec): i for i, spec in enumerate(specs)}
+        outs = [None] * len(specs)
+        for fut in concurrent.futures.as_completed(futures):
+            outs[futures[fut]] = fut.result()
+    for out in outs:
+        archive.records.extend(out["records"])
+        if logger:
+            for record in out["log"]:
+                record["novelty"] = 1.0 if record["code_hash"] not in logger.seen_hashes else 0.0
+                logger.seen_hashes.add(record["code_hash"])
+                logger.log(**record)
+    if outs:
+        _restore_learned_globals(outs[-1]["globals"])
+        for out in outs[:-1]:
+            for grid_name, archive_ in (("map_elites", MAP_ELITES), ("map_elites_learner", MAP_ELITES_LEARNER)):
+                for cell, (score, genome) in out["globals"][grid_name].items():
+                    if cell not in archive_.grid or score < archive_.grid[cell][0]:
+                        archive_.grid[cell] = (score, genome)
+    return [out["histories"] for out in outs]
+
+
+def _policy_executor(workers: int) -> Optional[concurrent.futures.ProcessPoolExecutor]:
+    workers = max(1, workers or (os.cpu_count() or 1))
+    return concurrent.futures.ProcessPoolExecutor(workers) if workers > 1 else None
+
+
+def run_meta_meta(
+    seed: int,
+    episodes: int,
+    gens_per_episode: int,
+    pop: int,
+    n_univ: int,
+    policy_pop: int,
+    freeze_eval: bool,
+    state_dir: Path,
+    eval_every: int,
+    few_shot_gens: int,
+    workers: int = 0,
+) -> None:
+    """
+    Meta-train MetaPolicies over meta_train tasks, scoring by few-shot transfer to meta_test.
+    The training episodes between evaluations, and the warmup+test chain of each meta-test task,
+    run concurrently on `workers` processes (0 = CPU count); each starts from the archive as it was
+    at dispatch, and results are merged in a fixed order, so a seed reproduces at any worker count.
+    """
+    rng = random.Random(seed)
+    meta_train, meta_test = split_meta_tasks(seed)
+    n_inputs = len(TaskSpec().ensure_descriptor().vector()) + 4
+    policies = [MetaPolicy.seed(rng, n_outputs=5, n_inputs=n_inputs) for _ in range(policy_pop)]
+    policy_scores = {p.pid: float("inf") for p in policies}
+    archive = LibraryArchive(k=2)
+    logger = RunLogger(state_dir / "run_log.jsonl")
+    executor = _policy_executor(workers)
+    eval_every = max(1, eval_every)
+
+    def spec(episodes: List[Tuple[int, TaskSpec, MetaPolicy, int, str, bool]]) -> Dict[str, Any]:
+        return {
+            "records": list(archive.records),
+            "k": archive.k,
+            "pop": pop,
+            "n_univ": n_univ,
+            "freeze_eval": freeze_eval,
+            "episodes": episodes,
+        }
+
+    try:
+        for block_start in range(0, episodes, eval_every):
+            block = list(range(block_start, min(episodes, block_start + eval_every)))
+            block_policies = [policies[episode % len(policies)] for episode in block]
+            train_specs = [
+                spec([(seed + episode * 31, rng.choice(meta_train), policy, gens_per_episode, "meta-train", True)])
+                for episode, policy in zip(block, block_policies)
+            ]
+            for policy, (history,) in zip(block_policies, _run_policy_jobs(executor, train_specs, archive, logger)):
+                metrics = compute_transfer_metrics(history, window=min(few_shot_gens, len(history)))
+                policy_scores[policy.pid] = min(policy_scores.get(policy.pid, float("inf")), metrics["auc"])
+
+            episode = block[-1]
+            if (episode + 1) % eval_every != 0:
+                continue
+            policy = block_policies[-1]
+            warmup_gens = max(1, few_shot_gens // 2)
+            eval_specs = []
+            for task_test in meta_test:
+                warmup_task = rng.choice(meta_train) if meta_train else task_test
+                eval_specs.append(
+                    spec(
+                        [
+                            (seed + episode * 73, warmup_task, policy, warmup_gens, "meta-transfer-train", True),
+                            (seed + episode * 73 + 1, task_test, policy, few_shot_gens, "meta-transfer-test", False),
+                        ]
+                    )
                 )
-                transfer_scores.append(compute_transfer_metrics(hist, window=few_shot_gens)["auc"])
+            transfer_scores = [
+                compute_transfer_metrics(hist, window=few_shot_gens)["auc"]
+                for _, hist in _run_policy_jobs(executor, eval_specs, archive, logger)
+            ]
             if transfer_scores:
                 policy_scores[policy.pid] = sum(transfer_scores) / len(transfer_scores)
             policies.sort(key=lambda p: policy_scores.get(p.pid, float("inf")))
             best_policy = policies[0]
             policies = [best_policy] + [best_policy.mutate(rng, scale=0.05) for _ in range(policy_pop - 1)]
+    finally:
+        logger.flush()
+        if executor is not None:
+            executor.shutdown(wait=True, cancel_futures=True)
 
 
-def evaluate_update_rule(
+def _update_rule_universe(
     seed: int,
     task: TaskSpec,
     rule: UpdateRuleGenome,
-    gens: int,
     pop: int,
     freeze_eval: bool,
-) -> Tuple[float, List[Dict[str, Any]]]:
+) -> Tuple[Universe, Batch]:
     rng = random.Random(seed)
     batch = get_task_batch(task, seed, freeze_eval=freeze_eval)
     hint = TaskDetective.detect_pattern(batch)
@@ -4528,11 +6100,111 @@ def evaluate_update_rule(
         pool=[seed_genome(rng, hint) for _ in range(pop)],
         library=FunctionLibrary(),
     )
+    return universe, batch
+
+
+def evaluate_update_rule(
+    seed: int,
+    task: TaskSpec,
+    rule: UpdateRuleGenome,
+    gens: int,
+    pop: int,
+    freeze_eval: bool,
+) -> Tuple[float, List[Dict[str, Any]]]:
+    universe, batch = _update_rule_universe(seed, task, rule, pop, freeze_eval)
     for gen in range(gens):
         universe.step(gen, task, pop, batch)
     return universe.best_score, universe.history
 
 
+def _update_rule_worker(
+    conn: Any,
+    seed: int,
+    task: TaskSpec,
+    rule: UpdateRuleGenome,
+    pop: int,
+    freeze_eval: bool,
+) -> None:
+    # One process per rule: it owns the Universe (not picklable) and its own copy of the globals.
+    # Each message is a generation count to step further; None ends the worker.
+    universe, batch = _update_rule_universe(seed, task, rule, pop, freeze_eval)
+    gen = 0
+    try:
+        while True:
+            n = conn.recv()
+            if n is None:
+                break
+            for _ in range(n):
+                universe.step(gen, task, pop, batch)
+                gen += 1
+            conn.send((universe.best_score, universe.history))
+    except (EOFError, KeyboardInterrupt):
+        pass
+    finally:
+        conn.close()
+
+
+def race_update_rules(
+    seeds: List[int],
+    task: TaskSpec,
+    rules: List[UpdateRuleGenome],
+    gens: int,
+    pop: int,
+    freeze_eval: bool,
+    workers: int = 0,
+    race: bool = False,
+    keep: float = 0.5,
+) -> List[Tuple[float, List[Dict[str, Any]], int]]:
+    """
+    Evaluate update rules in worker processes, one per rule, at most `workers` stepping at once
+    (0 = CPU count). Globals (surrogate, grammar, MAP-Elites) are isolated per process, so rules
+    no longer see each other's side effects. With `race`, every rule runs gens // 2 generations
+    first and only the best `keep` fraction runs the rest. Returns (score, history, gens run) per rule.
+    """
+    workers = max(1, workers or (os.cpu_count() or 1))
+    ctx = mp.get_context("fork" if "fork" in mp.get_all_start_methods() else "spawn")
+    conns, procs = [], []
+    for seed, rule in zip(seeds, rules):
+        parent_conn, child_conn = ctx.Pipe()
+        proc = ctx.Process(target=_update_rule_worker, args=(child_conn, seed, task, rule, pop, freeze_eval), daemon=True)
+        proc.start()
+        child_conn.close()
+        conns.append(parent_conn)
+        procs.append(proc)
+    half = gens // 2 if race and gens >= 2 else 0
+    phases = [half, gens - half] if half else [gens]
+    results: List[Tuple[float, List[Dict[str, Any]], int]] = [(float("inf"), [], 0)] * len(rules)
+    active = list(range(len(rules)))
+    try:
+        for phase, n in enumerate(phases):
+            if phase > 0:
+                active.sort(key=lambda i: results[i][0])
+                active = sorted(active[: max(1, int(math.ceil(len(active) * keep)))])
+            waiting = list(active)
+            running: Dict[Any, int] = {}
+            while waiting or running:
+                while waiting and len(running) < workers:
+                    i = waiting.pop(0)
+                    conns[i].send(n)
+                    running[conns[i]] = i
+                for conn in mp.connection.wait(list(running)):
+                    i = running.pop(conn)
+                    score, history = conn.recv()
+                    results[i] = (score, history, results[i][2] + n)
+    finally:
+        for conn in conns:
+            try:
+                conn.send(None)
+            except (BrokenPipeError, OSError):
+                pass
+            conn.close()
+        for proc in procs:
+            proc.join(timeout=5)
+            if proc.is_alive():
+                proc.terminate()
+    return results
+
+
 def run_update_rule_search(
     seed: int,
     rounds: int,
@@ -4540,6 +6212,8 @@ def run_update_rule_search(
     pop: int,
     freeze_eval: bool,
     state_dir: Path,
+    workers: int = 0,
+    race: bool = False,
 ) -> UpdateRuleGenome:
     rng = random.Random(seed)
     task = TaskSpec(name="self_audit", n_train=64, n_hold=48, n_test=48, noise=0.0)
@@ -4548,14 +6222,17 @@ def run_update_rule_search(
     best_rule = current
     best_score = float("inf")
     for r in range(rounds):
+        seeds = [seed + r * 101 + idx for idx in range(len(rules))]
+        results = race_update_rules(seeds, task, rules, gens_per_round, pop, freeze_eval, workers=workers, race=race)
         scored: List[Tuple[float, UpdateRuleGenome]] = []
-        for idx, rule in enumerate(rules):
-            score, history = evaluate_update_rule(seed + r * 101 + idx, task, rule, gens_per_round, pop, freeze_eval)
-            scored.append((score, rule))
-            if history:
-                last = history[-1]
-                if last.get("code"):
-                    SURROGATE.train(history)
+        for rule, (score, history, gens_run) in zip(rules, results):
+            if gens_run == gens_per_round:
+                scored.append((score, rule))
+            # The parent's surrogate still learns from every evaluation, in rule order.
+            if history and history[-1].get("code"):
+                SURROGATE.train(history)
+        if race and len(scored) < len(rules):
+            print(f"[UPDATE-RULE] round {r + 1}: {len(rules) - len(scored)}/{len(rules)} rules eliminated at gen {gens_per_round // 2}")
         scored.sort(key=lambda item: item[0])
         score, best = scored[0]
         if score < best_score:
@@ -4576,7 +6253,9 @@ def run_task_switch(
     n_univ: int,
     freeze_eval: bool,
     state_dir: Path,
+    workers: int = 0,
 ) -> Dict[str, Any]:
+    """Train on A then transfer to B, against a no-archive baseline on B; the two arms run concurrently."""
     rng = random.Random(seed)
     n_inputs = len(TaskSpec().ensure_descriptor().vector()) + 4
     transfer_policy = MetaPolicy.seed(rng, n_outputs=5, n_inputs=n_inputs)
@@ -4584,45 +6263,27 @@ def run_task_switch(
     logger = RunLogger(state_dir / "run_log.jsonl")
     baseline = MetaPolicy.seed(random.Random(seed + 999), n_outputs=5, n_inputs=n_inputs)
 
-    history_a, _ = run_policy_episode(
-        seed,
-        task_a,
-        transfer_policy,
-        gens_a,
-        pop,
-        n_univ,
-        freeze_eval,
-        archive,
-        logger,
-        mode="switch-train",
-        update_archive=True,
-    )
-    history_transfer, _ = run_policy_episode(
-        seed + 1,
-        task_b,
-        transfer_policy,
-        gens_b,
-        pop,
-        n_univ,
-        freeze_eval,
-        archive,
-        logger,
-        mode="switch-transfer",
-        update_archive=False,
-    )
-    history_baseline, _ = run_policy_episode(
-        seed + 2,
-        task_b,
-        baseline,
-        gens_b,
-        pop,
-        n_univ,
-        freeze_eval,
-        LibraryArchive(k=0),
-        logger,
-        mode="switch-baseline",
-        update_archive=False,
-    )
+    common = {"pop": pop, "n_univ": n_univ, "freeze_eval": freeze_eval}
+    specs = [
+        {
+            **common,
+            "records": [],
+            "k": archive.k,
+            "episodes": [
+                (seed, task_a, transfer_policy, gens_a, "switch-train", True),
+                (seed + 1, task_b, transfer_policy, gens_b, "switch-transfer", False),
+            ],
+        },
+        {**common, "records": [], "k": 0, "episodes": [(seed + 2, task_b, baseline, gens_b, "switch-baseline", False)]},
+    ]
+    executor = _policy_executor(min(2, workers or (os.cpu_count() or 1)))
+    try:
+        # Only the transfer arm's archive records are merged; the baseline arm never adds any.
+        (_, history_transfer), (history_baseline,) = _run_policy_jobs(executor, specs, archive, logger)
+    finally:
+        logger.flush()
+        if executor is not None:
+            executor.shutdown(wait=True, cancel_futures=True)
     metrics_transfer = compute_transfer_metrics(history_transfer, window=gens_b)
     metrics_baseline = compute_transfer_metrics(history_baseline, window=gens_b)
     delta_auc = metrics_baseline["auc"] - metrics_transfer["auc"]
@@ -4635,43 +6296,434 @@ def run_task_switch(
     }
 
 
-def generate_report(path: Path, few_shot_gens: int) -> Dict[str, Any]:
+def _few_shot_metrics(holds: List[float], tests: List[float]) -> Dict[str, float]:
+    auc = sum(holds) / max(1, len(holds))
+    best = min(holds) if holds else float("inf")
+    regret = sum(h - best for h in holds) / max(1, len(holds))
+    gap = (tests[-1] - holds[-1]) if holds and tests else float("inf")
+    threshold = best * 1.1 if math.isfinite(best) else float("inf")
+    recovery_time = float("inf")
+    for i, h in enumerate(holds):
+        if h <= threshold:
+            recovery_time = i + 1
+            break
+    few_shot_delta = (holds[0] - holds[-1]) if len(holds) > 1 else 0.0
+    return {
+        "auc": auc,
+        "regret": regret,
+        "generalization_gap": gap,
+        "recovery_time": recovery_time,
+        "few_shot_delta": few_shot_delta,
+    }
+
+
+class FewShotWindow:
+    """
+    Streaming few-shot metrics of one task/mode section. add() takes observations one at a time;
+    only the first `window` by (gen, seq) are kept (a bounded max-heap), or with rolling=True the
+    last `window` added, so memory stays O(window) however long the run. metrics() equals the
+    batch computation over the same observations sorted by gen, ties in seq (file) order.
+    """
+
+    def __init__(self, window: int, rolling: bool = False):
+        self.window = max(0, window)
+        self.rolling = rolling
+        self._heap: List[Tuple[int, int, float, float]] = []
+        self._recent: collections.deque[Tuple[int, int, float, float]] = collections.deque(maxlen=self.window)
+
+    def add(self, gen: int, seq: int, hold: float, test: float) -> None:
+        if self.rolling:
+            self._recent.append((gen, seq, hold, test))
+            return
+        if self.window <= 0:
+            return
+        item = (-gen, -seq, hold, test)
+        if len(self._heap) < self.window:
+            heapq.heappush(self._heap, item)
+        elif item[:2] > self._heap[0][:2]:
+            heapq.heapreplace(self._heap, item)
+
+    def full_after(self, gen: int) -> bool:
+        """True if no observation with a gen above `gen` can enter the window any more."""
+        if self.rolling:
+            return False
+        return len(self._heap) >= self.window and (self.window == 0 or -self._heap[0][0] < gen)
+
+    def items(self) -> List[Tuple[int, int, float, float]]:
+        if self.rolling:
+            return sorted(self._recent, key=lambda t: t[:2])
+        return sorted(((-g, -s, h, t) for g, s, h, t in self._heap), key=lambda t: t[:2])
+
+    def metrics(self) -> Dict[str, float]:
+        items = self.items()
+        return _few_shot_metrics([t[2] for t in items], [t[3] for t in items])
+
+
+class ReportAggregator:
+    """
+    Incremental generate_report: a FewShotWindow per task/mode section fed one run-log record at a
+    time (seq = byte offset, so ties keep file order), plus a high-water mark of the log prefix
+    already consumed. save()/load() persist both; update() then reads only what was appended, and
+    starts over when the log was restarted or few_shot_gens changed. A fresh aggregator reads an
+    indexed log through jsonl_chunks, skipping chunks that cannot reach any section's window.
+    """
+
+    def __init__(self, few_shot_gens: int):
+        self.few_shot_gens = few_shot_gens
+        self.sections: Dict[str, FewShotWindow] = {}
+        self.source: Dict[str, Any] = {"offset": 0}
+
+    def add(self, record: Dict[str, Any], seq: int) -> None:
+        key = f"{record['task_id']}::{record.get('mode', 'unknown')}"
+        if key not in self.sections:
+            self.sections[key] = FewShotWindow(self.few_shot_gens)
+        self.sections[key].add(record["gen"], seq, record["score_hold"], record["score_test"])
+
+    def update(self, path: Path) -> int:
+        """Consume records appended to `path` since the last update; returns how many were read."""
+        flush_jsonl_sinks(path)
+        if not path.exists():
+            return 0
+        offset = self.source["offset"]
+        if offset and (path.stat().st_size < offset or _source_state(path, offset) != self.source):
+            self.__init__(self.few_shot_gens)
+            offset = 0
+        chunks = jsonl_chunks(path) if offset == 0 else None
+        n = 0
+        with path.open("rb") as f:
+            if chunks is not None:
+                n, offset = self._update_indexed(f, chunks)
+            else:
+                f.seek(offset)
+                for line in f:
+                    if not line.endswith(b"\n"):
+                        break  # partial last line: read on the next update
+                    if line.strip() and (rec := _json_or_none(line)) is not None:
+                        self.add(rec, offset)
+                        n += 1
+                    offset += len(line)
+        self.source = _source_state(path, offset)
+        return n
+
+    def _update_indexed(self, f: Any, chunks: List[Dict[str, Any]]) -> Tuple[int, int]:
+        n = 0
+        by_key: Dict[str, List[Dict[str, Any]]] = {}
+        for chunk in chunks:
+            if chunk["key"] is None:
+                for off, rec in read_jsonl_chunk(f, chunk):
+                    self.add(rec, off)
+                    n += 1
+            else:
+                by_key.setdefault(chunk["key"], []).append(chunk)
+        for key, key_chunks in by_key.items():
+            window = self.sections.setdefault(key, FewShotWindow(self.few_shot_gens))
+            for chunk in sorted(key_chunks, key=lambda c: c["lo"]):
+                if window.full_after(chunk["lo"]):
+                    break
+                for off, rec in read_jsonl_chunk(f, chunk):
+                    self.add(rec, off)
+                    n += 1
+        # Consumed up to the last complete line.
+        end = chunks[-1]["off"] + chunks[-1]["len"]
+        f.seek(max(0, end - 1))
+        if end and f.read(1) != b"\n":
+            f.seek(chunks[-1]["off"])
+            tail = f.read(chunks[-1]["len"])
+            end = chunks[-1]["off"] + tail.rfind(b"\n") + 1
+        return n, end
+
+    def report(self) -> Dict[str, Any]:
+        return {"tasks": {key: w.metrics() for key, w in self.sections.items()}, "few_shot_gens": self.few_shot_gens}
+
+    def save(self, path: Path) -> None:
+        state = {
+            "few_shot_gens": self.few_shot_gens,
+            "source": self.source,
+            "sections": {key: w.items() for key, w in self.sections.items()},
+        }
+        write_text_atomic(path, json.dumps(state))
+
+    @classmethod
+    def load(cls, path: Path, few_shot_gens: int) -> "ReportAggregator":
+        agg = cls(few_shot_gens)
+        try:
+            state = read_json(path)
+        except (OSError, ValueError):
+            return agg
+        if state.get("few_shot_gens") != few_shot_gens:
+            return agg
+        agg.source = state["source"]
+        for key, items in state["sections"].items():
+            window = agg.sections[key] = FewShotWindow(few_shot_gens)
+            for gen, seq, hold, test in items:
+                window.add(gen, seq, hold, test)
+        return agg
+
+
+def generate_report(path: Path, few_shot_gens: int, state_path: Optional[Path] = None) -> Dict[str, Any]:
+    """Few-shot report per task/mode; with `state_path`, resumes from and saves a ReportAggregator."""
+    flush_jsonl_sinks(path)
     if not path.exists():
         return {"error": "run_log.jsonl not found"}
-    records = []
-    with path.open("r", encoding="utf-8") as f:
+    agg = ReportAggregator.load(state_path, few_shot_gens) if state_path else ReportAggregator(few_shot_gens)
+    agg.update(path)
+    if state_path:
+        agg.save(state_path)
+    return agg.report()
+
+
+# ---------------------------
+# Columnar run log
+# ---------------------------
+
+COLUMNAR_CHUNK_ROWS = 4096
+# Dictionaries are read whole into memory, so a column that would pass this many distinct values
+# (timings, per-row stats) is stored plain from then on instead of growing its dictionary.
+COLUMNAR_DICT_LIMIT = 256
+_ABSENT = object()
+
+
+def columnar_path(jsonl_path: Path) -> Path:
+    return jsonl_path.with_name(jsonl_path.stem + ".cols")
+
+
+def _column_typecode(values: List[Any]) -> str:
+    if all(type(v) is bool for v in values):
+        return "b"
+    if all(type(v) is int and -(1 << 63) <= v < (1 << 63) for v in values):
+        return "q"
+    if all(type(v) is float for v in values):
+        return "d"
+    return "i"
+
+
+class ColumnarRunLog:
+    """
+    Columnar copy of a run log under `root`. Rows are stored in chunks of up to `chunk_rows`; each
+    column of a chunk is one flat file (chunk_<n>/<column>.bin) holding a typed array: 'b' bools,
+    'q' ints, 'd' floats, or 'i' codes into the column's append-only dictionary (dict/<column>.jsonl,
+    one JSON value per line; -1 = key absent) for anything else, so repeated descriptors, control
+    packets and strings are stored once. A column whose dictionary would pass `dict_limit` entries
+    switches for good to 'j': chunk_<n>/<column>.jsonl, one JSON value per row (blank = key absent).
+    Reads memory-map only the columns asked for.
+
+    meta.json lists the chunks and the converted prefix of the source JSONL; it is replaced
+    atomically after each chunk, so a crash loses at most the chunk being written.
+    """
+
+    def __init__(self, root: Path, chunk_rows: int = COLUMNAR_CHUNK_ROWS, dict_limit: int = COLUMNAR_DICT_LIMIT):
+        self.root = root
+        self.chunk_rows = max(1, chunk_rows)
+        self.dict_limit = dict_limit
+        self.meta_path = root / "meta.json"
+        self.meta: Dict[str, Any] = (
+            read_json(self.meta_path)
+            if self.meta_path.exists()
+            else {"byteorder": sys.byteorder, "chunks": [], "source": {"offset": 0, "head": "", "last": ""}}
+        )
+        self._dicts: Dict[str, List[str]] = {}
+        self._codes: Dict[str, Dict[str, int]] = {}
+        self._decoded: Dict[str, Dict[int, Any]] = {}
+
+    @property
+    def rows(self) -> int:
+        return sum(c["rows"] for c in self.meta["chunks"])
+
+    def _dict(self, column: str) -> List[str]:
+        if column not in self._dicts:
+            p = self.root / "dict" / f"{column}.jsonl"
+            self._dicts[column] = p.read_text(encoding="utf-8").split("\n")[:-1] if p.exists() else []
+        return self._dicts[column]
+
+    def _column_codes(self, column: str) -> Dict[str, int]:
+        if column not in self._codes:
+            self._codes[column] = {v: i for i, v in enumerate(self._dict(column))}
+        return self._codes[column]
+
+    def _store_plain(self, column: str, texts: List[Optional[str]]) -> bool:
+        """Whether this chunk of `column` goes plain; decided before its values reach the dictionary."""
+        plain = self.meta.setdefault("plain", [])
+        if column in plain:
+            return True
+        codes = self._column_codes(column)
+        if len(codes) + len({t for t in texts if t is not None and t not in codes}) > self.dict_limit:
+            plain.append(column)
+            return True
+        return False
+
+    def _encode(self, column: str, text: Optional[str], new: List[str]) -> int:
+        if text is None:
+            return -1
+        values = self._dict(column)
+        codes = self._column_codes(column)
+        if text not in codes:
+            codes[text] = len(values)
+            values.append(text)
+            new.append(text)
+        return codes[text]
+
+    def append(self, records: List[Dict[str, Any]], source: Optional[Dict[str, Any]] = None) -> None:
+        """Store `records` as new chunks; `source` (converter bookkeeping) is saved with the last one."""
+        for start in range(0, len(records), self.chunk_rows):
+            last = start + self.chunk_rows >= len(records)
+            self._write_chunk(records[start : start + self.chunk_rows], source if last else None)
+
+    def _write_chunk(self, records: List[Dict[str, Any]], source: Optional[Dict[str, Any]]) -> None:
+        name = f"chunk_{len(self.meta['chunks']):05d}"
+        chunk_dir = self.root / name
+        safe_mkdir(chunk_dir)
+        columns: Dict[str, str] = {}
+        for column in dict.fromkeys(k for rec in records for k in rec):
+            values = [rec.get(column, _ABSENT) for rec in records]
+            typecode = _column_typecode(values)
+            new: List[str] = []
+            if typecode != "i":
+                (chunk_dir / f"{column}.bin").write_bytes(array(typecode, values).tobytes())
+            else:
+                texts = [None if v is _ABSENT else json.dumps(v, sort_keys=True) for v in values]
+                if self._store_plain(column, texts):
+                    typecode = "j"
+                    (chunk_dir / f"{column}.jsonl").write_text("".join((t or "") + "\n" for t in texts), encoding="utf-8")
+                else:
+                    (chunk_dir / f"{column}.bin").write_bytes(array("i", [self._encode(column, t, new) for t in texts]).tobytes())
+            columns[column] = typecode
+            if new:
+                self._append_dict(column, new)
+        self.meta["chunks"].append({"name": name, "rows": len(records), "columns": columns})
+        if source is not None:
+            self.meta["source"] = source
+        write_text_atomic(self.meta_path, json.dumps(self.meta))
+
+    def _append_dict(self, column: str, values: List[str]) -> None:
+        path = self.root / "dict" / f"{column}.jsonl"
+        safe_mkdir(path.parent)
+        with path.open("a+b") as f:
+            end = f.seek(0, os.SEEK_END)
+            # _dict ignores an unterminated last entry (its chunk never reached meta.json); cut it
+            # off so the new entries land on the line numbers their codes point at.
+            keep = end
+            while keep > 0:
+                f.seek(max(0, keep - 4096))
+                block = f.read(keep - max(0, keep - 4096))
+                nl = block.rfind(b"\n")
+                if nl >= 0:
+                    keep = keep - len(block) + nl + 1
+                    break
+                keep -= len(block)
+            if keep != end:
+                f.truncate(keep)
+            f.write("".join(v + "\n" for v in values).encode("utf-8"))
+
+    def _decode(self, column: str, code: int) -> Any:
+        if code < 0:
+            return _ABSENT
+        cache = self._decoded.setdefault(column, {})
+        if code not in cache:
+            cache[code] = json.loads(self._dict(column)[code])
+        return cache[code]
+
+    def _chunk_column(self, chunk: Dict[str, Any], column: str) -> Iterable[Any]:
+        typecode = chunk["columns"].get(column)
+        if typecode is None:
+            yield from [_ABSENT] * chunk["rows"]
+            return
+        if chunk["rows"] == 0:
+            return
+        if typecode == "j":
+            with (self.root / chunk["name"] / f"{column}.jsonl").open("rb") as f:
+                for line in f:
+                    yield json.loads(line) if line.strip() else _ABSENT
+            return
+        with (self.root / chunk["name"] / f"{column}.bin").open("rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            if self.meta["byteorder"] != sys.byteorder:
+                values: Any = array(typecode)
+                values.frombytes(mm)
+                values.byteswap()
+                yield from self._decode_values(column, typecode, values)
+                return
+            with memoryview(mm) as raw, raw.cast(typecode) as values:
+                yield from self._decode_values(column, typecode, values)
+
+    def _decode_values(self, column: str, typecode: str, values: Any) -> Iterable[Any]:
+        if typecode == "i":
+            for code in values:
+                yield self._decode(column, code)
+        elif typecode == "b":
+            for v in values:
+                yield bool(v)
+        else:
+            yield from values
+
+    def scan(self, columns: List[str]) -> Iterable[Tuple[Any, ...]]:
+        """Rows as tuples of `columns`, reading nothing else; absent keys come back as None."""
+        for chunk in self.meta["chunks"]:
+            for row in zip(*(self._chunk_column(chunk, c) for c in columns)):
+                yield tuple(None if v is _ABSENT else v for v in row)
+
+    def records(self) -> Iterable[Dict[str, Any]]:
+        """Full records, keys in first-seen order per chunk (absent keys omitted)."""
+        for chunk in self.meta["chunks"]:
+            names = list(chunk["columns"])
+            for row in zip(*(self._chunk_column(chunk, c) for c in names)):
+                yield {k: v for k, v in zip(names, row) if v is not _ABSENT}
+
+
+def _source_state(path: Path, offset: int) -> Dict[str, Any]:
+    """Converter bookkeeping: converted byte prefix plus hashes of its first and last 4 KiB."""
+    with path.open("rb") as f:
+        head = f.read(min(4096, offset))
+        f.seek(max(0, offset - 4096))
+        last = f.read(min(4096, offset))
+    return {"offset": offset, "head": sha256(head.decode("utf-8", "replace")), "last": sha256(last.decode("utf-8", "replace"))}
+
+
+def convert_run_log(jsonl_path: Path, root: Optional[Path] = None, chunk_rows: int = COLUMNAR_CHUNK_ROWS) -> ColumnarRunLog:
+    """
+    Bring the columnar copy of `jsonl_path` up to date, converting only lines appended since the
+    last call. A source whose converted prefix changed (restarted or rotated log) is converted
+    again from scratch. Memory is bounded by one chunk of records.
+    """
+    flush_jsonl_sinks(jsonl_path)
+    root = root or columnar_path(jsonl_path)
+    store = ColumnarRunLog(root, chunk_rows)
+    if not jsonl_path.exists():
+        return store
+    offset = store.meta["source"]["offset"]
+    if offset and (jsonl_path.stat().st_size < offset or _source_state(jsonl_path, offset) != store.meta["source"]):
+        shutil.rmtree(root)
+        store = ColumnarRunLog(root, chunk_rows)
+        offset = 0
+    batch: List[Dict[str, Any]] = []
+    with jsonl_path.open("rb") as f:
+        f.seek(offset)
         for line in f:
-            line = line.strip()
-            if line:
-                records.append(json.loads(line))
-    by_task: Dict[str, List[Dict[str, Any]]] = {}
-    for rec in records:
-        key = f"{rec['task_id']}::{rec.get('mode', 'unknown')}"
-        by_task.setdefault(key, []).append(rec)
-    report = {"tasks": {}, "few_shot_gens": few_shot_gens}
-    for key, recs in by_task.items():
-        recs.sort(key=lambda r: r["gen"])
-        holds = [r["score_hold"] for r in recs[:few_shot_gens]]
-        tests = [r["score_test"] for r in recs[:few_shot_gens]]
-        auc = sum(holds) / max(1, len(holds))
-        best = min(holds) if holds else float("inf")
-        regret = sum(h - best for h in holds) / max(1, len(holds))
-        gap = (tests[-1] - holds[-1]) if holds and tests else float("inf")
-        threshold = best * 1.1 if math.isfinite(best) else float("inf")
-        recovery_time = float("inf")
-        for i, h in enumerate(holds):
-            if h <= threshold:
-                recovery_time = i + 1
-                break
-        few_shot_delta = (holds[0] - holds[-1]) if len(holds) > 1 else 0.0
-        report["tasks"][key] = {
-            "auc": auc,
-            "regret": regret,
-            "generalization_gap": gap,
-            "recovery_time": recovery_time,
-            "few_shot_delta": few_shot_delta,
-        }
-    return report
+            if not line.endswith(b"\n"):
+                break  # partial last line: picked up next time
+            offset += len(line)
+            if line.strip() and (rec := _json_or_none(line)) is not None:
+                batch.append(rec)
+            if len(batch) >= store.chunk_rows:
+                store.append(batch, _source_state(jsonl_path, offset))
+                batch = []
+    if batch:
+        store.append(batch, _source_state(jsonl_path, offset))
+    elif offset != store.meta["source"]["offset"]:
+        store.meta["source"] = _source_state(jsonl_path, offset)
+        safe_mkdir(root)
+        write_text_atomic(store.meta_path, json.dumps(store.meta))
+    return store
+
+
+def generate_report_columnar(root: Path, few_shot_gens: int) -> Dict[str, Any]:
+    """generate_report over a ColumnarRunLog, reading only the five columns the metrics need."""
+    agg = ReportAggregator(few_shot_gens)
+    columns = ["gen", "task_id", "mode", "score_hold", "score_test"]
+    for row, values in enumerate(ColumnarRunLog(root).scan(columns)):
+        record = dict(zip(columns, values))
+        if record["mode"] is None:
+            record["mode"] = "unknown"
+        agg.add(record, row)
+    return agg.report()
 
 
 def transfer_bench(
@@ -4763,10 +6815,11 @@ def _variance_low(outputs: List[Any], eps: float = OUTPUT_VARIANCE_EPS) -> bool:
     return var <= eps
 
 def _collect_outputs(
-    code: str,
+    code: Union[str, ast.AST],
     xs: List[Any],
     mode: str,
     extra_env: Optional[Dict[str, Any]] = None,
+    run_fn: Optional[Callable[[Any], Any]] = None,
 ) -> Tuple[bool, List[Any], str]:
     outputs: List[Any] = []
     if mode == "learner":
@@ -4795,23 +6848,24 @@ def _collect_outputs(
             outputs.append(out)
         return True, outputs, ""
     for x in xs:
-        out = safe_exec(code, x, extra_env=extra_env)
+        out = run_fn(x) if run_fn is not None else safe_exec(code, x, extra_env=extra_env)
         if out is None:
             return False, [], "no_output"
         outputs.append(out)
     return True, outputs, ""
 
 def _hard_gate_ok(
-    code: str,
+    code: Union[str, ast.AST],
     batch: Batch,
     mode: str,
     task_name: str,
     extra_env: Optional[Dict[str, Any]] = None,
+    run_fn: Optional[Callable[[Any], Any]] = None,
 ) -> Tuple[bool, str]:
     xs = batch.x_ho[:8] if batch.x_ho else batch.x_tr[:8]
     if not xs:
         return False, "no_inputs"
-    ok, outputs, err = _collect_outputs(code, xs, mode, extra_env=extra_env)
+    ok, outputs, err = _collect_outputs(code, xs, mode, extra_env=extra_env, run_fn=run_fn)
     if not ok:
         return False, err
     # Hard gate: reject any non-finite numeric output (timeouts/NaNs are disqualifying).
@@ -4880,6 +6934,13 @@ def _save_rsi_archive(path: Path, archive: Dict[str, Any]) -> None:
     path.write_text(json.dumps(archive, indent=2), encoding="utf-8")
 
 def _load_state_snapshot(state_dir: Path) -> Optional[Dict[str, Any]]:
+    flush_checkpoints()
+    store = checkpoint_store(state_dir)
+    if store.exists():
+        try:
+            return (store.latest() or {}).get("state")
+        except Exception:
+            return None
     state_path = state_dir / "state.json"
     if not state_path.exists():
         return None
@@ -4888,9 +6949,9 @@ def _load_state_snapshot(state_dir: Path) -> Optional[Dict[str, Any]]:
     except Exception:
         return None
 
-def _write_state_snapshot(state_dir: Path, snapshot: Dict[str, Any]) -> None:
-    safe_mkdir(state_dir)
-    (state_dir / "state.json").write_text(json.dumps(snapshot, indent=2), encoding="utf-8")
+def _write_state_snapshot(state_dir: Path, snapshot: Dict[str, Any], wait: bool = False) -> None:
+    snapshot = copy.deepcopy(snapshot)
+    submit_checkpoint(state_dir, lambda: checkpoint_store(state_dir).commit(state=snapshot), wait=wait)
 
 def _current_best_score(snapshot: Optional[Dict[str, Any]]) -> float:
     if not snapshot:
@@ -4906,6 +6967,7 @@ def _current_best_score(snapshot: Optional[Dict[str, Any]]) -> float:
     return best
 
 def _clone_state_dir(src: Path, dest: Path) -> None:
+    flush_checkpoints()
     safe_mkdir(dest)
     if not src.exists():
         return
@@ -4916,7 +6978,18 @@ def _clone_state_dir(src: Path, dest: Path) -> None:
         else:
             shutil.copy2(item, target)
 
-def _autopatch_evolve_score(
+def _autopatch_env() -> Dict[str, str]:
+    """Env for patched copies run from temp dirs, keeping sibling modules (weighted_sampling) importable."""
+    env = dict(os.environ)
+    here = str(Path(__file__).resolve().parent)
+    env["PYTHONPATH"] = here + (os.pathsep + env["PYTHONPATH"] if env.get("PYTHONPATH") else "")
+    return env
+
+AUTOPATCH_GENERATIONS = 15
+_GEN_SCORE_RE = re.compile(r"^\[Gen\s+\d+\] Score: (\S+)")
+
+
+def _autopatch_evolve_cmd(
     script: Path,
     state_dir: Path,
     mode: str,
@@ -4927,50 +7000,48 @@ def _autopatch_evolve_score(
     universes: int,
     resume: bool,
     freeze_eval: bool = True,
-) -> float:
-    if mode == "learner":
-        cmd = [
-            sys.executable,
-            str(script),
-            "learner-evolve",
-            "--seed",
-            str(seed),
-            "--generations",
-            str(generations),
-            "--population",
-            str(population),
-            "--universes",
-            str(universes),
-            "--task",
-            task_name,
-            "--state-dir",
-            str(state_dir),
-        ]
-    else:
-        cmd = [
-            sys.executable,
-            str(script),
-            "evolve",
-            "--seed",
-            str(seed),
-            "--generations",
-            str(generations),
-            "--population",
-            str(population),
-            "--universes",
-            str(universes),
-            "--task",
-            task_name,
-            "--state-dir",
-            str(state_dir),
-        ]
-        if mode:
-            cmd.extend(["--mode", mode])
+) -> List[str]:
+    cmd = [
+        sys.executable,
+        str(script),
+        "learner-evolve" if mode == "learner" else "evolve",
+        "--seed",
+        str(seed),
+        "--generations",
+        str(generations),
+        "--population",
+        str(population),
+        "--universes",
+        str(universes),
+        "--task",
+        task_name,
+        "--state-dir",
+        str(state_dir),
+    ]
+    if mode and mode != "learner":
+        cmd.extend(["--mode", mode])
     if resume:
         cmd.append("--resume")
     if not freeze_eval:
         cmd.append("--no-freeze-eval")
-    result = subprocess.run(cmd, capture_output=True, text=True, timeout=600)
+    return cmd
+
+def _autopatch_evolve_score(
+    script: Path,
+    state_dir: Path,
+    mode: str,
+    task_name: str,
+    seed: int,
+    generations: int,
+    population: int,
+    universes: int,
+    resume: bool,
+    freeze_eval: bool = True,
+) -> float:
+    cmd = _autopatch_evolve_cmd(
+        script, state_dir, mode, task_name, seed, generations, population, universes, resume, freeze_eval
+    )
+    result = subprocess.run(cmd, capture_output=True, text=True, timeout=600, env=_autopatch_env())
     if result.returncode != 0:
         return float("inf")
     snapshot = _load_state_snapshot(state_dir)
@@ -4978,6 +7049,387 @@ def _autopatch_evolve_score(
         return float("inf")
     return _current_best_score(snapshot)
 
+def _pump_lines(idx: int, stream: Any, out: "queue.Queue[Tuple[int, Optional[str]]]") -> None:
+    for line in stream:
+        out.put((idx, line))
+    out.put((idx, None))
+
+def race_autopatch_jobs(
+    jobs: List[Dict[str, Any]],
+    baseline: float,
+    workers: int = 0,
+    generations: int = AUTOPATCH_GENERATIONS,
+    z: float = 2.0,
+    min_gens: int = 3,
+    timeout: float = 600.0,
+    min_drops: int = 5,
+    drop_floor: float = 0.02,
+) -> Tuple[List[Dict[str, Any]], Dict[str, float]]:
+    """
+    Run autopatch evolve jobs ({"cmd" or "launch", "state_dir"}) at most `workers` at a time;
+    "launch" returns a Popen-like handle (e.g. a fork-server child).
+    Children stream "[Gen n] Score:" lines; after `min_gens` a job is killed when even an optimistic
+    projection cannot beat min(baseline, leader). The projection is remaining gens times the
+    per-gen drop bound: the largest of mean + z*std and the maximum of all observed drops, and
+    `drop_floor` x |score|. Jobs are only killed once `min_drops` non-zero drops have been seen,
+    so a plateau (all drops 0) never kills on its own. A job running longer than `timeout`
+    seconds is killed. Returns per-job {"score", "gens", "killed", "elapsed"} and round stats.
+    """
+    workers = max(1, workers or (os.cpu_count() or 1))
+    env = _autopatch_env()
+    env["PYTHONUNBUFFERED"] = "1"
+    lines: "queue.Queue[Tuple[int, Optional[str]]]" = queue.Queue()
+    results: List[Dict[str, Any]] = [
+        {"score": float("inf"), "gens": 0, "killed": False, "elapsed": 0.0, "trace": []} for _ in jobs
+    ]
+    running: Dict[int, Tuple[subprocess.Popen, float]] = {}
+    drops: List[float] = []
+    leader = float("inf")
+    next_job = 0
+    start = time.time()
+
+    def drop_bound(score: float) -> float:
+        if sum(1 for d in drops if d > 0.0) < min_drops:
+            return float("inf")
+        mean = sum(drops) / len(drops)
+        var = sum((d - mean) ** 2 for d in drops) / len(drops)
+        return max(mean + z * math.sqrt(var), max(drops), drop_floor * abs(score))
+
+    def stop(idx: int, killed: bool) -> None:
+        proc, t0 = running.pop(idx)
+        if proc.poll() is None:
+            proc.kill()
+        proc.wait()
+        results[idx]["killed"] = killed
+        results[idx]["elapsed"] = time.time() - t0
+
+    while next_job < len(jobs) or running:
+        while next_job < len(jobs) and len(running) < workers:
+            job = jobs[next_job]
+            try:
+                if "launch" in job:
+                    proc = job["launch"]()
+                else:
+                    proc = subprocess.Popen(job["cmd"], stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True, env=env)
+            except (OSError, RuntimeError):
+                next_job += 1
+                continue
+            running[next_job] = (proc, time.time())
+            threading.Thread(target=_pump_lines, args=(next_job, proc.stdout, lines), daemon=True).start()
+            next_job += 1
+        # Checked every iteration: other jobs' output must not keep a hung one alive.
+        for idx in [i for i, (_, t0) in running.items() if time.time() - t0 > timeout]:
+            stop(idx, killed=True)
+        try:
+            idx, line = lines.get(timeout=1.0)
+        except queue.Empty:
+            continue
+        if idx not in running:
+            continue
+        res = results[idx]
+        if line is None:
+            proc = running[idx][0]
+            stop(idx, killed=False)
+            if proc.returncode == 0:
+                snapshot = _load_state_snapshot(Path(jobs[idx]["state_dir"]))
+                res["score"] = _current_best_score(snapshot) if snapshot else float("inf")
+            leader = min(leader, res["score"])
+            continue
+        m = _GEN_SCORE_RE.match(line)
+        if not m:
+            continue
+        try:
+            score = float(m.group(1))
+        except ValueError:
+            continue
+        trace = res["trace"]
+        if trace and math.isfinite(trace[-1]) and math.isfinite(score):
+            drops.append(max(0.0, trace[-1] - score))
+        trace.append(score)
+        res["gens"] = len(trace)
+        res["score"] = score
+        if res["gens"] >= min_gens and math.isfinite(score) and res["gens"] < generations:
+            remaining = generations - res["gens"]
+            if score - remaining * drop_bound(score) >= min(baseline, leader):
+                stop(idx, killed=True)
+
+    wall = time.time() - start
+    # Serial cost estimate: finished jobs at their real duration, killed ones extrapolated to full length.
+    serial = 0.0
+    for res in results:
+        if res["killed"] and res["gens"] > 0:
+            serial += res["elapsed"] * generations / res["gens"]
+        else:
+            serial += res["elapsed"]
+    stats = {
+        "wall_s": wall,
+        "serial_estimate_s": serial,
+        "saved_s": max(0.0, serial - wall),
+        "killed": float(sum(1 for r in results if r["killed"])),
+        "workers": float(workers),
+    }
+    return results, stats
+
+# ---------------------------
+# Autopatch fork server (in-memory module overlay)
+# ---------------------------
+
+_FUTURE_FLAGS = __future__.annotations.compiler_flag
+_FORK_DONE = "[forkserver] done"
+AUTOPATCH_FORK_SERVER = hasattr(os, "fork") and hasattr(socket, "send_fds")
+
+
+def _bound_names(node: ast.stmt) -> Set[str]:
+    if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+        return {node.name}
+    if isinstance(node, (ast.Import, ast.ImportFrom)):
+        return {(a.asname or a.name).split(".")[0] for a in node.names}
+    return {n.id for n in ast.walk(node) if isinstance(n, ast.Name) and isinstance(n.ctx, ast.Store)}
+
+
+def _definition_time_loads(node: ast.stmt) -> Set[str]:
+    """Globals read while the statement itself executes (function bodies run later and are skipped)."""
+    def fn_parts(fn: Union[ast.FunctionDef, ast.AsyncFunctionDef]) -> List[ast.AST]:
+        return list(fn.decorator_list) + list(fn.args.defaults) + [d for d in fn.args.kw_defaults if d is not None]
+
+    def stmt_parts(stmt: ast.stmt) -> List[ast.AST]:
+        if isinstance(stmt, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            return fn_parts(stmt)
+        if isinstance(stmt, ast.AnnAssign):
+            # Annotations stay strings under `from __future__ import annotations`.
+            return [stmt.value] if stmt.value is not None else []
+        return [stmt]
+
+    if isinstance(node, ast.ClassDef):
+        parts = list(node.bases) + [k.value for k in node.keywords] + list(node.decorator_list)
+        for stmt in node.body:
+            parts.extend(stmt_parts(stmt))
+    else:
+        parts = stmt_parts(node)
+    return {n.id for p in parts for n in ast.walk(p) if isinstance(n, ast.Name) and isinstance(n.ctx, ast.Load)}
+
+
+def _is_main_guard(node: ast.stmt) -> bool:
+    return isinstance(node, ast.If) and "__name__" in {n.id for n in ast.walk(node.test) if isinstance(n, ast.Name)}
+
+
+def overlay_source(
+    namespace: Dict[str, Any],
+    base_dumps: List[str],
+    new_source: str,
+    filename: str = "<autopatch>",
+) -> List[str]:
+    """
+    Patch a loaded module namespace to match `new_source`: top-level statements that differ from
+    the base (by ast.dump) are recompiled and executed, followed by any later statement that reads a
+    rebound name at definition time (e.g. a dict of operator functions, a dataclass default_factory).
+    Returns the rebound names.
+    """
+    tree = ast.parse(new_source, filename=filename)
+    new_dumps = [ast.dump(n) for n in tree.body]
+    changed: Set[int] = set()
+    for tag, _, _, j1, j2 in difflib.SequenceMatcher(a=base_dumps, b=new_dumps, autojunk=False).get_opcodes():
+        if tag != "equal":
+            changed.update(range(j1, j2))
+    rebound: Set[str] = set()
+    applied: List[str] = []
+    for j, node in enumerate(tree.body):
+        if _is_main_guard(node):
+            continue
+        if j in changed or (_definition_time_loads(node) & rebound):
+            module = ast.Module(body=[node], type_ignores=[])
+            exec(compile(module, filename, "exec", flags=_FUTURE_FLAGS, dont_inherit=True), namespace)
+            names = _bound_names(node)
+            rebound |= names
+            applied.extend(sorted(names))
+    return applied
+
+
+def _recv_exact(sock: socket.socket, n: int) -> bytes:
+    buf = b""
+    while len(buf) < n:
+        chunk = sock.recv(n - len(buf))
+        if not chunk:
+            return b""
+        buf += chunk
+    return buf
+
+
+def _forked_autopatch_child(request: Dict[str, Any], base_dumps: List[str], out_fd: int) -> None:
+    code = 1
+    try:
+        signal.signal(signal.SIGCHLD, signal.SIG_DFL)
+        os.dup2(out_fd, 1)
+        devnull = os.open(os.devnull, os.O_WRONLY)
+        os.dup2(devnull, 2)
+        sys.stdout = open(1, "w", buffering=1, encoding="utf-8", closefd=False)
+        sys.stderr = open(2, "w", encoding="utf-8", closefd=False)
+        random.seed()
+        if request.get("source") is not None:
+            overlay_source(globals(), base_dumps, request["source"], request.get("filename", "<autopatch>"))
+        globals()["STATE_DIR"] = Path(request["state_dir"])
+        mode = request["mode"]
+        task_name = request["task_name"]
+        # Names are looked up in the (overlaid) module globals, so patched definitions take effect.
+        if request["kind"] == "probe":
+            score = _autopatch_probe_score(mode=mode, task_name=task_name)
+            print(f"{score:.6f}")
+        elif request["kind"] == "selftest":
+            if cmd_selftest(None) != 0:
+                raise RuntimeError("selftest failed")
+        else:
+            if mode != "learner":
+                mode = mode or ("algo" if task_name in ALGO_TASK_NAMES else "solver")
+            run_multiverse(
+                request["seed"],
+                TaskSpec(name=task_name),
+                request["generations"],
+                request["population"],
+                request["universes"],
+                resume=request["resume"],
+                mode=mode,
+                freeze_eval=request.get("freeze_eval", True),
+            )
+        print(_FORK_DONE)
+        code = 0
+    except BaseException:
+        traceback.print_exc()
+    finally:
+        try:
+            sys.stdout.flush()
+        finally:
+            os._exit(code)
+
+
+def _fork_server_loop(sock: socket.socket, base_dumps: List[str]) -> None:
+    signal.signal(signal.SIGCHLD, signal.SIG_IGN)  # children are reaped automatically
+    while True:
+        header = _recv_exact(sock, 8)
+        size = int.from_bytes(header, "big") if header else 0
+        if size == 0:
+            return
+        request = pickle.loads(_recv_exact(sock, size))
+        r, w = os.pipe()
+        pid = os.fork()
+        if pid == 0:
+            sock.close()
+            os.close(r)
+            _forked_autopatch_child(request, base_dumps, w)
+        os.close(w)
+        socket.send_fds(sock, [str(pid).encode()], [r])
+        os.close(r)
+
+
+class ForkedRun:
+    """Popen-like handle for a fork-server child: iterate .stdout, poll(), kill(), wait()."""
+
+    def __init__(self, pid: int, fd: int):
+        self.pid = pid
+        self.returncode: Optional[int] = None
+        self.stdout = self._lines(fd)
+
+    def _lines(self, fd: int) -> Iterable[str]:
+        with os.fdopen(fd, "r", encoding="utf-8", errors="replace") as f:
+            for line in f:
+                if line.startswith(_FORK_DONE):
+                    self.returncode = 0
+                    continue
+                yield line
+        if self.returncode is None:
+            self.returncode = 1
+
+    def poll(self) -> Optional[int]:
+        return self.returncode
+
+    def kill(self) -> None:
+        try:
+            os.kill(self.pid, signal.SIGKILL)
+        except ProcessLookupError:
+            pass
+        if self.returncode is None:
+            self.returncode = -signal.SIGKILL
+
+    def wait(self) -> Optional[int]:
+        return self.returncode
+
+
+class AutopatchForkServer:
+    """
+    Keeps a pre-imported copy of this module in a server process. Each launch() forks a child from
+    it, overlays the candidate source (only changed top-level definitions are recompiled) and runs
+    run_multiverse / the probe; nothing is written to disk except the candidate's state dir.
+    Start it before the parent mutates module globals (run_rsi_loop does) so children see a
+    fresh-import state, like a subprocess would.
+    """
+
+    def __init__(self) -> None:
+        self.sock: Optional[socket.socket] = None
+        self.pid: Optional[int] = None
+        self.lock = threading.Lock()
+
+    def start(self) -> None:
+        base_tree = ast.parse(Path(__file__).read_text(encoding="utf-8"))
+        base_dumps = [ast.dump(n) for n in base_tree.body]
+        parent_sock, server_sock = socket.socketpair(socket.AF_UNIX, socket.SOCK_STREAM)
+        sys.stdout.flush()
+        pid = os.fork()
+        if pid == 0:
+            parent_sock.close()
+            try:
+                _fork_server_loop(server_sock, base_dumps)
+            finally:
+                os._exit(0)
+        server_sock.close()
+        self.sock = parent_sock
+        self.pid = pid
+
+    def launch(self, request: Dict[str, Any]) -> ForkedRun:
+        if self.sock is None:
+            raise RuntimeError("fork server not running")
+        payload = pickle.dumps(request)
+        with self.lock:
+            self.sock.sendall(len(payload).to_bytes(8, "big") + payload)
+            msg, fds, _, _ = socket.recv_fds(self.sock, 64, 1)
+        if not fds:
+            raise RuntimeError("fork server did not return a pipe")
+        return ForkedRun(int(msg.decode()), fds[0])
+
+    def close(self) -> None:
+        if self.sock is None:
+            return
+        try:
+            self.sock.sendall((0).to_bytes(8, "big"))
+        except OSError:
+            pass
+        self.sock.close()
+        self.sock = None
+        if self.pid:
+            try:
+                os.waitpid(self.pid, 0)
+            except ChildProcessError:
+                pass
+            self.pid = None
+
+
+_FORK_SERVER: Optional[AutopatchForkServer] = None
+
+
+def autopatch_fork_server() -> Optional[AutopatchForkServer]:
+    """Shared fork server, started on first use; None where fork/SCM_RIGHTS are unavailable."""
+    global _FORK_SERVER
+    if not AUTOPATCH_FORK_SERVER:
+        return None
+    if _FORK_SERVER is None:
+        server = AutopatchForkServer()
+        try:
+            server.start()
+        except OSError:
+            return None
+        atexit.register(server.close)
+        _FORK_SERVER = server
+    return _FORK_SERVER
+
+
 def _autopatch_probe_score(
     mode: str,
     task_name: str,
@@ -5004,7 +7456,41 @@ def _autopatch_probe_score(
     best_snapshot = next((u for u in gs.universes if u.get("uid") == gs.selected_uid), gs.universes[0])
     return float(best_snapshot.get("best_score", float("inf")))
 
-def _probe_score(script: Path, mode: str, task_name: str) -> float:
+def _probe_score(script: Path, mode: str, task_name: str, source: Optional[str] = None) -> float:
+    """Probe score of `script`, or of in-memory `source` (fork server; no source file is written)."""
+    server = autopatch_fork_server()
+    if server is not None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            run = server.launch(
+                {
+                    "kind": "probe",
+                    "source": source if source is not None else script.read_text(encoding="utf-8"),
+                    "filename": str(script),
+                    "state_dir": tmpdir,
+                    "mode": mode,
+                    "task_name": task_name,
+                }
+            )
+            timer = threading.Timer(120, run.kill)
+            timer.start()
+            try:
+                output = [line.strip() for line in run.stdout if line.strip()]
+            finally:
+                timer.cancel()
+        if run.returncode != 0 or not output:
+            return float("inf")
+        try:
+            return float(output[-1])
+        except Exception:
+            return float("inf")
+    if source is not None:
+        with tempfile.NamedTemporaryFile(mode="w", suffix=".py", delete=False, encoding="utf-8") as f:
+            f.write(source)
+            tmp = Path(f.name)
+        try:
+            return _probe_score(tmp, mode, task_name)
+        finally:
+            tmp.unlink(missing_ok=True)
     with tempfile.TemporaryDirectory() as tmpdir:
         result = subprocess.run(
             [
@@ -5021,6 +7507,7 @@ def _probe_score(script: Path, mode: str, task_name: str) -> float:
             capture_output=True,
             text=True,
             timeout=120,
+            env=_autopatch_env(),
         )
     if result.returncode != 0:
         return float("inf")
@@ -5135,13 +7622,7 @@ def _evaluate_patch_candidate(
 ) -> Tuple[bool, float, float]:
     """Evaluate a patch candidate. Returns (accepted, improvement, new_score)."""
     min_improvement_threshold = 0.03
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".py", delete=False, encoding="utf-8") as f:
-        f.write(patch_code)
-        tmp = Path(f.name)
-    try:
-        new_score = _probe_score(tmp, mode, task_name)
-    finally:
-        tmp.unlink(missing_ok=True)
+    new_score = _probe_score(Path(__file__).resolve(), mode, task_name, source=patch_code)
     if not math.isfinite(baseline_score) or baseline_score <= 0:
         return False, 0.0, new_score
     improvement = (baseline_score - new_score) / baseline_score
@@ -5178,19 +7659,162 @@ def _log_autopatch_attempt(record: Dict[str, Any]) -> None:
     with log_path.open("a", encoding="utf-8") as f:
         f.write(json.dumps(record) + "\n")
 
+AUTOPATCH_PROBE_GENERATIONS = 6
+AUTOPATCH_PROBE_POPULATION = 32
+AUTOPATCH_PROBE_SEED = 1337
+AUTOPATCH_SCREEN_KEEP = 0.5
+
+
+class AutopatchLedger:
+    """
+    Persistent autopatch results (STATE_DIR/autopatch_ledger.json), keyed by sha256 of
+    (base source hash, diff hash, mutated state hash, task, seed policy). Selftest and probe results
+    run from a fresh state, so their key leaves out the state hash; full runs resume from the state
+    and include it. An entry older than `ttl_rounds` RSI rounds is re-evaluated (0 = never).
+    `rsi_round` is the current RSI loop round (run_rsi_loop passes it); without one the ledger stays on
+    the last saved round, so standalone autopatch runs do not age it.
+    """
+
+    STAGES = ("selftest", "probe", "full")
+
+    def __init__(self, path: Path, ttl_rounds: int = 0, max_entries: int = 4096, rsi_round: Optional[int] = None):
+        data = read_json(path) if path.exists() else {}
+        self.path = path
+        self.ttl_rounds = ttl_rounds
+        self.max_entries = max_entries
+        self.saved_round = int(data.get("round", 0))
+        self.round = self.saved_round if rsi_round is None else rsi_round
+        self.entries: Dict[str, Dict[str, Any]] = data.get("entries", {})
+        self.lookups: collections.Counter = collections.Counter()
+        self.hits: collections.Counter = collections.Counter()
+
+    @staticmethod
+    def key(*parts: Any) -> str:
+        return sha256("|".join(str(p) for p in parts))
+
+    def get(self, stage: str, key: str) -> Optional[Dict[str, Any]]:
+        self.lookups[stage] += 1
+        entry = self.entries.get(key, {}).get(stage)
+        if entry is None or (self.ttl_rounds > 0 and self.round - int(entry.get("round", 0)) >= self.ttl_rounds):
+            return None
+        self.hits[stage] += 1
+        return entry
+
+    def put(self, stage: str, key: str, **values: Any) -> None:
+        self.entries.setdefault(key, {})[stage] = {**values, "round": self.round}
+
+    def summary(self) -> Dict[str, Any]:
+        out: Dict[str, Any] = {"round": self.round}
+        for stage in self.STAGES:
+            n = self.lookups[stage]
+            out[stage] = {"lookups": n, "hits": self.hits[stage], "hit_rate": self.hits[stage] / n if n else 0.0}
+        return out
+
+    def save(self) -> None:
+        if len(self.entries) > self.max_entries:
+            newest = sorted(
+                self.entries.items(),
+                key=lambda kv: max(int(e.get("round", 0)) for e in kv[1].values()) if kv[1] else 0,
+                reverse=True,
+            )
+            self.entries = dict(newest[: self.max_entries])
+        payload = {"round": max(self.round, self.saved_round), "entries": self.entries}
+        write_text_atomic(self.path, json.dumps(payload, ensure_ascii=False, indent=2, default=str))
+
+
+def _autopatch_job(
+    server: Optional[AutopatchForkServer],
+    script_path: Path,
+    patched_source: Optional[str],
+    state_dir: Path,
+    mode: str,
+    task_name: str,
+    seed: int,
+    generations: int,
+    population: int,
+    universes: int,
+    resume: bool,
+) -> Dict[str, Any]:
+    """One evolve run for race_autopatch_jobs: a fork-server launch, or a subprocess of `script_path`."""
+    safe_mkdir(state_dir)
+    if server is None:
+        cmd = _autopatch_evolve_cmd(
+            script_path, state_dir, mode, task_name, seed, generations, population, universes, resume, True
+        )
+        return {"cmd": cmd, "state_dir": state_dir}
+    request = {
+        "kind": "evolve",
+        "source": patched_source,
+        "filename": str(Path(__file__).resolve()),
+        "state_dir": str(state_dir),
+        "mode": mode,
+        "task_name": task_name,
+        "seed": seed,
+        "generations": generations,
+        "population": population,
+        "universes": universes,
+        "resume": resume,
+        "freeze_eval": True,
+    }
+
+    def launch() -> ForkedRun:
+        # Like the subprocess path, a params-only candidate runs the script as it is at launch: an
+        # accepted source patch may have changed it since the server forked, and overlay_source is a
+        # no-op when the source matches the server's base.
+        if patched_source is None:
+            return server.launch({**request, "source": script_path.read_text(encoding="utf-8")})
+        return server.launch(request)
+
+    return {"launch": launch, "state_dir": state_dir}
+
+
+def _autopatch_selftest_ok(server: Optional[AutopatchForkServer], script_path: Path, patched_source: str) -> bool:
+    if server is None:
+        try:
+            result = subprocess.run(
+                [sys.executable, str(script_path), "selftest"], capture_output=True, text=True, timeout=60, env=_autopatch_env()
+            )
+        except subprocess.TimeoutExpired:
+            return False
+        return result.returncode == 0
+    with tempfile.TemporaryDirectory() as tmpdir:
+        run = server.launch({"kind": "selftest", "source": patched_source, "state_dir": tmpdir, "mode": "", "task_name": ""})
+        timer = threading.Timer(60, run.kill)
+        timer.start()
+        try:
+            for _ in run.stdout:
+                pass
+        finally:
+            timer.cancel()
+    return run.returncode == 0
+
+
 def run_deep_autopatch(
     levels: List[int],
     candidates: int = 4,
     apply: bool = True,
     mode: str = "solver",
+    workers: int = 0,
+    screen_keep: float = AUTOPATCH_SCREEN_KEEP,
+    ledger_ttl: int = 0,
+    state_dir: Optional[Path] = None,
+    ledger_round: Optional[int] = None,
 ) -> Dict[str, Any]:
     """
     True RSI self-modification system with fitness-gated acceptance and rollback safety.
     Core change: evolve after mutation instead of re-evaluating the same code.
+    Candidates are evolved concurrently (`workers`, 0 = CPU count) and losing runs are killed early.
+    Screening is multi-fidelity: selftest, then a short fixed-seed probe, and only the top
+    `screen_keep` fraction of probes get the full AUTOPATCH_GENERATIONS evaluation.
+    Results at every fidelity are reused from AutopatchLedger (re-evaluated after `ledger_ttl` RSI
+    rounds; `ledger_round` is the current one).
+    `state_dir` (default STATE_DIR) is the run state patches are evaluated against; the pipelined
+    loop passes a frozen copy so evolution can keep writing STATE_DIR meanwhile.
     """
+    state_dir = state_dir or STATE_DIR
     script = Path(__file__).resolve()
     source = script.read_text(encoding="utf-8")
-    state_snapshot = _load_state_snapshot(STATE_DIR)
+    state_snapshot = _load_state_snapshot(state_dir)
     task_name = (state_snapshot or {}).get("task", {}).get("name", TaskSpec().name)
     seed = int((state_snapshot or {}).get("base_seed", 1337))
     universes = max(1, len((state_snapshot or {}).get("universes", [])) or 1)
@@ -5204,7 +7828,14 @@ def run_deep_autopatch(
     print(f"[AUTOPATCH L{levels}] Baseline: {baseline:.4f}")
 
     rng = random.Random(int(time.time()) % 100000)
+    server = autopatch_fork_server()
+    ledger = AutopatchLedger(STATE_DIR / "autopatch_ledger.json", ttl_rounds=ledger_ttl, rsi_round=ledger_round)
+    base_hash = sha256(source)
+    # Seed policies: a cached result stands for any attempt seed drawn under the same policy.
+    screen_policy = f"probe:{AUTOPATCH_PROBE_SEED}:{AUTOPATCH_PROBE_GENERATIONS}g:{AUTOPATCH_PROBE_POPULATION}p:{mode}"
+    full_policy = f"full:{seed}+attempt:{AUTOPATCH_GENERATIONS}g:{population}p:{universes}u:{mode}"
     patch_candidates: List[Dict[str, Any]] = []
+    jobs: List[Dict[str, Any]] = []
     attempt_idx = 0
 
     for level in levels:
@@ -5235,57 +7866,185 @@ def run_deep_autopatch(
             if not patch_type or (mutated_source == source and not mutated_params):
                 continue
             diff = unified_diff(source, mutated_source, str(script))
-            diff_size = len(diff.splitlines())
-            with tempfile.TemporaryDirectory() as tmpdir:
-                tmp_state_dir = Path(tmpdir)
-                if state_snapshot:
-                    _clone_state_dir(STATE_DIR, tmp_state_dir)
-                    if mutated_state:
-                        _write_state_snapshot(tmp_state_dir, mutated_state)
-                script_path = script
-                if mutated_source != source:
-                    script_path = tmp_state_dir / script.name
-                    script_path.write_text(mutated_source, encoding="utf-8")
-                attempt_seed = seed + attempt_idx
-                print(f"[DEBUG] Running evolution with params: {mutated_params}")
-                new_score = _autopatch_evolve_score(
-                    script_path,
-                    tmp_state_dir,
-                    mode,
-                    task_name,
-                    attempt_seed,
-                    generations=15,
-                    population=population,
-                    universes=universes,
-                    resume=state_snapshot is not None,
-                    freeze_eval=True,
-                )
-                print(f"[DEBUG] Evolution returned best_score: {new_score}")
-            improvement = baseline - new_score
-            accepted = improvement > 0
-            record = {
-                "level": level,
-                "patch_type": patch_type,
+            patched = mutated_source if mutated_source != source else None
+            work_dir = Path(tempfile.mkdtemp(prefix="rsi_autopatch_"))
+            full_dir = work_dir / "full"
+            safe_mkdir(full_dir)
+            if state_snapshot:
+                _clone_state_dir(state_dir, full_dir)
+                if mutated_state:
+                    _write_state_snapshot(full_dir, mutated_state, wait=True)
+            script_path = script
+            if patched is not None and server is None:
+                # Subprocess fallback only; the fork server keeps the patched source in memory.
+                script_path = work_dir / script.name
+                script_path.write_text(patched, encoding="utf-8")
+            print(f"[DEBUG] Queued evolution with params: {mutated_params}")
+            jobs.append(
+                {
+                    "work_dir": work_dir,
+                    "script_path": script_path,
+                    "patched": patched,
+                    "probe": _autopatch_job(
+                        server, script_path, patched, work_dir / "probe", mode, task_name,
+                        AUTOPATCH_PROBE_SEED, AUTOPATCH_PROBE_GENERATIONS, AUTOPATCH_PROBE_POPULATION, 1, False,
+                    ),
+                    "full": _autopatch_job(
+                        server, script_path, patched, full_dir, mode, task_name,
+                        seed + attempt_idx, AUTOPATCH_GENERATIONS, population, universes, state_snapshot is not None,
+                    ),
+                    "level": level,
+                    "patch_type": patch_type,
+                    "diff": diff,
+                    "code": mutated_source,
+                    "state": mutated_state,
+                    "params": mutated_params,
+                    "screen_key": ledger.key(base_hash, sha256(diff), task_name, screen_policy),
+                    "full_key": ledger.key(
+                        base_hash, sha256(diff), sha256(json.dumps(mutated_state, sort_keys=True)), task_name, full_policy
+                    ),
+                    "ledger_hits": [],
+                }
+            )
+
+    def log_rejected(job: Dict[str, Any], fidelity: str, probe_score: Optional[float]) -> None:
+        _log_autopatch_attempt(
+            {
+                "level": job["level"],
+                "patch_type": job["patch_type"],
                 "old_score": baseline,
-                "new_score": new_score,
-                "improvement": improvement,
-                "diff_size": diff_size,
-                "accepted": accepted,
-                "params": mutated_params,
+                "new_score": None,
+                "improvement": None,
+                "diff_size": len(job["diff"].splitlines()),
+                "accepted": False,
+                "params": job["params"],
+                "rejected_at": fidelity,
+                "probe_score": probe_score,
+                "ledger_hits": job["ledger_hits"],
             }
-            _log_autopatch_attempt(record)
-            if accepted:
-                print(f"[AUTOPATCH] {patch_type} -> {new_score:.4f} (ACCEPT +{improvement:.2f})")
+        )
+        shown = f"{probe_score:.4f}" if probe_score is not None else "-"
+        print(f"[AUTOPATCH] {job['patch_type']} -> probe {shown} (REJECT at {fidelity})")
+
+    try:
+        # Fidelity 0: patched source must pass selftest (seconds).
+        screened: List[Dict[str, Any]] = []
+        for job in jobs:
+            ok = True
+            if job["patched"] is not None:
+                hit = ledger.get("selftest", job["screen_key"])
+                if hit is not None:
+                    ok = bool(hit["ok"])
+                    job["ledger_hits"].append("selftest")
+                else:
+                    ok = _autopatch_selftest_ok(server, job["script_path"], job["patched"])
+                    ledger.put("selftest", job["screen_key"], ok=ok)
+            if ok:
+                screened.append(job)
+            else:
+                log_rejected(job, "selftest", None)
+        # Fidelity 1: short fixed-seed probe; only the best `screen_keep` fraction goes on.
+        # Ledger hits and duplicates within the round are not re-run.
+        probe_start = time.time()
+        to_probe: Dict[str, Dict[str, Any]] = {}
+        for job in screened:
+            hit = ledger.get("probe", job["screen_key"])
+            if hit is not None:
+                job["probe_score"] = float(hit["score"])
+                job["ledger_hits"].append("probe")
+            else:
+                to_probe.setdefault(job["screen_key"], job)
+        probe_out, _ = race_autopatch_jobs(
+            [job["probe"] for job in to_probe.values()],
+            float("inf"),
+            workers=workers,
+            generations=AUTOPATCH_PROBE_GENERATIONS,
+            min_gens=AUTOPATCH_PROBE_GENERATIONS,  # probes always finish; their scores are the ranking
+        )
+        for key, out in zip(to_probe, probe_out):
+            ledger.put("probe", key, score=out["score"])
+        for job in screened:
+            if "probe_score" not in job:
+                job["probe_score"] = float(ledger.entries[job["screen_key"]]["probe"]["score"])
+        probe_wall = time.time() - probe_start
+        passed = sorted((job for job in screened if math.isfinite(job["probe_score"])), key=lambda j: j["probe_score"])
+        keep = max(1, int(math.ceil(len(passed) * clamp(screen_keep, 0.0, 1.0)))) if passed else 0
+        finalists = passed[:keep]
+        for job in screened:
+            if job not in finalists:
+                log_rejected(job, "probe", job["probe_score"])
+        print(
+            f"[AUTOPATCH] screening: {len(jobs) - len(screened)} failed selftest, "
+            f"{len(screened) - len(finalists)} cut at probe ({probe_wall:.1f}s), {len(finalists)} to full evaluation"
+        )
+        # Fidelity 2: full evolution, raced with early termination. Only completed runs are cached;
+        # an early kill depends on the round's leader, so it is not a reusable measurement.
+        outcomes: List[Dict[str, Any]] = [{} for _ in finalists]
+        to_run: Dict[str, List[int]] = {}
+        for i, job in enumerate(finalists):
+            hit = ledger.get("full", job["full_key"])
+            if hit is not None:
+                outcomes[i] = {"score": float(hit["score"]), "gens": AUTOPATCH_GENERATIONS, "killed": False}
+                job["ledger_hits"].append("full")
             else:
-                print(f"[AUTOPATCH] {patch_type} -> {new_score:.4f} (REJECT)")
+                to_run.setdefault(job["full_key"], []).append(i)
+        ran, race_stats = race_autopatch_jobs([finalists[idx[0]]["full"] for idx in to_run.values()], baseline, workers=workers)
+        for (key, idx), out in zip(to_run.items(), ran):
+            if not out["killed"]:
+                ledger.put("full", key, score=out["score"])
+            for i in idx:
+                outcomes[i] = out
+    finally:
+        for job in jobs:
+            shutil.rmtree(job["work_dir"], ignore_errors=True)
+        ledger.save()
+    ledger_summary = ledger.summary()
+    _log_autopatch_attempt({"event": "ledger", **ledger_summary})
+    print(
+        "[AUTOPATCH] ledger hits: "
+        + ", ".join(f"{st} {ledger_summary[st]['hits']}/{ledger_summary[st]['lookups']}" for st in AutopatchLedger.STAGES)
+    )
+
+    for job, outcome in zip(finalists, outcomes):
+        new_score = outcome["score"]
+        print(f"[DEBUG] Evolution returned best_score: {new_score} after {outcome['gens']} gens")
+        improvement = baseline - new_score
+        accepted = improvement > 0 and not outcome["killed"]
+        record = {
+            "level": job["level"],
+            "patch_type": job["patch_type"],
+            "old_score": baseline,
+            "new_score": new_score,
+            "improvement": improvement,
+            "diff_size": len(job["diff"].splitlines()),
+            "accepted": accepted,
+            "params": job["params"],
+            "rejected_at": None if accepted else (f"full@gen{outcome['gens']}" if outcome["killed"] else "full"),
+            "probe_score": job["probe_score"],
+            "ledger_hits": job["ledger_hits"],
+        }
+        _log_autopatch_attempt(record)
+        if outcome["killed"]:
+            print(f"[AUTOPATCH] {job['patch_type']} -> {new_score:.4f} (KILLED at gen {outcome['gens']})")
+        elif accepted:
+            print(f"[AUTOPATCH] {job['patch_type']} -> {new_score:.4f} (ACCEPT +{improvement:.2f})")
+        else:
+            print(f"[AUTOPATCH] {job['patch_type']} -> {new_score:.4f} (REJECT)")
+        if not outcome["killed"]:
             patch_candidates.append(
                 {
                     **record,
-                    "diff": diff,
-                    "code": mutated_source,
-                    "state": mutated_state,
+                    "diff": job["diff"],
+                    "code": job["code"],
+                    "state": job["state"],
                 }
             )
+    if to_run:
+        print(
+            f"[AUTOPATCH] {len(to_run)} full runs on {int(race_stats['workers'])} workers: "
+            f"wall {race_stats['wall_s']:.1f}s vs serial ~{race_stats['serial_estimate_s']:.1f}s "
+            f"(saved {race_stats['saved_s']:.1f}s, {int(race_stats['killed'])} killed early)"
+        )
 
     best = _select_best_patch(patch_candidates)
     if not best:
@@ -5322,23 +8081,90 @@ def run_deep_autopatch(
         "new_score": best["new_score"],
         "patch_type": best["patch_type"],
         "diff": best["diff"],
+        # Enough to apply the accepted patch later (pipelined loop).
+        "code": best["code"],
+        "params": best["params"],
+        "base_hash": base_hash,
     }
 
 
+def _pipelined_autopatch(
+    snapshot_dir: Path,
+    levels: List[int],
+    stagnant: bool,
+    mode: str,
+    workers: int,
+    ledger_ttl: int,
+    ledger_round: int,
+) -> Dict[str, Any]:
+    """Background half of a pipelined RSI round: evaluate (never apply) patches against a frozen state copy."""
+    try:
+        out: Dict[str, Any] = {"forced": None, "result": None}
+        if stagnant:
+            out["forced"] = run_deep_autopatch(
+                [1, 3],
+                candidates=4,
+                apply=False,
+                mode=mode,
+                workers=workers,
+                ledger_ttl=ledger_ttl,
+                state_dir=snapshot_dir,
+                ledger_round=ledger_round,
+            )
+            if out["forced"].get("code") is not None:
+                return out
+        out["result"] = run_deep_autopatch(
+            levels,
+            candidates=4,
+            apply=False,
+            mode=mode,
+            workers=workers,
+            ledger_ttl=ledger_ttl,
+            state_dir=snapshot_dir,
+            ledger_round=ledger_round,
+        )
+        return out
+    finally:
+        shutil.rmtree(snapshot_dir, ignore_errors=True)
+
+
+def _apply_pipelined_patch(result: Optional[Dict[str, Any]]) -> bool:
+    """
+    Apply a patch accepted in the background at the round boundary. Source goes through
+    _safe_apply_patch (selftest + rollback); L1 parameters are written into the current state's
+    universes, so the evolution that ran meanwhile is kept. Stale patches (script changed since
+    evaluation) are dropped.
+    """
+    if not result or result.get("code") is None:
+        return False
+    script = Path(__file__).resolve()
+    source = script.read_text(encoding="utf-8")
+    if sha256(source) != result["base_hash"]:
+        print("[PIPELINE] Script changed since the patch was evaluated; dropping it.")
+        return False
+    applied = True
+    if result["code"] != source:
+        applied = _safe_apply_patch(script, result["code"])
+    if applied and result.get("params"):
+        snapshot = _load_state_snapshot(STATE_DIR)
+        if snapshot:
+            for u in snapshot.get("universes", []):
+                u["meta"] = {**u.get("meta", {}), **result["params"]}
+            _write_state_snapshot(STATE_DIR, snapshot)
+    if applied:
+        print(f"[RSI] Self-modified! Score: {result['old_score']:.4f} -> {result['new_score']:.4f}")
+    return applied
+
+
 def load_recent_scores(log_path: Path, n: int) -> List[float]:
     scores = []
-    if not log_path.exists():
-        return scores
     try:
-        with open(log_path, "r", encoding="utf-8") as f:
-            lines = f.readlines()
-            for line in lines[-n:]:
-                try:
-                    data = json.loads(line)
-                    if "score" in data:
-                        scores.append(float(data["score"]))
-                except:
-                    pass
+        for data in read_jsonl_tail(log_path, n):
+            try:
+                if "score" in data:
+                    scores.append(float(data["score"]))
+            except:
+                pass
     except Exception:
         pass
     return scores
@@ -5422,7 +8248,7 @@ def _mutate_genome_with_meta(
         if op in OPERATORS:
             stmts = OPERATORS[op](rng, stmts)
         op_tag = f"mut:{op}"
-    stmts = inject_helpers_into_statements(rng, list(stmts), library)
+    stmts = simplify_statements(inject_helpers_into_statements(rng, list(stmts), library))
     return Genome(statements=stmts, parents=[g.gid], op_tag=op_tag)
 
 
@@ -5444,7 +8270,7 @@ def _synthesize_genome(
         stmts = p1.statements[:cut1] + p2.statements[-cut2:]
     if not stmts:
         stmts = ["return x"]
-    stmts = inject_helpers_into_statements(rng, list(stmts), library)
+    stmts = simplify_statements(inject_helpers_into_statements(rng, list(stmts), library))
     return Genome(statements=stmts, parents=[p1.gid, p2.gid], op_tag="synthesize")
 
 
@@ -5553,6 +8379,111 @@ def _print_critic_summary(
         print("[Critic] top validator failures:", ", ".join(f"{k}:{v}" for k, v in top_validator))
 
 
+def _critic_prefilter_job(
+    g: Genome,
+    batch: Batch,
+    mode: str,
+    task_name: str,
+    library: Dict[str, Any],
+) -> Tuple[bool, str, Optional[EvalResult]]:
+    # Runs in a Critic worker; helpers are rebuilt from the library snapshot (lambdas do not pickle).
+    helpers = FunctionLibrary.from_snapshot(library).get_helpers()
+    validator = validate_program if mode == "program" else validate_code
+    return _prefilter_eval(g, batch, mode, task_name, extra_env=helpers, validator=validator)
+
+
+def _critic_full_job(
+    g: Genome,
+    batch: Batch,
+    mode: str,
+    task_name: str,
+    library: Dict[str, Any],
+) -> EvalResult:
+    helpers = FunctionLibrary.from_snapshot(library).get_helpers()
+    validator = validate_program if mode == "program" else validate_code
+    return _evaluate_candidate(g, batch, mode, task_name, extra_env=helpers, validator=validator)
+
+
+class CriticPipeline:
+    """
+    Bounded Creator -> Critic queue for the duo loop.
+    admit() dedups candidates by code hash at insertion; submit() blocks while `capacity` jobs are
+    in flight, which throttles the Creator when the Critic falls behind. Jobs run on a process pool
+    of `workers` Critic processes (inline in the caller when workers <= 1).
+    """
+
+    def __init__(self, workers: int = 0, capacity: int = 32):
+        self.workers = max(1, workers or (os.cpu_count() or 1))
+        self.capacity = max(1, capacity)
+        self.executor = concurrent.futures.ProcessPoolExecutor(self.workers) if self.workers > 1 else None
+        self.pending: Dict[concurrent.futures.Future, Tuple[str, Any]] = {}
+        self.ready: List[Tuple[str, Any, Any]] = []
+        self.seen: Set[str] = set()
+        self.duplicates = 0
+        self.throttled_s = 0.0
+
+    def reset(self) -> None:
+        self.discard()
+        self.seen.clear()
+        self.duplicates = 0
+        self.throttled_s = 0.0
+
+    def admit(self, code_hash: str) -> bool:
+        if code_hash in self.seen:
+            self.duplicates += 1
+            return False
+        self.seen.add(code_hash)
+        return True
+
+    def submit(self, kind: str, tag: Any, fn: Callable[..., Any], *args: Any) -> None:
+        if self.executor is None:
+            try:
+                out = fn(*args)
+            except Exception as e:
+                out = e
+            self.ready.append((kind, tag, out))
+            return
+        if len(self.pending) >= self.capacity:
+            t0 = time.time()
+            self._collect(timeout=None)
+            self.throttled_s += time.time() - t0
+        self.pending[self.executor.submit(fn, *args)] = (kind, tag)
+
+    def _collect(self, timeout: Optional[float]) -> None:
+        done, _ = concurrent.futures.wait(list(self.pending), timeout=timeout, return_when=concurrent.futures.FIRST_COMPLETED)
+        for fut in done:
+            kind, tag = self.pending.pop(fut)
+            try:
+                out = fut.result()
+            except Exception as e:
+                out = e
+            self.ready.append((kind, tag, out))
+
+    def drain(self, timeout: float = 0.0) -> List[Tuple[str, Any, Any]]:
+        """Completed (kind, tag, result) triples; waits up to `timeout` if nothing is ready yet."""
+        if self.pending and (timeout > 0 and not self.ready or any(f.done() for f in self.pending)):
+            self._collect(timeout=timeout)
+        out, self.ready = self.ready, []
+        return out
+
+    def has_pending(self, kind: str, tags: Optional[Set[Any]] = None) -> bool:
+        jobs = list(self.pending.values()) + [(k, t) for k, t, _ in self.ready]
+        return any(k == kind and (tags is None or t in tags) for k, t in jobs)
+
+    def discard(self) -> None:
+        # Jobs already running cannot be cancelled; their results are simply never collected.
+        for fut in self.pending:
+            fut.cancel()
+        self.pending.clear()
+        self.ready.clear()
+
+    def close(self) -> None:
+        self.discard()
+        if self.executor is not None:
+            self.executor.shutdown(wait=True, cancel_futures=True)
+            self.executor = None
+
+
 def run_duo_loop(
     rounds: int,
     slice_seconds: float,
@@ -5563,6 +8494,8 @@ def run_duo_loop(
     freeze_eval: bool = True,
     population: int = 64,
     max_candidates: int = 512,
+    critic_workers: int = 0,
+    queue_size: int = 32,
 ) -> None:
     task = TaskSpec()
     task.ensure_descriptor()
@@ -5591,285 +8524,332 @@ def run_duo_loop(
         print("[DUO] No batch available; aborting.")
         return
 
-    for r in range(rounds):
-        round_seed = seed + r * 9973
-        round_rng = random.Random(round_seed)
-        batch = get_task_batch(task, seed, freeze_eval=freeze_eval, gen=r)
-        if batch is None:
-            print("[DUO] No batch available; aborting.")
-            break
-        helper_env = universe.library.get_helpers()
-        hint = TaskDetective.detect_pattern(batch)
-        if hint:
-            print(f"[DUO] Detected pattern: {hint}")
-
-        creator_slice = slice_seconds if slice_seconds > 0 else creator_policy.slice_seconds
-        critic_slice = slice_seconds if slice_seconds > 0 else critic_policy.slice_seconds
-
-        print(f"\n{'='*60}\n[DUO ROUND {r+1}/{rounds}] Creator\n{'='*60}")
-        creator_candidates: List[Genome] = [
-            seed_genome(round_rng, hint),
-            _fallback_template_genome(round_rng, hint),
-        ]
-        if universe.best:
-            creator_candidates.append(_repair_genome(universe.best))
-        creator_start = time.time()
-        while time.time() - creator_start < creator_slice:
-            if len(creator_candidates) >= max_candidates:
-                break
-            mode_choice = creator_policy.generator_mode
-            if mode_choice == "template":
-                if reseed_templates:
-                    stmts = round_rng.choice(reseed_templates)
-                    g = Genome(statements=list(stmts), op_tag="reseed")
-                else:
-                    g = seed_genome(round_rng, hint)
-            elif mode_choice == "mutate":
-                parent = round_rng.choice(universe.pool) if universe.pool else seed_genome(round_rng, hint)
-                g = _mutate_genome_with_meta(round_rng, parent, universe.meta, universe.library)
-            else:
-                g = _synthesize_genome(round_rng, universe.pool, hint, universe.library)
-            creator_candidates.append(g)
-
-        print(f"[DUO] Creator proposed {len(creator_candidates)} candidates")
-
-        print(f"\n{'='*60}\n[DUO ROUND {r+1}/{rounds}] Critic\n{'='*60}")
-        critic_start = time.time()
-        gate_fail_reasons: collections.Counter = collections.Counter()
-        validator_fail_reasons: collections.Counter = collections.Counter()
-        scored_empty_count = 0
-        prefiltered: List[Tuple[Genome, EvalResult]] = []
-        seen_hashes: Set[str] = set()
-        duplicate_count = 0
-        total_checked = 0
-        gate_pass = 0
-
-        for g in creator_candidates:
-            if time.time() - critic_start > critic_slice:
+    pipeline = CriticPipeline(workers=critic_workers, capacity=queue_size)
+    try:
+        for r in range(rounds):
+            round_seed = seed + r * 9973
+            round_rng = random.Random(round_seed)
+            batch = get_task_batch(task, seed, freeze_eval=freeze_eval, gen=r)
+            if batch is None:
+                print("[DUO] No batch available; aborting.")
                 break
-            total_checked += 1
-            code_hash = _candidate_hash(g.code)
-            if code_hash in seen_hashes:
-                duplicate_count += 1
-            seen_hashes.add(code_hash)
-
-            ok, reason, pre_res = _prefilter_eval(
-                g,
-                batch,
-                universe.eval_mode,
-                task.name,
-                extra_env=helper_env,
-                validator=validate_program if universe.eval_mode == "program" else validate_code,
-            )
-            record = {
-                "timestamp": now_ms(),
-                "agent_id": "critic",
-                "generation": r,
-                "candidate_hash": code_hash,
-                "gate_ok": ok,
-                "gate_reason": "" if ok else reason,
-                "score_train": pre_res.train if pre_res else None,
-                "score_holdout": pre_res.hold if pre_res else None,
-                "score_stress": pre_res.stress if pre_res else None,
-                "selected": False,
-                "note": "prefilter",
-            }
-            append_blackboard(blackboard_path, record)
+            hint = TaskDetective.detect_pattern(batch)
+            if hint:
+                print(f"[DUO] Detected pattern: {hint}")
+
+            creator_slice = slice_seconds if slice_seconds > 0 else creator_policy.slice_seconds
+            critic_slice = slice_seconds if slice_seconds > 0 else critic_policy.slice_seconds
+
+            # Creator and Critic run as a pipeline: the Creator streams candidates into the bounded
+            # queue while Critic workers prefilter them; candidates that enter the current top-k are
+            # fully evaluated right away. Non-forced Critic work stops at creator_slice + critic_slice.
+            round_start = time.time()
+            critic_deadline = round_start + creator_slice + critic_slice
+            library_snap = universe.library.snapshot()
+            full_batch = _merge_stress(fixed_batch, batch)
+            pipeline.reset()
+            k_sel = max(1, k_full)
+            candidates: List[Genome] = []
+            hashes: List[str] = []
+            pre_results: Dict[int, EvalResult] = {}
+            ranked: List[Tuple[float, int]] = []
+            families: Dict[int, List[Genome]] = {}
+            full_out: Dict[Tuple[int, int], EvalResult] = {}
+            gate_fail_reasons: collections.Counter = collections.Counter()
+            validator_fail_reasons: collections.Counter = collections.Counter()
+            scored_empty_count = 0
+            stats = {"checked": 0, "gate_pass": 0, "full_done": 0}
+
+            def schedule_full(seq: int) -> None:
+                if seq in families:
+                    return
+                # Per-candidate rng keeps refinements independent of worker completion order.
+                refine_rng = random.Random(f"{round_seed}:{hashes[seq]}")
+                families[seq] = [candidates[seq]] + _critic_refine(refine_rng, candidates[seq], universe.meta, universe.library)
+                for j, candidate in enumerate(families[seq]):
+                    pipeline.submit(
+                        "full", (seq, j), _critic_full_job, candidate, full_batch, universe.eval_mode, task.name, library_snap
+                    )
 
-            if not ok:
-                if reason.startswith("hard_gate:"):
-                    gate_fail_reasons[reason.split("hard_gate:", 1)[1]] += 1
-                elif reason.startswith("validator:"):
-                    validator_fail_reasons[reason.split("validator:", 1)[1]] += 1
-                continue
-            gate_pass += 1
-            if pre_res:
-                prefiltered.append((g, pre_res))
-
-        if not prefiltered:
-            scored_empty_count += 1
-            reseed_templates = [_fallback_template_genome(round_rng, hint).statements]
-            append_blackboard(
-                blackboard_path,
-                {
-                    "timestamp": now_ms(),
-                    "agent_id": "critic",
-                    "generation": r,
-                    "candidate_hash": "none",
-                    "gate_ok": False,
-                    "gate_reason": "scored_empty",
-                    "score_train": None,
-                    "score_holdout": None,
-                    "score_stress": None,
-                    "selected": False,
-                    "note": "reseed",
-                },
-            )
-            gate_pass_rate = gate_pass / max(1, total_checked)
-            creator_policy = _adjust_creator_policy(creator_policy, gate_pass_rate, gate_fail_reasons)
-            print("[DUO] No candidates passed prefilter; reseeding templates.")
-            _print_critic_summary(
-                gate_pass=gate_pass,
-                total_checked=total_checked,
-                adopted=False,
-                full_results_count=0,
-                duplicate_count=duplicate_count,
-                scored_empty_count=scored_empty_count,
-                gate_fail_reasons=gate_fail_reasons,
-                validator_fail_reasons=validator_fail_reasons,
-            )
-            continue
+            def handle(results: List[Tuple[str, Any, Any]]) -> None:
+                for kind, tag, out in results:
+                    if kind == "full":
+                        if isinstance(out, Exception):
+                            out = EvalResult(False, float("inf"), float("inf"), float("inf"), float("inf"), 0, float("inf"), f"worker:{type(out).__name__}")
+                        full_out[tag] = out
+                        stats["full_done"] += 1
+                        continue
+                    seq = tag
+                    ok, reason, pre_res = out if not isinstance(out, Exception) else (False, f"worker:{type(out).__name__}", None)
+                    stats["checked"] += 1
+                    append_blackboard(
+                        blackboard_path,
+                        {
+                            "timestamp": now_ms(),
+                            "agent_id": "critic",
+                            "generation": r,
+                            "candidate_hash": hashes[seq],
+                            "gate_ok": ok,
+                            "gate_reason": "" if ok else reason,
+                            "score_train": pre_res.train if pre_res else None,
+                            "score_holdout": pre_res.hold if pre_res else None,
+                            "score_stress": pre_res.stress if pre_res else None,
+                            "selected": False,
+                            "note": "prefilter",
+                        },
+                    )
+                    if not ok:
+                        if reason.startswith("hard_gate:"):
+                            gate_fail_reasons[reason.split("hard_gate:", 1)[1]] += 1
+                        elif reason.startswith("validator:"):
+                            validator_fail_reasons[reason.split("validator:", 1)[1]] += 1
+                        continue
+                    stats["gate_pass"] += 1
+                    if pre_res:
+                        pre_results[seq] = pre_res
+                        entry = (_critic_rank_score(pre_res, critic_policy), seq)
+                        bisect.insort(ranked, entry)
+                        if ranked.index(entry) < k_sel:
+                            schedule_full(seq)
+
+            def offer(g: Genome) -> Optional[int]:
+                code_hash = _candidate_hash(g.code)
+                if not pipeline.admit(code_hash):
+                    return None
+                seq = len(candidates)
+                candidates.append(g)
+                hashes.append(code_hash)
+                pipeline.submit("pre", seq, _critic_prefilter_job, g, batch, universe.eval_mode, task.name, library_snap)
+                handle(pipeline.drain())
+                return seq
+
+            print(f"\n{'='*60}\n[DUO ROUND {r+1}/{rounds}] Creator -> Critic pipeline\n{'='*60}")
+            baselines = [seed_genome(round_rng, hint), _fallback_template_genome(round_rng, hint)]
+            baseline_seqs = [seq for seq in (offer(g) for g in baselines) if seq is not None]
+            proposed = len(baselines)
+            if universe.best:
+                offer(_repair_genome(universe.best))
+                proposed += 1
+            while time.time() - round_start < creator_slice:
+                if proposed >= max_candidates:
+                    break
+                mode_choice = creator_policy.generator_mode
+                if mode_choice == "template":
+                    if reseed_templates:
+                        stmts = round_rng.choice(reseed_templates)
+                        g = Genome(statements=list(stmts), op_tag="reseed")
+                    else:
+                        g = seed_genome(round_rng, hint)
+                elif mode_choice == "mutate":
+                    parent = round_rng.choice(universe.pool) if universe.pool else seed_genome(round_rng, hint)
+                    g = _mutate_genome_with_meta(round_rng, parent, universe.meta, universe.library)
+                else:
+                    g = _synthesize_genome(round_rng, universe.pool, hint, universe.library)
+                proposed += 1
+                offer(g)
 
-        prefiltered.sort(key=lambda t: _critic_rank_score(t[1], critic_policy))
-        selected = prefiltered[: max(1, k_full)]
-        prefilter_map = {_candidate_hash(g.code): res for g, res in prefiltered}
-        baseline_candidates = creator_candidates[:2]
-        baseline_hashes = {_candidate_hash(c.code) for c in baseline_candidates}
-        selected_hashes = {_candidate_hash(g.code) for g, _ in selected}
-        for base in baseline_candidates:
-            base_hash = _candidate_hash(base.code)
-            if base_hash not in selected_hashes:
-                base_res = prefilter_map.get(base_hash)
-                if base_res:
-                    selected.append((base, base_res))
-        for g, pre_res in selected:
-            append_blackboard(
-                blackboard_path,
-                {
-                    "timestamp": now_ms(),
-                    "agent_id": "critic",
-                    "generation": r,
-                    "candidate_hash": _candidate_hash(g.code),
-                    "gate_ok": True,
-                    "gate_reason": "",
-                    "score_train": pre_res.train,
-                    "score_holdout": pre_res.hold,
-                    "score_stress": pre_res.stress,
-                    "selected": True,
-                    "note": "prefilter_selected",
-                },
-            )
+            print(f"[DUO] Creator proposed {proposed} candidates ({pipeline.duplicates} duplicates dropped at insertion)")
 
-        full_results: List[Tuple[Genome, EvalResult]] = []
-        forced_eval = set(baseline_hashes)
-        for g, _ in selected:
-            if time.time() - critic_start > critic_slice and _candidate_hash(g.code) not in forced_eval:
-                break
-            refined = _critic_refine(round_rng, g, universe.meta, universe.library)
-            for candidate in [g] + refined:
-                if time.time() - critic_start > critic_slice and _candidate_hash(candidate.code) not in forced_eval:
+            forced_pre = set(baseline_seqs)
+            while pipeline.has_pending("pre"):
+                if time.time() > critic_deadline and not pipeline.has_pending("pre", forced_pre):
                     break
-                res = _evaluate_candidate(
-                    candidate,
-                    _merge_stress(fixed_batch, batch),
-                    universe.eval_mode,
-                    task.name,
-                    extra_env=helper_env,
-                    validator=validate_program if universe.eval_mode == "program" else validate_code,
-                )
-                if res.ok:
-                    full_results.append((candidate, res))
-                else:
-                    if res.err:
-                        if res.err.startswith("hard_gate:"):
-                            gate_fail_reasons[res.err.split("hard_gate:", 1)[1]] += 1
-                        else:
-                            validator_fail_reasons[res.err] += 1
+                handle(pipeline.drain(timeout=0.05))
+
+            total_checked = stats["checked"]
+            gate_pass = stats["gate_pass"]
+            duplicate_count = pipeline.duplicates
+            prefiltered: List[Tuple[Genome, EvalResult]] = [(candidates[seq], pre_results[seq]) for _, seq in ranked]
+
+            if not prefiltered:
+                pipeline.discard()
+                scored_empty_count += 1
+                reseed_templates = [_fallback_template_genome(round_rng, hint).statements]
                 append_blackboard(
                     blackboard_path,
                     {
                         "timestamp": now_ms(),
                         "agent_id": "critic",
                         "generation": r,
-                        "candidate_hash": _candidate_hash(candidate.code),
-                        "gate_ok": res.ok,
-                        "gate_reason": "" if res.ok else (res.err or ""),
-                        "score_train": res.train if res.ok else None,
-                        "score_holdout": res.hold if res.ok else None,
-                        "score_stress": res.stress if res.ok else None,
+                        "candidate_hash": "none",
+                        "gate_ok": False,
+                        "gate_reason": "scored_empty",
+                        "score_train": None,
+                        "score_holdout": None,
+                        "score_stress": None,
                         "selected": False,
-                        "note": candidate.op_tag,
+                        "note": "reseed",
                     },
                 )
+                gate_pass_rate = gate_pass / max(1, total_checked)
+                creator_policy = _adjust_creator_policy(creator_policy, gate_pass_rate, gate_fail_reasons)
+                print("[DUO] No candidates passed prefilter; reseeding templates.")
+                _print_critic_summary(
+                    gate_pass=gate_pass,
+                    total_checked=total_checked,
+                    adopted=False,
+                    full_results_count=0,
+                    duplicate_count=duplicate_count,
+                    scored_empty_count=scored_empty_count,
+                    gate_fail_reasons=gate_fail_reasons,
+                    validator_fail_reasons=validator_fail_reasons,
+                )
+                continue
 
-        adopted = False
-        full_results_count = len(full_results)
-        if not full_results:
-            scored_empty_count += 1
-            reseed_templates = [_fallback_template_genome(round_rng, hint).statements]
-            append_blackboard(
-                blackboard_path,
-                {
-                    "timestamp": now_ms(),
-                    "agent_id": "critic",
-                    "generation": r,
-                    "candidate_hash": "none",
-                    "gate_ok": False,
-                    "gate_reason": "scored_empty",
-                    "score_train": None,
-                    "score_holdout": None,
-                    "score_stress": None,
-                    "selected": False,
-                    "note": "reseed",
-                },
-            )
-            print("[DUO] No candidates survived full evaluation; reseeding templates.")
-        else:
-            full_results.sort(key=lambda t: t[1].score)
-            best_g, best_res = full_results[0]
-            if best_res.score < universe.best_score:
-                adopted = True
-                universe.best = best_g
-                universe.best_score = best_res.score
-                universe.best_train = best_res.train
-                universe.best_hold = best_res.hold
-                universe.best_stress = best_res.stress
-                universe.best_test = best_res.test
+            selected_seqs = [seq for _, seq in ranked[:k_sel]]
+            for seq in baseline_seqs:
+                if seq not in selected_seqs and seq in pre_results:
+                    selected_seqs.append(seq)
+            for seq in selected_seqs:
+                pre_res = pre_results[seq]
                 append_blackboard(
                     blackboard_path,
                     {
                         "timestamp": now_ms(),
                         "agent_id": "critic",
                         "generation": r,
-                        "candidate_hash": _candidate_hash(best_g.code),
+                        "candidate_hash": hashes[seq],
                         "gate_ok": True,
                         "gate_reason": "",
-                        "score_train": best_res.train,
-                        "score_holdout": best_res.hold,
-                        "score_stress": best_res.stress,
+                        "score_train": pre_res.train,
+                        "score_holdout": pre_res.hold,
+                        "score_stress": pre_res.stress,
                         "selected": True,
-                        "note": "adopted",
+                        "note": "prefilter_selected",
                     },
                 )
-            universe.pool = [g for g, _ in full_results[: max(8, population // 4)]]
-            if len(universe.pool) < population:
-                universe.pool.extend([seed_genome(round_rng, hint) for _ in range(population - len(universe.pool))])
-
-        gate_pass_rate = gate_pass / max(1, total_checked)
-        creator_policy = _adjust_creator_policy(creator_policy, gate_pass_rate, gate_fail_reasons)
-        _print_critic_summary(
-            gate_pass=gate_pass,
-            total_checked=total_checked,
-            adopted=adopted,
-            full_results_count=full_results_count,
-            duplicate_count=duplicate_count,
-            scored_empty_count=scored_empty_count,
-            gate_fail_reasons=gate_fail_reasons,
-            validator_fail_reasons=validator_fail_reasons,
-        )
+                schedule_full(seq)
 
-        gs = GlobalState(
-            "RSI_EXTENDED_v2",
-            now_ms(),
-            now_ms(),
-            seed,
-            asdict(task),
-            [universe.snapshot()],
-            universe.uid,
-            r + 1,
-            mode=mode,
-        )
-        save_state(gs)
+            # Baseline families are always evaluated in full; everything else is cut at the deadline.
+            wanted = {(seq, j) for seq in selected_seqs for j in range(len(families[seq]))}
+            forced_full = {(seq, j) for seq in baseline_seqs if seq in families for j in range(len(families[seq]))}
+            while any(key not in full_out for key in wanted):
+                if time.time() > critic_deadline and all(key in full_out for key in forced_full):
+                    break
+                handle(pipeline.drain(timeout=0.05))
+            pipeline.discard()
+
+            full_results: List[Tuple[Genome, EvalResult]] = []
+            for seq in selected_seqs:
+                for j, candidate in enumerate(families[seq]):
+                    res = full_out.get((seq, j))
+                    if res is None:
+                        continue
+                    if res.ok:
+                        full_results.append((candidate, res))
+                    else:
+                        if res.err:
+                            if res.err.startswith("hard_gate:"):
+                                gate_fail_reasons[res.err.split("hard_gate:", 1)[1]] += 1
+                            else:
+                                validator_fail_reasons[res.err] += 1
+                    append_blackboard(
+                        blackboard_path,
+                        {
+                            "timestamp": now_ms(),
+                            "agent_id": "critic",
+                            "generation": r,
+                            "candidate_hash": _candidate_hash(candidate.code),
+                            "gate_ok": res.ok,
+                            "gate_reason": "" if res.ok else (res.err or ""),
+                            "score_train": res.train if res.ok else None,
+                            "score_holdout": res.hold if res.ok else None,
+                            "score_stress": res.stress if res.ok else None,
+                            "selected": False,
+                            "note": candidate.op_tag,
+                        },
+                    )
+
+            round_wall = max(1e-9, time.time() - round_start)
+            print(
+                f"[DUO] Critic throughput: {stats['full_done'] / round_wall:.2f} full evals/s "
+                f"({stats['full_done']} full, {total_checked} prefiltered, workers={pipeline.workers}, "
+                f"creator throttled {pipeline.throttled_s:.2f}s, round {round_wall:.2f}s)"
+            )
+
+            adopted = False
+            full_results_count = len(full_results)
+            if not full_results:
+                scored_empty_count += 1
+                reseed_templates = [_fallback_template_genome(round_rng, hint).statements]
+                append_blackboard(
+                    blackboard_path,
+                    {
+                        "timestamp": now_ms(),
+                        "agent_id": "critic",
+                        "generation": r,
+                        "candidate_hash": "none",
+                        "gate_ok": False,
+                        "gate_reason": "scored_empty",
+                        "score_train": None,
+                        "score_holdout": None,
+                        "score_stress": None,
+                        "selected": False,
+                        "note": "reseed",
+                    },
+                )
+                print("[DUO] No candidates survived full evaluation; reseeding templates.")
+            else:
+                full_results.sort(key=lambda t: t[1].score)
+                best_g, best_res = full_results[0]
+                if best_res.score < universe.best_score:
+                    adopted = True
+                    universe.best = best_g
+                    universe.best_score = best_res.score
+                    universe.best_train = best_res.train
+                    universe.best_hold = best_res.hold
+                    universe.best_stress = best_res.stress
+                    universe.best_test = best_res.test
+                    append_blackboard(
+                        blackboard_path,
+                        {
+                            "timestamp": now_ms(),
+                            "agent_id": "critic",
+                            "generation": r,
+                            "candidate_hash": _candidate_hash(best_g.code),
+                            "gate_ok": True,
+                            "gate_reason": "",
+                            "score_train": best_res.train,
+                            "score_holdout": best_res.hold,
+                            "score_stress": best_res.stress,
+                            "selected": True,
+                            "note": "adopted",
+                        },
+                    )
+                universe.pool = [g for g, _ in full_results[: max(8, population // 4)]]
+                if len(universe.pool) < population:
+                    universe.pool.extend([seed_genome(round_rng, hint) for _ in range(population - len(universe.pool))])
+
+            gate_pass_rate = gate_pass / max(1, total_checked)
+            creator_policy = _adjust_creator_policy(creator_policy, gate_pass_rate, gate_fail_reasons)
+            _print_critic_summary(
+                gate_pass=gate_pass,
+                total_checked=total_checked,
+                adopted=adopted,
+                full_results_count=full_results_count,
+                duplicate_count=duplicate_count,
+                scored_empty_count=scored_empty_count,
+                gate_fail_reasons=gate_fail_reasons,
+                validator_fail_reasons=validator_fail_reasons,
+            )
+
+            gs = GlobalState(
+                "RSI_EXTENDED_v2",
+                now_ms(),
+                now_ms(),
+                seed,
+                asdict(task),
+                [universe.snapshot()],
+                universe.uid,
+                r + 1,
+                mode=mode,
+            )
+            save_state(gs)
+            jsonl_sink(blackboard_path).flush()
+    finally:
+        pipeline.close()
+        jsonl_sink(blackboard_path).flush()
+        flush_checkpoints()
 
 def run_rsi_loop(
     gens_per_round: int,
@@ -5881,9 +8861,19 @@ def run_rsi_loop(
     freeze_eval: bool = True,
     meta_meta: bool = False,
     update_rule_rounds: int = 0,
+    autopatch_workers: int = 0,
+    ledger_ttl: int = 0,
+    pipeline: bool = False,
 ):
+    """
+    Evolve, then autopatch, each round. With `pipeline`, round r's patch candidates are evaluated
+    in the background against a frozen copy of the state while round r+1 evolves; an accepted patch
+    is applied at the next round boundary (same acceptance rule and rollback as the sequential loop).
+    """
     task = TaskSpec()
     seed = int(time.time()) % 100000
+    # Fork the autopatch server while module globals are still fresh-import state.
+    autopatch_fork_server()
     if meta_meta:
         run_meta_meta(
             seed=seed,
@@ -5908,66 +8898,133 @@ def run_rsi_loop(
         print("[RSI] No batch available; aborting.")
         return
 
-    for r in range(rounds):
-        print(f"\n{'='*60}\n[RSI ROUND {r+1}/{rounds}]\n{'='*60}")
-        print(f"[EVOLVE] {gens_per_round} generations...")
-        gs = run_multiverse(seed, task, gens_per_round, pop, n_univ, resume=(r > 0), mode=mode, freeze_eval=freeze_eval)
-        best_snapshot = next((u for u in gs.universes if u.get("uid") == gs.selected_uid), None)
-        best_data = (best_snapshot or {}).get("best")
-        best_code = None
-        if isinstance(best_data, dict):
-            if mode == "learner":
-                best_code = LearnerGenome(**best_data).code
-            else:
-                best_code = Genome(**best_data).code
-        if best_code and best_code != "none":
-            gate_ok, gate_reason = _hard_gate_ok(best_code, fixed_batch, mode, task.name)
-            if not gate_ok:
-                print(f"[RSI] Hard gate failed for best candidate ({gate_reason}); rejecting before scoring/autopatch.")
-                archive["current"] = None
-                archive["consecutive"] = 0
-                archive["entries"] = []
-                _save_rsi_archive(archive_path, archive)
-                continue
-        recent_scores = load_recent_scores(STATE_DIR / "run_log.jsonl", 5)
-        forced_applied = False
-        if is_300s_stagnation(recent_scores):
-            print("[STAGNATION] 300s plateau detected for >=5 gens. Forcing L1/L3 autopatch.")
-            forced = run_deep_autopatch([1, 3], candidates=4, apply=True, mode=mode)
-            forced_applied = bool(forced.get("applied"))
-            if forced_applied:
+    loop_start = time.time()
+    # The autopatch ledger ages once per RSI round, continuing from the round it was last saved at.
+    ledger_base = AutopatchLedger(STATE_DIR / "autopatch_ledger.json").saved_round
+    background = concurrent.futures.ThreadPoolExecutor(max_workers=1) if pipeline else None
+    pending: Optional[concurrent.futures.Future] = None
+
+    def collect_pending() -> None:
+        nonlocal pending
+        if pending is None:
+            return
+        wait_start = time.time()
+        out = pending.result()
+        pending = None
+        print(f"[PIPELINE] Background autopatch collected (waited {time.time() - wait_start:.1f}s).")
+        if out["forced"] is not None:
+            if _apply_pipelined_patch(out["forced"]):
                 print("[RSI] Self-modified via forced L1/L3 patch.")
-            else:
-                print("[STAGNATION] Forced patch rejected. Launching meta-meta acceleration.")
-                run_meta_meta(
-                    seed=seed,
-                    episodes=1,
-                    gens_per_episode=gens_per_round,
-                    pop=pop,
-                    n_univ=n_univ,
-                    freeze_eval=freeze_eval,
-                    state_dir=STATE_DIR,
-                    eval_every=1,
-                    few_shot_gens=max(3, gens_per_round // 2),
-                )
-                print("[STAGNATION] Meta-meta episode completed.")
-        if not forced_applied:
-            print(f"[AUTOPATCH] Trying L{levels}...")
-            result = run_deep_autopatch(levels, candidates=4, apply=True, mode=mode)
-            if result.get("applied"):
-                print("[RSI] Self-modified! Reloading...")
-        if update_rule_rounds > 0:
-            print(f"[META] Running update-rule search for {update_rule_rounds} rounds...")
-            run_update_rule_search(
-                seed=seed + r * 127,
-                rounds=update_rule_rounds,
-                gens_per_round=max(3, gens_per_round // 2),
-                pop=max(16, pop // 2),
+                return
+            print("[STAGNATION] Forced patch rejected. Launching meta-meta acceleration.")
+            run_meta_meta(
+                seed=seed,
+                episodes=1,
+                gens_per_episode=gens_per_round,
+                pop=pop,
+                n_univ=n_univ,
                 freeze_eval=freeze_eval,
                 state_dir=STATE_DIR,
+                eval_every=1,
+                few_shot_gens=max(3, gens_per_round // 2),
             )
+            print("[STAGNATION] Meta-meta episode completed.")
+        _apply_pipelined_patch(out["result"])
 
-    print(f"\n[RSI LOOP COMPLETE] {rounds} rounds finished")
+    try:
+        for r in range(rounds):
+            print(f"\n{'='*60}\n[RSI ROUND {r+1}/{rounds}]\n{'='*60}")
+            ledger_round = ledger_base + r + 1
+            print(f"[EVOLVE] {gens_per_round} generations...")
+            gs = run_multiverse(seed, task, gens_per_round, pop, n_univ, resume=(r > 0), mode=mode, freeze_eval=freeze_eval)
+            collect_pending()  # round boundary: apply what the previous round's background search accepted
+            best_snapshot = next((u for u in gs.universes if u.get("uid") == gs.selected_uid), None)
+            best_data = (best_snapshot or {}).get("best")
+            best_code = None
+            if isinstance(best_data, dict):
+                if mode == "learner":
+                    best_code = LearnerGenome(**best_data).code
+                else:
+                    best_code = Genome(**best_data).code
+            if best_code and best_code != "none":
+                gate_ok, gate_reason = _hard_gate_ok(best_code, fixed_batch, mode, task.name)
+                if not gate_ok:
+                    print(f"[RSI] Hard gate failed for best candidate ({gate_reason}); rejecting before scoring/autopatch.")
+                    archive["current"] = None
+                    archive["consecutive"] = 0
+                    archive["entries"] = []
+                    _save_rsi_archive(archive_path, archive)
+                    continue
+            recent_scores = load_recent_scores(STATE_DIR / "run_log.jsonl", 5)
+            stagnant = is_300s_stagnation(recent_scores)
+            if background is not None:
+                if stagnant:
+                    print("[STAGNATION] 300s plateau detected for >=5 gens. Forcing L1/L3 autopatch in the background.")
+                snapshot_dir = Path(tempfile.mkdtemp(prefix="rsi_pipeline_"))
+                _clone_state_dir(STATE_DIR, snapshot_dir)
+                print(f"[AUTOPATCH] Trying L{levels} in the background...")
+                pending = background.submit(
+                    _pipelined_autopatch, snapshot_dir, levels, stagnant, mode, autopatch_workers, ledger_ttl, ledger_round
+                )
+            else:
+                forced_applied = False
+                if stagnant:
+                    print("[STAGNATION] 300s plateau detected for >=5 gens. Forcing L1/L3 autopatch.")
+                    forced = run_deep_autopatch(
+                        [1, 3],
+                        candidates=4,
+                        apply=True,
+                        mode=mode,
+                        workers=autopatch_workers,
+                        ledger_ttl=ledger_ttl,
+                        ledger_round=ledger_round,
+                    )
+                    forced_applied = bool(forced.get("applied"))
+                    if forced_applied:
+                        print("[RSI] Self-modified via forced L1/L3 patch.")
+                    else:
+                        print("[STAGNATION] Forced patch rejected. Launching meta-meta acceleration.")
+                        run_meta_meta(
+                            seed=seed,
+                            episodes=1,
+                            gens_per_episode=gens_per_round,
+                            pop=pop,
+                            n_univ=n_univ,
+                            freeze_eval=freeze_eval,
+                            state_dir=STATE_DIR,
+                            eval_every=1,
+                            few_shot_gens=max(3, gens_per_round // 2),
+                        )
+                        print("[STAGNATION] Meta-meta episode completed.")
+                if not forced_applied:
+                    print(f"[AUTOPATCH] Trying L{levels}...")
+                    result = run_deep_autopatch(
+                        levels,
+                        candidates=4,
+                        apply=True,
+                        mode=mode,
+                        workers=autopatch_workers,
+                        ledger_ttl=ledger_ttl,
+                        ledger_round=ledger_round,
+                    )
+                    if result.get("applied"):
+                        print("[RSI] Self-modified! Reloading...")
+            if update_rule_rounds > 0:
+                print(f"[META] Running update-rule search for {update_rule_rounds} rounds...")
+                run_update_rule_search(
+                    seed=seed + r * 127,
+                    rounds=update_rule_rounds,
+                    gens_per_round=max(3, gens_per_round // 2),
+                    pop=max(16, pop // 2),
+                    freeze_eval=freeze_eval,
+                    state_dir=STATE_DIR,
+                )
+        collect_pending()
+    finally:
+        if background is not None:
+            background.shutdown(wait=True, cancel_futures=True)
+    elapsed = max(1e-9, time.time() - loop_start)
+    print(f"\n[RSI LOOP COMPLETE] {rounds} rounds finished ({rounds * 3600.0 / elapsed:.1f} rounds/hour)")
 
 
 # ---------------------------
@@ -5994,6 +9051,111 @@ def cmd_selftest(args):
     algo_code = "def run(inp):\n    return inp\n"
     assert validate_algo_program(algo_code)[0]
 
+    strat = MetaState().strategy
+    cross = strat.crossover_fn()
+    assert cross is strat.crossover_fn()
+    assert isinstance(cross(["a", "b"], ["c", "d"], random.Random(0)), list)
+    assert simplify_statements(["v1 = 2 * 3", "return list(sorted(x))", "v2 = 1"]) == ["return sorted(x)"]
+    assert lexicase_select([[0.0, 5.0], [5.0, 0.0], [6.0, 6.0]], 20, random.Random(0), [0.0, 0.0]).count(2) == 0
+    with tempfile.TemporaryDirectory() as td:
+        ledger_path = Path(td) / "ledger.json"
+        ledger = AutopatchLedger(ledger_path, ttl_rounds=2, rsi_round=1)
+        ledger.put("probe", "k", score=1.5)
+        ledger.save()
+        AutopatchLedger(ledger_path).save()  # standalone autopatch runs do not age the ledger
+        assert AutopatchLedger(ledger_path, ttl_rounds=2, rsi_round=2).get("probe", "k")["score"] == 1.5
+        assert AutopatchLedger(ledger_path, ttl_rounds=2, rsi_round=3).get("probe", "k") is None
+        assert AutopatchLedger(ledger_path).round == 1
+
+        script = Path(td) / "script.py"
+        script.write_text("X = 1\n", encoding="utf-8")
+        recorder = AutopatchForkServer()
+        sent: List[Dict[str, Any]] = []
+        recorder.launch = sent.append
+        job = _autopatch_job(recorder, script, None, Path(td) / "job", "solver", "poly2", 0, 1, 4, 1, False)
+        script.write_text("X = 2\n", encoding="utf-8")  # an accepted source patch lands before launch
+        job["launch"]()
+        assert sent[0]["source"] == "X = 2\n"
+
+        store = CheckpointStore(Path(td) / "checkpoints")
+        snap = {"version": 1, "universes": [{"uid": 0, "pool": [{"g": i} for i in range(3)], "best": {"g": 0}, "history": [1, 2]}]}
+        store.commit(state=snap, operators_lib={"op": {"steps": []}})
+        snap["universes"][0]["history"] = [2, 3]
+        snap["universes"][0]["pool"].append({"g": 9})
+        full = store.log_path.stat().st_size
+        assert store.commit(state=snap) < full and store.commit(state=snap) == 0
+        with store.log_path.open("a") as f:
+            f.write('{"patch": {"{": ')  # torn write
+        replayed = CheckpointStore(store.root).latest()
+        assert replayed["state"] == snap and replayed["operators_lib"] == {"op": {"steps": []}}
+        snap["universes"][0]["pool"] = [{"g": 9}]
+        store.commit(state=snap)
+        store.compact()
+        assert CheckpointStore(store.root).latest()["state"] == snap
+        assert len(store.objects_path.read_text().splitlines()) == 3
+        snap["universes"][0]["pool"] = [{"gid": f"g{i}", "statements": [f"v{i}"]} for i in range(3)]
+        store.commit(state=snap)
+        objects = len(store.objects)
+        snap["universes"][0]["pool"][1]["statements"].append("v9")  # same gid, new content
+        store.commit(state=snap)
+        assert len(store.objects) == objects + 1 and CheckpointStore(store.root).latest()["state"] == snap
+
+        sink = JsonlSink(Path(td) / "bb.jsonl", max_records=3, max_seconds=60.0, rotate_bytes=20)
+        sink.write({"i": 0})
+        sink.write({"i": 1})
+        assert not sink.path.exists()
+        sink.write({"i": 2})  # third record fills the buffer: one append, then rotation
+        assert sink.flushes == 1 and not sink.path.exists() and (Path(td) / "bb.jsonl.1.gz").exists()
+        sink.write({"i": 3})
+        sink.flush()
+        assert sink.path.read_text() == '{"i": 3}\n'
+
+        run_log = RunLogger(Path(td) / "run_log.jsonl")
+        for gen in range(6):
+            for task_id in ("poly2", "sort"):
+                run_log.log(gen=gen, task_id=task_id, mode="solver", score_hold=float(gen), score_stress=0.0, score_test=0.0,
+                            runtime_ms=0, nodes=1, code_hash="h", accepted=False, novelty=0.0, meta_policy_params={})
+            run_log.flush()
+        assert [r["gen"] for r in read_jsonl_tail(run_log.path, 3, block_size=16)] == [4, 5, 5]
+        assert [r["gen"] for r in read_run_log_range(run_log.path, "sort::solver", 2, 3)] == [2, 3]
+        indexed = generate_report(run_log.path, 2)
+        jsonl_index_path(run_log.path).unlink()
+        assert generate_report(run_log.path, 2) == indexed
+        columns = convert_run_log(run_log.path, chunk_rows=5)
+        assert list(columns.records()) == read_jsonl_tail(run_log.path, 12)
+        assert generate_report_columnar(columns.root, 2) == indexed
+        report_state = Path(td) / "report_state.json"
+        assert generate_report(run_log.path, 2, report_state) == indexed
+        run_log.log(gen=0, task_id="sort", mode="solver", score_hold=9.0, score_stress=0.0, score_test=0.0,
+                    runtime_ms=0, nodes=1, code_hash="h", accepted=False, novelty=0.0, meta_policy_params={})
+        run_log.flush()
+        assert ReportAggregator.load(report_state, 2).update(run_log.path) == 1
+        assert generate_report(run_log.path, 2, report_state) == generate_report(run_log.path, 2) != indexed
+        with (columns.root / "dict" / "task_id.jsonl").open("a") as f:
+            f.write('"to')  # torn dictionary entry
+        run_log.log(gen=6, task_id="tsp", mode="solver", score_hold=1.0, score_stress=0.0, score_test=0.0,
+                    runtime_ms=0, nodes=1, code_hash="h", accepted=False, novelty=0.0, meta_policy_params={})
+        run_log.flush()
+        columns = convert_run_log(run_log.path, chunk_rows=5)
+        assert [r["task_id"] for r in ColumnarRunLog(columns.root).records()][-3:] == ["sort", "sort", "tsp"]
+
+        rows = [{"task_id": "sort", "checkpoint": {"last_ms": i / 8, "written": i}} for i in range(40)]
+        columns = ColumnarRunLog(Path(td) / "unique.cols", chunk_rows=8, dict_limit=4)
+        columns.append(rows[:20])
+        columns.append(rows[20:] + [{"task_id": "sort"}])
+        assert list(ColumnarRunLog(columns.root).records()) == rows + [{"task_id": "sort"}]
+        assert len(columns._dict("checkpoint")) == 0 and columns._dict("task_id") == ['"sort"']
+
+    writer = CheckpointWriter(maxsize=1)
+    gate, written = threading.Event(), []
+    writer.submit("a", lambda: gate.wait(5))
+    writer.submit("b", lambda: written.append(1))
+    writer.submit("b", lambda: written.append(2))  # coalesces while "a" is still writing
+    gate.set()
+    writer.flush()
+    writer.close()
+    assert written == [2] and writer.coalesced == 1
+
     print("[selftest] OK")
     return 0
 
@@ -6027,8 +9189,11 @@ def cmd_evolve(args):
         save_every=args.save_every,
         mode=mode,
         freeze_eval=args.freeze_eval,
+        genome_repr=args.genome_repr,
+        selection_mode=args.selection,
+        lexicase_rate=args.lexicase_rate,
     )
-    print(f"\n[OK] State saved to {STATE_DIR / 'state.json'}")
+    print(f"\n[OK] State saved to {STATE_DIR / 'checkpoints'}")
     return 0
 
 def cmd_learner_evolve(args):
@@ -6046,7 +9211,7 @@ def cmd_learner_evolve(args):
         mode="learner",
         freeze_eval=args.freeze_eval,
     )
-    print(f"\n[OK] State saved to {STATE_DIR / 'state.json'}")
+    print(f"\n[OK] State saved to {STATE_DIR / 'checkpoints'}")
     return 0
 
 def cmd_best(args):
@@ -6082,6 +9247,9 @@ def cmd_rsi_loop(args):
         freeze_eval=args.freeze_eval,
         meta_meta=args.meta_meta,
         update_rule_rounds=args.update_rule_rounds,
+        autopatch_workers=args.autopatch_workers,
+        ledger_ttl=args.ledger_ttl,
+        pipeline=args.pipeline,
     )
     return 0
 
@@ -6096,6 +9264,8 @@ def cmd_update_rule_search(args):
         pop=args.population,
         freeze_eval=args.freeze_eval,
         state_dir=STATE_DIR,
+        workers=args.workers,
+        race=args.race,
     )
     return 0
 
@@ -6112,6 +9282,8 @@ def cmd_duo_loop(args):
         freeze_eval=args.freeze_eval,
         population=args.population,
         max_candidates=args.max_candidates,
+        critic_workers=args.critic_workers,
+        queue_size=args.queue_size,
     )
     return 0
 
@@ -6129,6 +9301,7 @@ def cmd_meta_meta(args):
         state_dir=STATE_DIR,
         eval_every=args.eval_every,
         few_shot_gens=args.few_shot_gens,
+        workers=args.workers,
     )
     return 0
 
@@ -6145,6 +9318,7 @@ def cmd_task_switch(args):
         n_univ=args.universes,
         freeze_eval=args.freeze_eval,
         state_dir=STATE_DIR,
+        workers=args.workers,
     )
     print(json.dumps(result, indent=2))
     return 0
@@ -6152,7 +9326,11 @@ def cmd_task_switch(args):
 def cmd_report(args):
     global STATE_DIR
     STATE_DIR = Path(args.state_dir)
-    report = generate_report(STATE_DIR / "run_log.jsonl", args.few_shot_gens)
+    if args.columnar:
+        store = convert_run_log(STATE_DIR / "run_log.jsonl")
+        report = generate_report_columnar(store.root, args.few_shot_gens)
+    else:
+        report = generate_report(STATE_DIR / "run_log.jsonl", args.few_shot_gens, STATE_DIR / "report_state.json")
     print(json.dumps(report, indent=2))
     return 0
 
@@ -6183,6 +9361,9 @@ def build_parser():
     e.add_argument("--state-dir", default=".rsi_state")
     e.add_argument("--freeze-eval", action=argparse.BooleanOptionalAction, default=True)
     e.add_argument("--mode", default="", choices=["", "solver", "algo"])
+    e.add_argument("--genome-repr", default="str", choices=["str", "ast"])
+    e.add_argument("--selection", default="score", choices=["score", "lexicase"])
+    e.add_argument("--lexicase-rate", type=float, default=0.25, help="fraction of train cases per generation")
     e.set_defaults(fn=cmd_evolve)
 
     le = sub.add_parser("learner-evolve")
@@ -6213,6 +9394,9 @@ def build_parser():
     r.add_argument("--freeze-eval", action=argparse.BooleanOptionalAction, default=True)
     r.add_argument("--meta-meta", action="store_true", help="Run meta-meta loop instead of standard RSI rounds")
     r.add_argument("--update-rule-rounds", type=int, default=0, help="Rounds of update-rule search per RSI round")
+    r.add_argument("--autopatch-workers", type=int, default=0, help="Concurrent autopatch evaluations (0 = CPU count)")
+    r.add_argument("--ledger-ttl", type=int, default=0, help="Re-evaluate cached autopatch results after N RSI loop rounds (0 = never)")
+    r.add_argument("--pipeline", action="store_true", help="Evaluate round r's patches in the background while round r+1 evolves")
     r.set_defaults(fn=cmd_rsi_loop)
 
     dl = sub.add_parser("duo-loop")
@@ -6224,6 +9408,8 @@ def build_parser():
     dl.add_argument("--mode", default="solver", choices=["solver", "algo", "program"])
     dl.add_argument("--population", type=int, default=64)
     dl.add_argument("--max-candidates", type=int, default=512)
+    dl.add_argument("--critic-workers", type=int, default=0, help="Critic worker processes (0 = CPU count)")
+    dl.add_argument("--queue-size", type=int, default=32, help="Max candidates queued for the Critic")
     dl.add_argument("--state-dir", default=".rsi_state")
     dl.add_argument("--freeze-eval", action=argparse.BooleanOptionalAction, default=True)
     dl.set_defaults(fn=cmd_duo_loop)
@@ -6250,6 +9436,7 @@ def build_parser():
     mm.add_argument("--freeze-eval", action=argparse.BooleanOptionalAction, default=True)
     mm.add_argument("--eval-every", type=int, default=4)
     mm.add_argument("--few-shot-gens", type=int, default=10)
+    mm.add_argument("--workers", type=int, default=0, help="Policy episode processes (0 = CPU count)")
     mm.set_defaults(fn=cmd_meta_meta)
 
     ts = sub.add_parser("task-switch")
@@ -6262,6 +9449,7 @@ def build_parser():
     ts.add_argument("--universes", type=int, default=2)
     ts.add_argument("--state-dir", default=".rsi_state")
     ts.add_argument("--freeze-eval", action=argparse.BooleanOptionalAction, default=True)
+    ts.add_argument("--workers", type=int, default=0, help="Policy episode processes (0 = CPU count)")
     ts.set_defaults(fn=cmd_task_switch)
 
     tb = sub.add_parser("transfer-bench")
@@ -6276,6 +9464,7 @@ def build_parser():
     rp = sub.add_parser("report")
     rp.add_argument("--state-dir", default=".rsi_state")
     rp.add_argument("--few-shot-gens", type=int, default=10)
+    rp.add_argument("--columnar", action="store_true", help="convert run_log.jsonl to run_log.cols (incremental) and report from its columns")
     rp.set_defaults(fn=cmd_report)
 
     inv = sub.add_parser("invention")
@@ -6290,6 +9479,8 @@ def build_parser():
     ur.add_argument("--population", type=int, default=32)
     ur.add_argument("--state-dir", default=".rsi_state")
     ur.add_argument("--freeze-eval", action=argparse.BooleanOptionalAction, default=True)
+    ur.add_argument("--workers", type=int, default=0, help="Rule evaluation processes (0 = CPU count)")
+    ur.add_argument("--race", action="store_true", help="Eliminate the worse half of the rules after half the generations")
     ur.set_defaults(fn=cmd_update_rule_search)
 
     return p
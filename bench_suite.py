@@ -0,0 +1,276 @@
+#!/usr/bin/env python
+"""
+Microbenchmark Suite for the RSI engines
+Benchmarks: Weighted Sampling, Program Compilation, Structural Sharing, Batch Evaluation
+"""
+
+import copy
+import random
+import sys
+import time
+import tracemalloc
+
+from weighted_sampling import VersionedWeights, WeightedSampler, build_table
+
+
+def _timeit(fn, repeat=3):
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+
+def _linear_scan(weights, rng):
+    total = sum(weights)
+    r = rng.random() * total
+    acc = 0.0
+    for i, w in enumerate(weights):
+        acc += w
+        if r <= acc:
+            return i
+    return len(weights) - 1
+
+
+def bench_weighted_sampling(draws=20000):
+    """Bench 1: linear-scan sampling vs cached alias/bisect tables"""
+    print("\n" + "="*60)
+    print("BENCH 1: Weighted Sampling")
+    print("="*60)
+
+    rng = random.Random(0)
+    print(f"{'n':>6} {'linear':>10} {'choices':>10} {'bisect':>10} {'alias':>10} {'dict':>10} {'versioned':>10}  (us/draw)")
+    for n in (11, 27, 256, 4096):
+        weights = [rng.uniform(0.1, 8.0) for _ in range(n)]
+        mapping = {f"k{i}": w for i, w in enumerate(weights)}
+        versioned = VersionedWeights(mapping)
+        keys = list(mapping)
+        cum = build_table(weights, method="bisect")
+        alias = build_table(weights, method="alias")
+        sampler = WeightedSampler()
+        v_sampler = WeightedSampler()
+        k = max(200, draws // max(1, n // 64)) if n > 256 else draws
+
+        t_lin = _timeit(lambda: [_linear_scan(weights, rng) for _ in range(k)])
+        t_cho = _timeit(lambda: [rng.choices(keys, weights=weights, k=1)[0] for _ in range(k)])
+        t_bis = _timeit(lambda: [cum.sample(rng) for _ in range(k)])
+        t_ali = _timeit(lambda: [alias.sample(rng) for _ in range(k)])
+        t_smp = _timeit(lambda: [sampler.sample(rng, mapping) for _ in range(k)])
+        t_ver = _timeit(lambda: [v_sampler.sample(rng, versioned) for _ in range(k)])
+        us = lambda t: 1e6 * t / k
+        print(f"{n:>6} {us(t_lin):>10.3f} {us(t_cho):>10.3f} {us(t_bis):>10.3f} {us(t_ali):>10.3f} {us(t_smp):>10.3f} {us(t_ver):>10.3f}")
+
+    # Distribution sanity: alias table frequencies follow the weights.
+    weights = [1.0, 2.0, 3.0, 4.0]
+    table = build_table(weights)
+    counts = [0] * len(weights)
+    for _ in range(40000):
+        counts[table.sample(rng)] += 1
+    freqs = [c / 40000 for c in counts]
+    expected = [w / sum(weights) for w in weights]
+    max_dev = max(abs(f - e) for f, e in zip(freqs, expected))
+    print(f"Alias frequencies {[round(f, 3) for f in freqs]} vs expected {[round(e, 3) for e in expected]}")
+
+    # Rank selection: per-pick re-sort (old) vs sort-once + alias (new), one generation of picks.
+    from rsi_new_engine import _make_selector
+    pop = 512
+    losses = [rng.random() for _ in range(pop)]
+
+    def rank_resort():
+        for _ in range(pop):
+            indices = sorted(range(pop), key=lambda i: losses[i])
+            w = [1.0 / (i + 1) for i in range(pop)]
+            idx = _linear_scan(w, rng)
+            _ = indices[idx]
+
+    def rank_once():
+        select = _make_selector("rank", losses)
+        for _ in range(pop):
+            select(rng)
+
+    t_old = _timeit(rank_resort, repeat=1)
+    t_new = _timeit(rank_once, repeat=1)
+    print(f"Rank selection, {pop} picks: resort-per-pick {t_old*1e3:.1f} ms, sort-once {t_new*1e3:.2f} ms")
+
+    if max_dev < 0.02:
+        print("✅ PASS: Cached samplers match the weight distribution")
+        return True
+    print(f"❌ FAIL: Alias frequencies deviate by {max_dev:.3f}")
+    return False
+
+
+def bench_program_compilation(pop=120):
+    """Bench 2: rsi_engine evaluate_program, interpreted vs compiled programs"""
+    print("\n" + "="*60)
+    print("BENCH 2: Program Compilation (rsi_engine)")
+    print("="*60)
+
+    import rsi_engine as R
+    registry = copy.deepcopy(R.DSL_OPERATORS)
+    registry["compose_sin_square"] = {"arity": 1, "kind": "compose", "sequence": ["sin", "square"]}
+    registry["compose_abs_compose_sin_square"] = {"arity": 1, "kind": "compose", "sequence": ["abs", "compose_sin_square"]}
+    cfg = R.MetaConfig.from_dict(R.DEFAULT_META_CONFIG)
+    cfg = R.sync_meta_config(cfg, registry)
+    tasks = list(R.build_tasks().values())
+    rng = random.Random(0)
+    ok = True
+    print(f"{'mode':>10} {'interp':>10} {'compiled':>10} {'speedup':>8}  (evals/s, compile cost included)")
+    for mode in ("linear_gp", "tree_gp", "stack_gp"):
+        cfg.architecture_mode = mode
+        population = [R.random_program(cfg, registry, rng) for _ in range(pop)]
+
+        def evaluate(compiled):
+            R.COMPILE_PROGRAMS = compiled
+            R._COMPILED_FACTORIES.clear()
+            programs = copy.deepcopy(population)
+            t0 = time.perf_counter()
+            scores = []
+            for task in tasks:
+                for prog in programs:
+                    try:
+                        scores.append(R.evaluate_program(prog, task, cfg, registry, 7).total_score)
+                    except (ValueError, OverflowError) as exc:
+                        scores.append(type(exc).__name__)
+            return time.perf_counter() - t0, scores
+
+        t_int, s_int = min(evaluate(False) for _ in range(2))
+        t_cmp, s_cmp = min(evaluate(True) for _ in range(2))
+        n = pop * len(tasks)
+        print(f"{mode:>10} {n / t_int:>10.0f} {n / t_cmp:>10.0f} {t_int / t_cmp:>7.2f}x")
+        ok = ok and [repr(v) for v in s_int] == [repr(v) for v in s_cmp]
+    R.COMPILE_PROGRAMS = True
+
+    if ok:
+        print("✅ PASS: Compiled programs score identically to the interpreters")
+        return True
+    print("❌ FAIL: Compiled and interpreted scores differ")
+    return False
+
+
+def _records(program):
+    """All instruction/node objects reachable from a rsi_engine program."""
+    if hasattr(program, "root"):
+        stack, out = [program.root], []
+        while stack:
+            node = stack.pop()
+            out.append(node)
+            stack.extend(node.children)
+        return out
+    return list(program.instructions)
+
+
+def bench_structural_sharing(sizes=(1000, 10000)):
+    """Bench 3: rsi_engine generation step (update_rule_bandit) at large populations"""
+    print("\n" + "="*60)
+    print("BENCH 3: Structural Sharing (rsi_engine)")
+    print("="*60)
+
+    import rsi_engine as R
+    registry = copy.deepcopy(R.DSL_OPERATORS)
+    cfg = R.sync_meta_config(R.MetaConfig.from_dict(R.DEFAULT_META_CONFIG), registry)
+    strategy = R.SearchStrategy("balanced", mutation_scale=1.0, elite_fraction=0.2)
+    ok = True
+    print(f"{'mode':>10} {'pop':>6} {'ms/gen':>9} {'peak KB':>9} {'shared':>7}")
+    for mode in ("linear_gp", "tree_gp", "stack_gp"):
+        cfg.architecture_mode = mode
+        for n in sizes:
+            rng = random.Random(n)
+            population = [R.random_program(cfg, registry, rng) for _ in range(n)]
+            scores = [rng.random() for _ in range(n)]
+            before = [repr(p) for p in population[:200]]
+            step = lambda: R.update_rule_bandit(population, scores, cfg, registry, strategy, random.Random(1))
+            t_gen = _timeit(step, repeat=2)
+            tracemalloc.start()
+            children = step()
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            parent_ids = {id(r) for p in population for r in _records(p)}
+            child_records = [r for p in children for r in _records(p)]
+            shared = sum(1 for r in child_records if id(r) in parent_ids) / max(1, len(child_records))
+            print(f"{mode:>10} {n:>6} {t_gen*1e3:>9.1f} {peak/1024:>9.0f} {shared:>6.0%}")
+            ok = ok and before == [repr(p) for p in population[:200]] and shared > 0.5
+
+    if ok:
+        print("✅ PASS: Children share structure and parents are left unchanged")
+        return True
+    print("❌ FAIL: Parents changed or children copied their structure")
+    return False
+
+
+def bench_batch_evaluation(generations=5):
+    """Bench 4: rsi_new_engine evaluate_population, per-sample Python vs NumPy batches"""
+    print("\n" + "="*60)
+    print("BENCH 4: Batch Evaluation (rsi_new_engine)")
+    print("="*60)
+
+    import rsi_new_engine as N
+    if N.np is None:
+        print("NumPy not installed: timing the pure-Python fallback only")
+    ok = True
+    print(f"{'repr':>10} {'python':>10} {'numpy':>10}  (ms/generation, 64 programs x 3 tasks x 16 samples)")
+    for kind in ("linear_gp", "tree_prog"):
+        cfg = N.default_system_config()
+        cfg.repr_cfg.kind = kind
+        rng = random.Random(0)
+        tasks = N.generate_tasks(cfg.task_cfg, rng)
+        rep = N.build_representation(cfg.repr_cfg, cfg.task_cfg.num_inputs, cfg.task_cfg.output_dim)
+        population = [rep.random_program(rng) for _ in range(cfg.population_size)]
+
+        def run(use_numpy):
+            N.USE_NUMPY = use_numpy
+            gen_rng = random.Random(1)
+            t0 = time.perf_counter()
+            losses = [N.evaluate_population(rep, population, tasks, cfg, gen_rng)[0] for _ in range(generations)]
+            return (time.perf_counter() - t0) / generations, losses
+
+        t_py, l_py = run(False)
+        t_np = float("nan")
+        if N.np is not None:
+            t_np, l_np = run(True)
+            for a, b in zip(sum(l_py, []), sum(l_np, [])):
+                ok = ok and (a == b or abs(a - b) <= 1e-9 * max(1.0, abs(a)) or (a != a and b != b))
+        print(f"{kind:>10} {t_py*1e3:>10.1f} {t_np*1e3:>10.1f}")
+    N.USE_NUMPY = True
+
+    if ok:
+        print("✅ PASS: Batch losses match the per-sample interpreters")
+        return True
+    print("❌ FAIL: NumPy batch losses differ from the per-sample interpreters")
+    return False
+
+
+def run_all_benchmarks():
+    """Run the microbenchmark suite"""
+    print("\n" + "█"*60)
+    print("  RSI engines - Microbenchmark Suite")
+    print("█"*60)
+
+    benches = [
+        ("Weighted Sampling", bench_weighted_sampling),
+        ("Program Compilation", bench_program_compilation),
+        ("Structural Sharing", bench_structural_sharing),
+        ("Batch Evaluation", bench_batch_evaluation),
+    ]
+
+    results = []
+    for name, bench_func in benches:
+        try:
+            results.append((name, bench_func()))
+        except Exception as e:
+            print(f"\n❌ EXCEPTION in {name}: {e}")
+            import traceback
+            traceback.print_exc()
+            results.append((name, False))
+
+    print("\n" + "="*60)
+    print("SUMMARY")
+    print("="*60)
+    for name, result in results:
+        status = "✅ PASS" if result else "❌ FAIL"
+        print(f"{status}: {name}")
+    return all(r for _, r in results)
+
+
+if __name__ == "__main__":
+    sys.exit(0 if run_all_benchmarks() else 1)
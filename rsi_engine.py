@@ -1,15 +1,21 @@
 import argparse
 import ast
+from array import array
+import concurrent.futures
 import copy
+import hashlib
 import json
 import math
+import os
 import pprint
 import random
 import statistics
 import time
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from weighted_sampling import build_table
 
 META_DIR = Path(".rsi_meta")
 RUNS_DIR = META_DIR / "runs"
@@ -159,9 +165,11 @@ def load_meta_config() -> MetaConfig:
 
 
 def save_meta_config(meta_config: MetaConfig) -> None:
-    """Persist MetaConfig to disk."""
+    """Persist MetaConfig to disk (atomic replace, so readers never see a partial file)."""
     ensure_meta_dirs()
-    META_CONFIG_FILE.write_text(json.dumps(meta_config.to_dict(), indent=2))
+    tmp = META_CONFIG_FILE.with_suffix(f".tmp{os.getpid()}")
+    tmp.write_text(json.dumps(meta_config.to_dict(), indent=2))
+    os.replace(tmp, META_CONFIG_FILE)
 
 
 def load_dsl_registry() -> Dict[str, Dict[str, Any]]:
@@ -224,21 +232,251 @@ def apply_operator(name: str, args: Sequence[float], registry: Dict[str, Dict[st
     raise ValueError(f"Unsupported operator kind: {meta.get('kind')}")
 
 
-@dataclass
-class Instruction:
+# Programs are compiled to straight-line Python (one SSA assignment per operator) on first
+# execution. Base operators are inlined, compose_* chains are fused step by step, and anything
+# else falls back to apply_operator so results and exceptions match the interpreters exactly.
+COMPILE_PROGRAMS = True
+COMPILED_CACHE_SIZE = 8192
+_COMPILED_FACTORIES: Dict[str, Callable[..., Callable[[Sequence[float]], float]]] = {}
+_INLINE_UNARY = {
+    "neg": "-{0}",
+    "abs": "_abs({0})",
+    "square": "{0} * {0}",
+    "sin": "_sin({0})",
+    "cos": "_cos({0})",
+}
+_INLINE_BINARY = {
+    "add": "{0} + {1}",
+    "sub": "{0} - {1}",
+    "mul": "{0} * {1}",
+    "min": "_min({0}, {1})",
+    "max": "_max({0}, {1})",
+}
+_COMPILE_NAMESPACE = {
+    "_abs": abs,
+    "_min": min,
+    "_max": max,
+    "_sin": math.sin,
+    "_cos": math.cos,
+    "_apply": apply_operator,
+}
+
+
+class _ProgramCompiler:
+    """Emits the body of a compiled program; `op` returns the variable holding the result."""
+
+    def __init__(self, registry: Dict[str, Dict[str, Any]]):
+        self.registry = registry
+        self.lines: List[str] = []
+        self.constants: List[float] = []
+        self.temps = 0
+
+    def assign(self, expr: str) -> str:
+        self.temps += 1
+        name = f"t{self.temps}"
+        self.lines.append(f"{name} = {expr}")
+        return name
+
+    def constant(self, value: float) -> str:
+        self.constants.append(value)
+        return self.assign(f"_c[{len(self.constants) - 1}]")
+
+    def op(self, name: str, args: List[str], depth: int = 0) -> str:
+        meta = self.registry.get(name) or {}
+        kind = meta.get("kind")
+        table = _INLINE_UNARY if len(args) == 1 else _INLINE_BINARY
+        if kind == "base" and name in table:
+            return self.assign(table[name].format(*args))
+        if kind == "compose" and depth < 32:
+            value = args[0]
+            for step in meta.get("sequence", []):
+                value = self.op(step, [value], depth + 1)
+            return value
+        return self.assign(f"_apply({name!r}, [{', '.join(args)}], _reg)")
+
+    def build(self, prelude: List[str], result: str) -> Callable[[Sequence[float]], float]:
+        body = "\n".join("        " + line for line in prelude + self.lines + [f"return {result}"])
+        source = f"def _make(_c, _reg):\n    def run(x):\n{body}\n    return run\n"
+        factory = _COMPILED_FACTORIES.get(source)
+        if factory is None:
+            namespace = dict(_COMPILE_NAMESPACE)
+            exec(compile(source, "<rsi-program>", "exec"), namespace)
+            factory = namespace["_make"]
+            _COMPILED_FACTORIES[source] = factory
+            while len(_COMPILED_FACTORIES) > COMPILED_CACHE_SIZE:
+                del _COMPILED_FACTORIES[next(iter(_COMPILED_FACTORIES))]
+        return factory(list(self.constants), self.registry)
+
+
+def _input_prelude(count: int) -> List[str]:
+    return ["n = len(x)"] + [f"x{i} = float(x[{i}]) if n > {i} else 0.0" for i in range(count)]
+
+
+def compile_linear(program: "LinearProgram", registry: Dict[str, Dict[str, Any]]) -> Optional[Callable[[Sequence[float]], float]]:
+    """Compile LinearProgram.execute_scalar; None for programs the compiler does not cover."""
+    regs = program.registers
+    if regs < 1:
+        return None
+    gen = _ProgramCompiler(registry)
+    names = [f"x{i}" for i in range(regs)]
+    for instr in program.instructions:
+        if instr.op not in registry:
+            continue
+        meta = registry[instr.op]
+        operands = [instr.dest, instr.src_a] + ([instr.src_b] if instr.src_b is not None else [])
+        if "arity" not in meta or not all(0 <= idx < regs for idx in operands):
+            return None
+        if meta["arity"] == 1:
+            args = [names[instr.src_a]]
+        else:
+            args = [names[instr.src_a], names[instr.src_b] if instr.src_b is not None else "0.0"]
+        names[instr.dest] = gen.op(instr.op, args)
+    return gen.build(_input_prelude(regs), names[0])
+
+
+def compile_tree(root: "TreeNode", registry: Dict[str, Dict[str, Any]]) -> Optional[Callable[[Sequence[float]], float]]:
+    """Compile TreeNode.evaluate (children in evaluation order); None if the tree is malformed."""
+    gen = _ProgramCompiler(registry)
+    inputs: Dict[int, str] = {}
+
+    def emit(node: TreeNode) -> Optional[str]:
+        if node.op is None:
+            return gen.constant(node.value if node.value is not None else 0.0)
+        if node.op.startswith("input_"):
+            index = int(node.op.split("_")[1])
+            return inputs.setdefault(index, f"x{index}")
+        meta = registry.get(node.op, {"arity": 1})
+        count = 1 if meta.get("arity") == 1 else 2
+        if "arity" not in meta or len(node.children) < count:
+            return None
+        args = []
+        for child in node.children[:count]:
+            arg = emit(child)
+            if arg is None:
+                return None
+            args.append(arg)
+        return gen.op(node.op, args)
+
+    try:
+        result = emit(root)
+    except (RecursionError, ValueError):
+        return None
+    if result is None:
+        return None
+    prelude = ["n = len(x)"] + [f"{name} = float(x[{i}]) if n > {i} else 0.0" for i, name in sorted(inputs.items())]
+    return gen.build(prelude, result)
+
+
+def compile_stack(
+    program: "StackProgram", registry: Dict[str, Dict[str, Any]], n_inputs: int
+) -> Callable[[Sequence[float]], float]:
+    """Compile StackProgram.execute_scalar for inputs that leave `n_inputs` values on the initial stack."""
+    gen = _ProgramCompiler(registry)
+    stack = [f"x{i}" for i in range(n_inputs)]
+    for instr in program.instructions:
+        if instr.op not in registry:
+            continue
+        arity = registry[instr.op].get("arity", 1)
+        if len(stack) < arity:
+            stack.append("0.0")
+        if arity == 1:
+            arg = stack.pop() if stack else "0.0"
+            stack.append(gen.op(instr.op, [arg]))
+        else:
+            b = stack.pop() if stack else "0.0"
+            a = stack.pop() if stack else "0.0"
+            stack.append(gen.op(instr.op, [a, b]))
+        if len(stack) > program.stack_size:
+            stack = stack[-program.stack_size :]
+    prelude = [f"x{i} = float(x[{i}])" for i in range(n_inputs)]
+    return gen.build(prelude, stack[-1] if stack else "0.0")
+
+
+class CompiledCache:
+    """
+    Per-program cache of compiled runners, valid for one registry object and size (evolve_dsl only
+    adds operators). mutate/crossover return new programs, which start uncompiled; elites carried
+    over unchanged keep theirs. The cache is never copied or pickled.
+    """
+
+    _compiled: Optional[Tuple[Dict[str, Dict[str, Any]], int, Dict[Any, Any]]] = None
+
+    def compiled_runner(self, registry: Dict[str, Dict[str, Any]], key: Any, build: Callable[[], Any]) -> Any:
+        if not COMPILE_PROGRAMS:
+            return None
+        cache = self._compiled
+        if cache is None or cache[0] is not registry or cache[1] != len(registry):
+            cache = (registry, len(registry), {})
+            self._compiled = cache
+        runners = cache[2]
+        if key not in runners:
+            runners[key] = build()
+        return runners[key]
+
+    def __getstate__(self) -> Dict[str, Any]:
+        state = dict(self.__dict__)
+        state.pop("_compiled", None)
+        return state
+
+
+_set_slot = object.__setattr__
+
+
+class FrozenRecord:
+    """
+    Immutable __slots__ record. Programs share instructions and subtrees with their parents and
+    with each other, so fields are set once in __init__ and copying returns the same object.
+    Slots starting with an underscore are derived and excluded from equality, repr and pickling.
+    """
+
+    __slots__ = ()
+
+    def _values(self) -> Tuple[Any, ...]:
+        return tuple(getattr(self, name) for name in self.__slots__ if not name.startswith("_"))
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __eq__(self, other: Any) -> bool:
+        return type(other) is type(self) and other._values() == self._values()
+
+    def __hash__(self) -> int:
+        return hash((type(self).__name__,) + self._values())
+
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{name}={getattr(self, name)!r}" for name in self.__slots__ if not name.startswith("_"))
+        return f"{type(self).__name__}({fields})"
+
+    def __reduce__(self) -> Any:
+        return (type(self), self._values())
+
+    def __copy__(self) -> "FrozenRecord":
+        return self
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> "FrozenRecord":
+        return self
+
+
+class Instruction(FrozenRecord):
     """Linear GP instruction."""
 
-    op: str
-    dest: int
-    src_a: int
-    src_b: Optional[int] = None
+    __slots__ = ("op", "dest", "src_a", "src_b")
+
+    def __init__(self, op: str, dest: int, src_a: int, src_b: Optional[int] = None):
+        _set_slot(self, "op", op)
+        _set_slot(self, "dest", dest)
+        _set_slot(self, "src_a", src_a)
+        _set_slot(self, "src_b", src_b)
 
 
 @dataclass
-class LinearProgram:
-    """Linear GP program representation."""
+class LinearProgram(CompiledCache):
+    """Linear GP program representation (the instruction tuple is shared with relatives)."""
 
-    instructions: List[Instruction]
+    instructions: Tuple[Instruction, ...]
     registers: int
 
     def execute_scalar(self, inputs: Sequence[float], registry: Dict[str, Dict[str, Any]]) -> float:
@@ -257,42 +495,47 @@ class LinearProgram:
         return regs[0]
 
     def execute(self, input_value: Any, registry: Dict[str, Dict[str, Any]]) -> Any:
+        run = self.compiled_runner(registry, None, lambda: compile_linear(self, registry))
+        if run is None:
+            run = lambda inputs: self.execute_scalar(inputs, registry)
         if isinstance(input_value, list):
-            return [self.execute_scalar([v], registry) for v in input_value]
+            return [run([v]) for v in input_value]
         if isinstance(input_value, tuple):
-            return self.execute_scalar(list(input_value), registry)
-        return self.execute_scalar([input_value], registry)
+            return run(list(input_value))
+        return run([input_value])
 
     def complexity(self) -> int:
         return len(self.instructions)
 
     def mutate(self, meta_config: MetaConfig, registry: Dict[str, Dict[str, Any]], rng: random.Random) -> "LinearProgram":
-        new_instructions = copy.deepcopy(self.instructions)
-        if not new_instructions or rng.random() < 0.5:
-            new_instructions.append(random_instruction(meta_config, registry, rng))
+        instructions = self.instructions
+        if not instructions or rng.random() < 0.5:
+            instructions = instructions + (random_instruction(meta_config, registry, rng),)
         else:
-            idx = rng.randrange(len(new_instructions))
-            new_instructions[idx] = random_instruction(meta_config, registry, rng)
-        if len(new_instructions) > meta_config.max_program_length:
-            new_instructions = new_instructions[: meta_config.max_program_length]
-        return LinearProgram(new_instructions, self.registers)
+            idx = rng.randrange(len(instructions))
+            instructions = instructions[:idx] + (random_instruction(meta_config, registry, rng),) + instructions[idx + 1 :]
+        return LinearProgram(instructions[: meta_config.max_program_length], self.registers)
 
     def crossover(self, other: "LinearProgram", rng: random.Random) -> "LinearProgram":
         if not self.instructions or not other.instructions:
-            return copy.deepcopy(self)
+            return self
         cut_a = rng.randrange(len(self.instructions))
         cut_b = rng.randrange(len(other.instructions))
         child_instr = self.instructions[:cut_a] + other.instructions[cut_b:]
         return LinearProgram(child_instr, self.registers)
 
 
-@dataclass
-class TreeNode:
-    """Tree-based GP node."""
+class TreeNode(FrozenRecord):
+    """Tree-based GP node; subtrees are shared, so edits copy only the path from the root."""
+
+    __slots__ = ("op", "value", "children", "_size")
 
-    op: Optional[str] = None
-    value: Optional[float] = None
-    children: List["TreeNode"] = field(default_factory=list)
+    def __init__(self, op: Optional[str] = None, value: Optional[float] = None, children: Sequence["TreeNode"] = ()):
+        children = tuple(children)
+        _set_slot(self, "op", op)
+        _set_slot(self, "value", value)
+        _set_slot(self, "children", children)
+        _set_slot(self, "_size", 1 + sum(child._size for child in children))
 
     def evaluate(self, inputs: Sequence[float], registry: Dict[str, Dict[str, Any]]) -> float:
         if self.op is None:
@@ -315,11 +558,19 @@ class TreeNode:
         )
 
     def size(self) -> int:
-        return 1 + sum(child.size() for child in self.children)
+        return self._size
+
+    def replace(self, path: Tuple[int, ...], node: "TreeNode") -> "TreeNode":
+        """Copy of this tree with the subtree at `path` (child indices) replaced by `node`."""
+        if not path:
+            return node
+        idx = path[0]
+        children = self.children
+        return TreeNode(self.op, self.value, children[:idx] + (children[idx].replace(path[1:], node),) + children[idx + 1 :])
 
 
 @dataclass
-class TreeProgram:
+class TreeProgram(CompiledCache):
     """Tree GP program representation."""
 
     root: TreeNode
@@ -327,50 +578,41 @@ class TreeProgram:
     def execute(self, input_value: Any, registry: Dict[str, Dict[str, Any]]) -> Any:
         if isinstance(input_value, list):
             return [self.execute(v, registry) for v in input_value]
+        run = self.compiled_runner(registry, None, lambda: compile_tree(self.root, registry))
+        if run is None:
+            run = lambda inputs: self.root.evaluate(inputs, registry)
         if isinstance(input_value, tuple):
-            return self.root.evaluate(list(input_value), registry)
-        return self.root.evaluate([input_value], registry)
+            return run(list(input_value))
+        return run([input_value])
 
     def complexity(self) -> int:
         return self.root.size()
 
     def mutate(self, meta_config: MetaConfig, registry: Dict[str, Dict[str, Any]], rng: random.Random) -> "TreeProgram":
-        new_root = copy.deepcopy(self.root)
-        nodes = collect_nodes(new_root)
-        if nodes:
-            target = rng.choice(nodes)
-            replacement = random_tree_node(meta_config, registry, rng, depth=0)
-            target.op = replacement.op
-            target.value = replacement.value
-            target.children = replacement.children
-        return TreeProgram(new_root)
+        path = rng.choice(collect_paths(self.root))
+        replacement = random_tree_node(meta_config, registry, rng, depth=0)
+        return TreeProgram(self.root.replace(path, replacement))
 
     def crossover(self, other: "TreeProgram", rng: random.Random) -> "TreeProgram":
-        new_root = copy.deepcopy(self.root)
-        other_root = copy.deepcopy(other.root)
-        nodes = collect_nodes(new_root)
-        other_nodes = collect_nodes(other_root)
-        if nodes and other_nodes:
-            target = rng.choice(nodes)
-            donor = rng.choice(other_nodes)
-            target.op = donor.op
-            target.value = donor.value
-            target.children = donor.children
-        return TreeProgram(new_root)
+        path = rng.choice(collect_paths(self.root))
+        donor = rng.choice(collect_nodes(other.root))
+        return TreeProgram(self.root.replace(path, donor))
 
 
-@dataclass
-class StackInstruction:
+class StackInstruction(FrozenRecord):
     """Stack-based GP instruction."""
 
-    op: str
+    __slots__ = ("op",)
+
+    def __init__(self, op: str):
+        _set_slot(self, "op", op)
 
 
 @dataclass
-class StackProgram:
-    """Stack GP program representation."""
+class StackProgram(CompiledCache):
+    """Stack GP program representation (the instruction tuple is shared with relatives)."""
 
-    instructions: List[StackInstruction]
+    instructions: Tuple[StackInstruction, ...]
     stack_size: int
 
     def execute_scalar(self, inputs: Sequence[float], registry: Dict[str, Dict[str, Any]]) -> float:
@@ -394,30 +636,36 @@ class StackProgram:
                 stack = stack[-self.stack_size :]
         return stack[-1] if stack else 0.0
 
+    def runner(self, registry: Dict[str, Dict[str, Any]], n_inputs: int) -> Callable[[Sequence[float]], float]:
+        """Compiled execute_scalar for inputs of length `n_inputs` (the initial stack depth is static)."""
+        depth = len(range(n_inputs)[: self.stack_size])
+        run = self.compiled_runner(registry, depth, lambda: compile_stack(self, registry, depth))
+        if run is None:
+            return lambda inputs: self.execute_scalar(inputs, registry)
+        return run
+
     def execute(self, input_value: Any, registry: Dict[str, Dict[str, Any]]) -> Any:
         if isinstance(input_value, list):
-            return [self.execute_scalar([v], registry) for v in input_value]
-        if isinstance(input_value, tuple):
-            return self.execute_scalar(list(input_value), registry)
-        return self.execute_scalar([input_value], registry)
+            run = self.runner(registry, 1)
+            return [run([v]) for v in input_value]
+        inputs = list(input_value) if isinstance(input_value, tuple) else [input_value]
+        return self.runner(registry, len(inputs))(inputs)
 
     def complexity(self) -> int:
         return len(self.instructions)
 
     def mutate(self, meta_config: MetaConfig, registry: Dict[str, Dict[str, Any]], rng: random.Random) -> "StackProgram":
-        new_instructions = copy.deepcopy(self.instructions)
-        if not new_instructions or rng.random() < 0.5:
-            new_instructions.append(random_stack_instruction(meta_config, rng))
+        instructions = self.instructions
+        if not instructions or rng.random() < 0.5:
+            instructions = instructions + (random_stack_instruction(meta_config, rng),)
         else:
-            idx = rng.randrange(len(new_instructions))
-            new_instructions[idx] = random_stack_instruction(meta_config, rng)
-        if len(new_instructions) > meta_config.max_program_length:
-            new_instructions = new_instructions[: meta_config.max_program_length]
-        return StackProgram(new_instructions, self.stack_size)
+            idx = rng.randrange(len(instructions))
+            instructions = instructions[:idx] + (random_stack_instruction(meta_config, rng),) + instructions[idx + 1 :]
+        return StackProgram(instructions[: meta_config.max_program_length], self.stack_size)
 
     def crossover(self, other: "StackProgram", rng: random.Random) -> "StackProgram":
         if not self.instructions or not other.instructions:
-            return copy.deepcopy(self)
+            return self
         cut_a = rng.randrange(len(self.instructions))
         cut_b = rng.randrange(len(other.instructions))
         child_instr = self.instructions[:cut_a] + other.instructions[cut_b:]
@@ -431,6 +679,14 @@ def collect_nodes(node: TreeNode) -> List[TreeNode]:
     return nodes
 
 
+def collect_paths(node: TreeNode, prefix: Tuple[int, ...] = ()) -> List[Tuple[int, ...]]:
+    """Paths of all nodes, in the same (pre)order as collect_nodes."""
+    paths = [prefix]
+    for idx, child in enumerate(node.children):
+        paths.extend(collect_paths(child, prefix + (idx,)))
+    return paths
+
+
 def random_tree_node(
     meta_config: MetaConfig, registry: Dict[str, Dict[str, Any]], rng: random.Random, depth: int
 ) -> TreeNode:
@@ -462,15 +718,15 @@ def random_program(meta_config: MetaConfig, registry: Dict[str, Dict[str, Any]],
     if meta_config.architecture_mode == "tree_gp":
         return TreeProgram(random_tree_node(meta_config, registry, rng, depth=0))
     if meta_config.architecture_mode == "linear_gp":
-        instructions = [
+        instructions = tuple(
             random_instruction(meta_config, registry, rng)
             for _ in range(rng.randint(1, meta_config.max_program_length))
-        ]
+        )
         return LinearProgram(instructions=instructions, registers=meta_config.registers)
-    instructions = [
+    instructions = tuple(
         random_stack_instruction(meta_config, rng)
         for _ in range(rng.randint(1, meta_config.max_program_length))
-    ]
+    )
     return StackProgram(instructions=instructions, stack_size=meta_config.stack_size)
 
 
@@ -517,15 +773,28 @@ class SearchStrategy:
     elite_fraction: float
 
 
-def loss_mse(outputs: List[float], targets: List[float]) -> float:
+def _mean(values: Iterable[float]) -> float:
+    """statistics.fmean, but inf where the sum overflows (fmean raises on intermediate overflow)."""
+    try:
+        return statistics.fmean(values)
+    except OverflowError:
+        return float("inf")
+
+
+def loss_mse(outputs: Sequence[float], targets: Sequence[float]) -> float:
     if not outputs:
         return 1e6
-    return statistics.mean((o - t) ** 2 for o, t in zip(outputs, targets))
+    return _mean((o - t) ** 2 for o, t in zip(outputs, targets))
 
 
-def loss_sequence(outputs: List[List[float]], targets: List[List[float]]) -> float:
+def loss_sequence(
+    outputs: List[List[float]], targets: Sequence[Any], offsets: Optional[Sequence[int]] = None
+) -> float:
+    """Per-sample MSE plus a length penalty; with `offsets`, target i is targets[offsets[i]:offsets[i + 1]]."""
     if not outputs:
         return 1e6
+    if offsets is not None:
+        targets = [targets[offsets[i] : offsets[i + 1]] for i in range(len(offsets) - 1)]
     sample_losses = []
     for output, target in zip(outputs, targets):
         if not isinstance(output, list):
@@ -535,13 +804,13 @@ def loss_sequence(outputs: List[List[float]], targets: List[List[float]]) -> flo
         if n == 0:
             sample_losses.append(1e6)
             continue
-        mse = statistics.mean((output[i] - target[i]) ** 2 for i in range(n))
+        mse = _mean((output[i] - target[i]) ** 2 for i in range(n))
         length_penalty = abs(len(output) - len(target)) * 0.1
         sample_losses.append(mse + length_penalty)
-    return statistics.mean(sample_losses)
+    return _mean(sample_losses)
 
 
-def loss_classification(outputs: List[float], targets: List[int]) -> float:
+def loss_classification(outputs: Sequence[float], targets: Sequence[int]) -> float:
     if not outputs:
         return 1.0
     preds = [1 if o >= 0.5 else 0 for o in outputs]
@@ -549,31 +818,93 @@ def loss_classification(outputs: List[float], targets: List[int]) -> float:
     return errors / len(targets)
 
 
+@dataclass
+class TaskData:
+    """
+    One generated split of a task, stored flat: row i of the inputs is
+    input_values[input_offsets[i]:input_offsets[i + 1]] (sequence targets use target_offsets the same
+    way). `rows` are the execute-ready views: element lists for sequence tasks, feature tuples otherwise.
+    """
+
+    kind: str
+    input_values: array
+    input_offsets: array
+    target_values: array
+    target_offsets: Optional[array]
+    rows: List[Any]
+
+    @staticmethod
+    def from_samples(samples: List[Tuple[Any, Any]]) -> "TaskData":
+        target_sample = samples[0][1] if samples else 0.0
+        if isinstance(target_sample, list):
+            kind = "sequence"
+        elif isinstance(target_sample, int):
+            kind = "classification"
+        else:
+            kind = "regression"
+        input_values, input_offsets = array("d"), array("q", [0])
+        target_values = array("q") if kind == "classification" else array("d")
+        target_offsets = array("q", [0]) if kind == "sequence" else None
+        scalar_inputs = []
+        for inp, target in samples:
+            scalar_inputs.append(not isinstance(inp, (list, tuple)))
+            input_values.extend(map(float, inp) if not scalar_inputs[-1] else [float(inp)])
+            input_offsets.append(len(input_values))
+            if target_offsets is not None:
+                target_values.extend(map(float, target))
+                target_offsets.append(len(target_values))
+            else:
+                target_values.append(int(target) if kind == "classification" else float(target))
+        rows: List[Any] = []
+        for i, scalar in enumerate(scalar_inputs):
+            row = input_values[input_offsets[i] : input_offsets[i + 1]]
+            if scalar:
+                rows.append(row[0])
+            else:
+                # Scalar targets read list inputs (e.g. parity bits) as one feature vector.
+                rows.append(row.tolist() if kind == "sequence" else tuple(row))
+        return TaskData(kind, input_values, input_offsets, target_values, target_offsets, rows)
+
+    def loss(self, outputs: List[Any]) -> float:
+        if self.kind == "sequence":
+            return loss_sequence(
+                [list(map(float, v)) if isinstance(v, list) else [float(v)] for v in outputs],
+                self.target_values,
+                self.target_offsets,
+            )
+        if self.kind == "classification":
+            return loss_classification([float(v) for v in outputs], self.target_values)
+        return loss_mse([float(v) for v in outputs], self.target_values)
+
+
+# (train, holdout) TaskData per (task name, seed); the oldest entries are evicted first.
+DATASET_CACHE: Dict[Tuple[str, int], Tuple[TaskData, TaskData]] = {}
+DATASET_CACHE_SIZE = 256
+
+
+def task_data(task: TaskSpec, seed: int) -> Tuple[TaskData, TaskData]:
+    """Train data for `seed` and holdout data for `seed + 1`, generated once per (task, seed)."""
+    key = (task.name, seed)
+    data = DATASET_CACHE.get(key)
+    if data is None:
+        data = (
+            TaskData.from_samples(task.generate_train_data(seed)),
+            TaskData.from_samples(task.generate_holdout_data(seed + 1)),
+        )
+        DATASET_CACHE[key] = data
+        while len(DATASET_CACHE) > DATASET_CACHE_SIZE:
+            del DATASET_CACHE[next(iter(DATASET_CACHE))]
+    return data
+
+
 def evaluate_program(
     program: Any, task: TaskSpec, meta_config: MetaConfig, registry: Dict[str, Dict[str, Any]], seed: int
 ) -> EvaluationResult:
-    train_data = task.generate_train_data(seed)
-    holdout_data = task.generate_holdout_data(seed + 1)
-    train_outputs = [program.execute(inp, registry) for inp, _ in train_data]
-    holdout_outputs = [program.execute(inp, registry) for inp, _ in holdout_data]
-    target_sample = train_data[0][1]
-    if isinstance(target_sample, list):
-        train_loss = loss_sequence(
-            [list(map(float, v)) if isinstance(v, list) else [float(v)] for v in train_outputs],
-            [list(map(float, t)) for _, t in train_data],
-        )
-        holdout_loss = loss_sequence(
-            [list(map(float, v)) if isinstance(v, list) else [float(v)] for v in holdout_outputs],
-            [list(map(float, t)) for _, t in holdout_data],
-        )
-    elif isinstance(target_sample, int):
-        train_loss = loss_classification([float(v) for v in train_outputs], [int(t) for _, t in train_data])
-        holdout_loss = loss_classification([float(v) for v in holdout_outputs], [int(t) for _, t in holdout_data])
-    else:
-        train_loss = loss_mse([float(v) for v in train_outputs], [float(t) for _, t in train_data])
-        holdout_loss = loss_mse([float(v) for v in holdout_outputs], [float(t) for _, t in holdout_data])
+    train, holdout = task_data(task, seed)
+    train_loss = train.loss([program.execute(inp, registry) for inp in train.rows])
+    holdout_loss = holdout.loss([program.execute(inp, registry) for inp in holdout.rows])
     complexity = meta_config.complexity_weight * program.complexity()
-    runtime_penalty = meta_config.runtime_weight * len(train_data) * program.complexity()
+    runtime_penalty = meta_config.runtime_weight * len(train.rows) * program.complexity()
     return EvaluationResult(
         train_loss=train_loss,
         holdout_loss=holdout_loss,
@@ -582,17 +913,11 @@ def evaluate_program(
     )
 
 
-def selection(population: List[Any], scores: List[float], rng: random.Random) -> Any:
-    total = sum(scores)
-    if total == 0:
-        return rng.choice(population)
-    pick = rng.random() * total
-    current = 0.0
-    for program, score in zip(population, scores):
-        current += score
-        if current >= pick:
-            return program
-    return population[-1]
+def selection(population: List[Any], scores: List[float], rng: random.Random, table: Any = None) -> Any:
+    """Fitness-proportional pick; pass a prebuilt `build_table(scores)` to make each pick O(1)."""
+    if table is None:
+        table = build_table(scores)
+    return population[table.sample(rng)]
 
 
 def update_rule_bandit(
@@ -603,18 +928,22 @@ def update_rule_bandit(
     strategy: SearchStrategy,
     rng: random.Random,
 ) -> List[Any]:
-    """Update rule that adapts mutation intensity based on bandit-like rewards."""
+    """
+    Update rule that adapts mutation intensity based on bandit-like rewards. Programs are never
+    modified in place, so elites and unmutated children are carried over by reference.
+    """
     ranked = sorted(zip(population, scores), key=lambda item: item[1], reverse=True)
     elite_count = max(1, int(len(population) * strategy.elite_fraction))
     elites = [prog for prog, _ in ranked[:elite_count]]
-    next_population = [copy.deepcopy(rng.choice(elites)) for _ in range(elite_count)]
+    next_population = [rng.choice(elites) for _ in range(elite_count)]
+    table = build_table(scores)
     while len(next_population) < len(population):
-        parent_a = selection(population, scores, rng)
+        parent_a = selection(population, scores, rng, table)
         if rng.random() < meta_config.crossover_rate:
-            parent_b = selection(population, scores, rng)
+            parent_b = selection(population, scores, rng, table)
             child = parent_a.crossover(parent_b, rng)
         else:
-            child = copy.deepcopy(parent_a)
+            child = parent_a
         mutation_chance = min(0.9, max(0.05, meta_config.mutation_rate * strategy.mutation_scale))
         if rng.random() < mutation_chance:
             child = child.mutate(meta_config, registry, rng)
@@ -622,10 +951,13 @@ def update_rule_bandit(
     return next_population
 
 
-def run_algorithm_search(meta_config: MetaConfig, task: TaskSpec, seed: int) -> SearchSummary:
+def run_algorithm_search(
+    meta_config: MetaConfig, task: TaskSpec, seed: int, registry: Optional[Dict[str, Dict[str, Any]]] = None
+) -> SearchSummary:
     """Run Level 0 algorithm search."""
     rng = random.Random(seed)
-    registry = load_dsl_registry()
+    if registry is None:
+        registry = load_dsl_registry()
     strategies = [
         SearchStrategy("exploit", mutation_scale=0.8, elite_fraction=0.3),
         SearchStrategy("explore", mutation_scale=1.3, elite_fraction=0.15),
@@ -665,6 +997,60 @@ def run_algorithm_search(meta_config: MetaConfig, task: TaskSpec, seed: int) ->
     )
 
 
+# SearchSummary per (search fingerprint, task name, seed); oldest entries are evicted first.
+SEARCH_CACHE: Dict[Tuple[str, str, int], SearchSummary] = {}
+SEARCH_CACHE_SIZE = 4096
+
+
+def search_fingerprint(meta_config: MetaConfig, registry: Dict[str, Dict[str, Any]]) -> str:
+    """Hash of everything run_algorithm_search depends on (the self-modification policy is not used)."""
+    data = meta_config.to_dict()
+    data.pop("self_mod_policy")
+    payload = json.dumps({"meta_config": data, "registry": registry}, sort_keys=True)
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+def search_executor(workers: int = 0) -> Optional[concurrent.futures.ProcessPoolExecutor]:
+    """Process pool for per-task searches (0 = CPU count); None when that is a single worker."""
+    workers = max(1, workers or (os.cpu_count() or 1))
+    return concurrent.futures.ProcessPoolExecutor(workers) if workers > 1 else None
+
+
+def run_task_searches(
+    jobs: Sequence[Tuple[MetaConfig, TaskSpec, int]],
+    registry: Dict[str, Dict[str, Any]],
+    executor: Optional[concurrent.futures.Executor] = None,
+) -> List[SearchSummary]:
+    """
+    Run (meta_config, task, seed) searches, memoized in SEARCH_CACHE. Misses run on `executor`
+    when given; results come back in job order, so callers stay deterministic.
+    """
+    keys = [(search_fingerprint(cfg, registry), task.name, seed) for cfg, task, seed in jobs]
+    missing: Dict[Tuple[str, str, int], Tuple[MetaConfig, TaskSpec, int]] = {}
+    for key, job in zip(keys, jobs):
+        if key not in SEARCH_CACHE:
+            missing.setdefault(key, job)
+    if executor is not None and len(missing) > 1:
+        futures = {
+            key: executor.submit(run_algorithm_search, cfg, task, seed, registry) for key, (cfg, task, seed) in missing.items()
+        }
+        results = {key: fut.result() for key, fut in futures.items()}
+    else:
+        results = {key: run_algorithm_search(cfg, task, seed, registry) for key, (cfg, task, seed) in missing.items()}
+    out = [SEARCH_CACHE.get(key) or results[key] for key in keys]
+    SEARCH_CACHE.update(results)
+    while len(SEARCH_CACHE) > SEARCH_CACHE_SIZE:
+        del SEARCH_CACHE[next(iter(SEARCH_CACHE))]
+    return out
+
+
+def _task_seeds(rng: random.Random, n: int, task_seed: Optional[int]) -> List[int]:
+    # A fixed task_seed gives every caller the same per-task seeds (so identical configs hit SEARCH_CACHE).
+    if task_seed is not None:
+        return [task_seed + i for i in range(n)]
+    return [rng.randint(0, 1_000_000) for _ in range(n)]
+
+
 def task_sequence_double(seed: int) -> List[Tuple[List[float], List[float]]]:
     rng = random.Random(seed)
     data = []
@@ -802,7 +1188,12 @@ def perturb_meta_config(meta_config: MetaConfig, rng: random.Random) -> MetaConf
     return new_config
 
 
-def run_meta_search(rounds: int, seed: int) -> MetaConfig:
+def run_meta_search(
+    rounds: int,
+    seed: int,
+    executor: Optional[concurrent.futures.Executor] = None,
+    task_seed: Optional[int] = None,
+) -> MetaConfig:
     """Run Level 1 meta-parameter optimization."""
     rng = random.Random(seed)
     meta_config = load_meta_config()
@@ -813,11 +1204,9 @@ def run_meta_search(rounds: int, seed: int) -> MetaConfig:
     patience = 0
     for _ in range(rounds):
         candidate = perturb_meta_config(meta_config, rng)
-        scores = []
-        for task in tasks:
-            summary = run_algorithm_search(candidate, task, rng.randint(0, 1_000_000))
-            scores.append(summary.best_score)
-        avg_score = statistics.mean(scores)
+        seeds = _task_seeds(rng, len(tasks), task_seed)
+        summaries = run_task_searches([(candidate, task, s) for task, s in zip(tasks, seeds)], registry, executor)
+        avg_score = statistics.mean(summary.best_score for summary in summaries)
         if avg_score < best_score * meta_config.self_mod_policy.min_improvement_ratio:
             best_score = avg_score
             meta_config = candidate
@@ -863,8 +1252,13 @@ def evolve_dsl(registry: Dict[str, Dict[str, Any]], programs: List[Any]) -> Dict
     return registry
 
 
-def run_architecture_search(rounds: int, seed: int) -> MetaConfig:
-    """Level 3: architecture evolution."""
+def run_architecture_search(
+    rounds: int,
+    seed: int,
+    executor: Optional[concurrent.futures.Executor] = None,
+    task_seed: Optional[int] = None,
+) -> MetaConfig:
+    """Level 3: architecture evolution. All architectures of a round are searched concurrently."""
     ensure_meta_dirs()
     rng = random.Random(seed)
     meta_config = load_meta_config()
@@ -873,18 +1267,21 @@ def run_architecture_search(rounds: int, seed: int) -> MetaConfig:
     tasks = list(build_tasks().values())
     candidates = ["linear_gp", "tree_gp", "stack_gp"]
     for _ in range(rounds):
-        results = []
+        jobs = []
         for mode in candidates:
             candidate_config = copy.deepcopy(meta_config)
             candidate_config.architecture_mode = mode
-            scores = []
-            for task in tasks:
-                summary = run_algorithm_search(candidate_config, task, rng.randint(0, 1_000_000))
-                scores.append(summary.best_score)
-            avg_score = statistics.mean(scores)
+            jobs.extend((candidate_config, task, s) for task, s in zip(tasks, _task_seeds(rng, len(tasks), task_seed)))
+        summaries = run_task_searches(jobs, registry, executor)
+        results = []
+        lines = []
+        for i, mode in enumerate(candidates):
+            avg_score = statistics.mean(summary.best_score for summary in summaries[i * len(tasks) : (i + 1) * len(tasks)])
             results.append((avg_score, mode))
-            with ARCH_HISTORY_FILE.open("a", encoding="utf-8") as handle:
-                handle.write(json.dumps({"mode": mode, "score": avg_score, "time": time.time()}) + "\n")
+            lines.append(json.dumps({"mode": mode, "score": avg_score, "time": time.time()}) + "\n")
+        # One append per round: concurrent writers never interleave partial records.
+        with ARCH_HISTORY_FILE.open("a", encoding="utf-8") as handle:
+            handle.write("".join(lines))
         best_score, best_mode = min(results, key=lambda item: item[0])
         if best_score < float("inf"):
             meta_config.architecture_mode = best_mode
@@ -902,7 +1299,12 @@ def perturb_policy(policy: SelfModPolicy, rng: random.Random) -> SelfModPolicy:
     return new_policy
 
 
-def run_policy_evolution(rounds: int, seed: int) -> MetaConfig:
+def run_policy_evolution(
+    rounds: int,
+    seed: int,
+    executor: Optional[concurrent.futures.Executor] = None,
+    task_seed: Optional[int] = None,
+) -> MetaConfig:
     """Level 4: evolve self-modification policy."""
     rng = random.Random(seed)
     meta_config = load_meta_config()
@@ -914,11 +1316,9 @@ def run_policy_evolution(rounds: int, seed: int) -> MetaConfig:
         candidate_policy = perturb_policy(meta_config.self_mod_policy, rng)
         candidate_config = copy.deepcopy(meta_config)
         candidate_config.self_mod_policy = candidate_policy
-        scores = []
-        for task in tasks:
-            summary = run_algorithm_search(candidate_config, task, rng.randint(0, 1_000_000))
-            scores.append(summary.best_score)
-        avg_score = statistics.mean(scores)
+        seeds = _task_seeds(rng, len(tasks), task_seed)
+        summaries = run_task_searches([(candidate_config, task, s) for task, s in zip(tasks, seeds)], registry, executor)
+        avg_score = statistics.mean(summary.best_score for summary in summaries)
         if avg_score < best_score * candidate_policy.min_improvement_ratio:
             best_score = avg_score
             meta_config.self_mod_policy = candidate_policy
@@ -961,8 +1361,11 @@ def run_self_rewrite(meta_config: MetaConfig, registry: Dict[str, Dict[str, Any]
     return "rewrite applied"
 
 
-def run_rsi_loop(rounds: int, seed: int) -> None:
-    """Run the high-level RSI loop."""
+def run_rsi_loop(rounds: int, seed: int, executor: Optional[concurrent.futures.Executor] = None) -> None:
+    """
+    Run the high-level RSI loop. Within a round every level searches each task on the same seed,
+    so a config already searched this round (e.g. the accepted one) comes from SEARCH_CACHE.
+    """
     rng = random.Random(seed)
     meta_config = load_meta_config()
     registry = load_dsl_registry()
@@ -970,14 +1373,15 @@ def run_rsi_loop(rounds: int, seed: int) -> None:
     tasks = build_tasks()
     for _ in range(rounds):
         task = rng.choice(list(tasks.values()))
-        summary = run_algorithm_search(meta_config, task, rng.randint(0, 1_000_000))
+        task_seed = rng.randint(0, 1_000_000)
+        (summary,) = run_task_searches([(meta_config, task, task_seed + list(tasks).index(task.name))], registry)
         log_run(summary, meta_config, seed)
         registry = evolve_dsl(registry, [summary.best_program])
         save_dsl_registry(registry)
         meta_config = sync_meta_config(meta_config, registry)
-        meta_config = run_meta_search(1, rng.randint(0, 1_000_000))
-        meta_config = run_architecture_search(1, rng.randint(0, 1_000_000))
-        meta_config = run_policy_evolution(1, rng.randint(0, 1_000_000))
+        meta_config = run_meta_search(1, rng.randint(0, 1_000_000), executor, task_seed)
+        meta_config = run_architecture_search(1, rng.randint(0, 1_000_000), executor, task_seed)
+        meta_config = run_policy_evolution(1, rng.randint(0, 1_000_000), executor, task_seed)
         if rng.random() < 0.2:
             run_self_rewrite(meta_config, registry, dry_run=True)
 
@@ -995,14 +1399,17 @@ def parse_args(argv: Optional[Sequence[str]] = None) -> argparse.Namespace:
     meta_parser = subparsers.add_parser("meta-search")
     meta_parser.add_argument("--rounds", type=int, default=3)
     meta_parser.add_argument("--seed", type=int, default=0)
+    meta_parser.add_argument("--workers", type=int, default=0)
 
     arch_parser = subparsers.add_parser("arch-search")
     arch_parser.add_argument("--rounds", type=int, default=2)
     arch_parser.add_argument("--seed", type=int, default=0)
+    arch_parser.add_argument("--workers", type=int, default=0)
 
     loop_parser = subparsers.add_parser("rsi-loop")
     loop_parser.add_argument("--rounds", type=int, default=3)
     loop_parser.add_argument("--seed", type=int, default=0)
+    loop_parser.add_argument("--workers", type=int, default=0)
 
     rewrite_parser = subparsers.add_parser("self-rewrite")
     rewrite_parser.add_argument("--apply", action="store_true")
@@ -1028,15 +1435,21 @@ def main(argv: Optional[Sequence[str]] = None) -> None:
         summary = run_algorithm_search(meta_config, task, args.seed)
         log_run(summary, meta_config, args.seed)
         print(json.dumps({"task": summary.task_name, "best_score": summary.best_score}, indent=2))
-    elif args.command == "meta-search":
-        meta_config = run_meta_search(args.rounds, args.seed)
-        print(json.dumps(meta_config.to_dict(), indent=2))
-    elif args.command == "arch-search":
-        meta_config = run_architecture_search(args.rounds, args.seed)
-        print(json.dumps(meta_config.to_dict(), indent=2))
-    elif args.command == "rsi-loop":
-        run_rsi_loop(args.rounds, args.seed)
-        print(json.dumps({"status": "completed", "rounds": args.rounds}, indent=2))
+    elif args.command in ("meta-search", "arch-search", "rsi-loop"):
+        executor = search_executor(args.workers)
+        try:
+            if args.command == "meta-search":
+                meta_config = run_meta_search(args.rounds, args.seed, executor)
+                print(json.dumps(meta_config.to_dict(), indent=2))
+            elif args.command == "arch-search":
+                meta_config = run_architecture_search(args.rounds, args.seed, executor)
+                print(json.dumps(meta_config.to_dict(), indent=2))
+            else:
+                run_rsi_loop(args.rounds, args.seed, executor)
+                print(json.dumps({"status": "completed", "rounds": args.rounds}, indent=2))
+        finally:
+            if executor is not None:
+                executor.shutdown()
     elif args.command == "self-rewrite":
         result = run_self_rewrite(meta_config, registry, dry_run=not args.apply)
         print(json.dumps({"status": result}, indent=2))
@@ -1,13 +1,22 @@
 from __future__ import annotations
 
 import argparse
+import concurrent.futures
 import json
 import math
+import os
 import random
 import time
 from dataclasses import asdict, dataclass, field
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from weighted_sampling import build_table
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional: batches then run one sample at a time in Python
+    np = None
 
 # -----------------------------------------------------------
 # Persistent state directory
@@ -72,16 +81,58 @@ def eval_expr(node: ExprNode, inputs: List[float]) -> float:
             return a if a > 0.0 else 0.0
         elif op == "sigmoid":
             a = eval_expr(node.children[0], inputs)
-            return 1.0 / (1.0 + math.exp(-a))
+            try:
+                return 1.0 / (1.0 + math.exp(-a))
+            except OverflowError:
+                return 0.0
         elif op == "sin":
             a = eval_expr(node.children[0], inputs)
-            return math.sin(a)
+            return math.sin(a) if not math.isinf(a) else math.nan
         elif op == "cos":
             a = eval_expr(node.children[0], inputs)
-            return math.cos(a)
+            return math.cos(a) if not math.isinf(a) else math.nan
     return 0.0
 
 
+def eval_expr_batch(node: ExprNode, columns: List[Any], n: int) -> Any:
+    """
+    eval_expr over NumPy input columns (one array of n samples per input variable).
+    Call under np.errstate(all="ignore").
+    """
+    if node.kind == "var":
+        try:
+            idx = int(node.name[1:])
+            return columns[idx]
+        except Exception:
+            return np.zeros(n)
+    if node.kind == "const":
+        return np.full(n, node.value)
+    if node.kind == "op":
+        op = node.name
+        if op in ("add", "sub", "mul", "safe_div"):
+            a = eval_expr_batch(node.children[0], columns, n)
+            b = eval_expr_batch(node.children[1], columns, n)
+            if op == "add":
+                return a + b
+            if op == "sub":
+                return a - b
+            if op == "mul":
+                return a * b
+            return np.where(np.abs(b) < 1e-6, a, a / b)
+        if op in ("tanh", "relu", "sigmoid", "sin", "cos"):
+            a = eval_expr_batch(node.children[0], columns, n)
+            if op == "tanh":
+                return np.tanh(a)
+            if op == "relu":
+                return np.where(a > 0.0, a, 0.0)
+            if op == "sigmoid":
+                return 1.0 / (1.0 + np.exp(-a))
+            if op == "sin":
+                return np.sin(a)
+            return np.cos(a)
+    return np.zeros(n)
+
+
 def clone_expr(node: ExprNode) -> ExprNode:
     return ExprNode(
         kind=node.kind,
@@ -232,6 +283,14 @@ class RepresentationBase:
     def execute(self, prog: Any, inputs: List[float]) -> List[float]:
         raise NotImplementedError
 
+    def execute_batch(self, prog: Any, inputs: Any) -> Any:
+        """First output for every input row (an array with NumPy, else a list); the default loops over execute."""
+        preds = []
+        for x in inputs:
+            out = self.execute(prog, [float(v) for v in x])
+            preds.append(out[0] if out else 0.0)
+        return np.array(preds, dtype=float) if _numpy_enabled() else preds
+
     def complexity(self, prog: Any) -> float:
         raise NotImplementedError
 
@@ -331,6 +390,41 @@ class LinearGPRepresentation(RepresentationBase):
             out.append(regs[i % self.cfg.num_registers])
         return out
 
+    def execute_batch(self, prog: LinearProgram, inputs: Any) -> Any:
+        """execute over all rows at once, one NumPy array per register."""
+        if not _numpy_enabled():
+            return super().execute_batch(prog, inputs)
+        n = len(inputs)
+        if self.output_dim < 1:
+            return np.zeros(n)
+        nreg = self.cfg.num_registers
+        regs = [np.zeros(n) for _ in range(nreg)]
+        for i in range(min(inputs.shape[1], nreg)):
+            regs[i] = inputs[:, i]
+        with np.errstate(all="ignore"):
+            for inst in prog.instructions:
+                op = inst.op
+                dst = inst.dst % nreg
+                a = regs[inst.src1 % nreg]
+                b = regs[inst.src2 % nreg]
+                if op == "add":
+                    regs[dst] = a + b
+                elif op == "sub":
+                    regs[dst] = a - b
+                elif op == "mul":
+                    regs[dst] = a * b
+                elif op == "safe_div":
+                    regs[dst] = np.where(np.abs(b) < 1e-6, a, a / b)
+                elif op == "tanh":
+                    regs[dst] = np.tanh(a)
+                elif op == "relu":
+                    regs[dst] = np.where(a > 0.0, a, 0.0)
+                elif op == "sigmoid":
+                    e = np.exp(-a)
+                    # execute skips the instruction where math.exp raises OverflowError.
+                    regs[dst] = np.where(np.isinf(e) & np.isfinite(a), regs[dst], 1.0 / (1.0 + e))
+        return regs[0]
+
     def complexity(self, prog: LinearProgram) -> float:
         return float(len(prog.instructions))
 
@@ -401,6 +495,15 @@ class TreeRepresentation(RepresentationBase):
         v = eval_expr(prog.root, inputs)
         return [v for _ in range(self.output_dim)]
 
+    def execute_batch(self, prog: TreeProgram, inputs: Any) -> Any:
+        if not _numpy_enabled():
+            return super().execute_batch(prog, inputs)
+        n = len(inputs)
+        if self.output_dim < 1:
+            return np.zeros(n)
+        with np.errstate(all="ignore"):
+            return eval_expr_batch(prog.root, list(inputs.T), n)
+
     def complexity(self, prog: TreeProgram) -> float:
         count = 0
 
@@ -435,6 +538,53 @@ class EpisodeSummary:
     system_config: Dict[str, Any]
 
 
+# Samples drawn per task and generation; the whole population is scored on the same ones.
+SAMPLES_PER_TASK = 16
+# Batch execution uses NumPy when it is installed; set False to force the pure-Python path.
+USE_NUMPY = True
+
+
+def _numpy_enabled() -> bool:
+    return np is not None and USE_NUMPY
+
+
+@dataclass
+class TaskBatch:
+    """One generation's shared inputs and precomputed targets for a task."""
+
+    inputs: Any  # (samples, num_inputs) array with NumPy, else a list of rows
+    targets: Any  # (samples,) array with NumPy, else a list
+
+
+def sample_task_batches(
+    tasks: List[TaskSpec], rng: random.Random, samples: int = SAMPLES_PER_TASK
+) -> List[TaskBatch]:
+    """Draw common random inputs per task (same RNG draws with or without NumPy)."""
+    batches: List[TaskBatch] = []
+    for task in tasks:
+        rows = [[rng.uniform(-2.0, 2.0) for _ in range(task.num_inputs)] for _ in range(samples)]
+        targets = [eval_expr(task.expr, x) for x in rows]
+        if _numpy_enabled():
+            batches.append(
+                TaskBatch(np.array(rows, dtype=float).reshape(samples, task.num_inputs), np.array(targets, dtype=float))
+            )
+        else:
+            batches.append(TaskBatch(rows, targets))
+    return batches
+
+
+def _squared_error(targets: Any, preds: Any) -> float:
+    if _numpy_enabled():
+        with np.errstate(all="ignore"):
+            diff = targets - preds
+            return float(np.dot(diff, diff))
+    total = 0.0
+    for target, pred in zip(targets, preds):
+        diff = target - pred
+        total += diff * diff
+    return total
+
+
 def evaluate_population(
     repr_obj: RepresentationBase,
     population: List[Any],
@@ -442,23 +592,20 @@ def evaluate_population(
     cfg: SystemConfig,
     rng: random.Random,
 ) -> Tuple[List[float], float, float]:
-    """Compute fitness (loss) for each program and return losses, best_loss, best_complexity."""
+    """
+    Compute fitness (loss) for each program and return losses, best_loss, best_complexity.
+    Every program sees the same samples (common random numbers) and runs on whole batches.
+    """
     losses: List[float] = []
     best_loss = float("inf")
     best_complexity = 0.0
+    batches = sample_task_batches(tasks, rng)
+    samples = sum(len(batch.targets) for batch in batches)
 
     for prog in population:
         total_err = 0.0
-        samples = 0
-        for task in tasks:
-            for _ in range(16):
-                x = [rng.uniform(-2.0, 2.0) for _ in range(task.num_inputs)]
-                target = eval_expr(task.expr, x)
-                out = repr_obj.execute(prog, x)
-                pred = out[0] if out else 0.0
-                diff = target - pred
-                total_err += diff * diff
-                samples += 1
+        for batch in batches:
+            total_err += _squared_error(batch.targets, repr_obj.execute_batch(prog, batch.inputs))
         mse = total_err / max(1, samples)
         comp = repr_obj.complexity(prog)
         loss = mse + cfg.repr_cfg.complexity_penalty * comp
@@ -475,35 +622,28 @@ def evaluate_population(
 # -----------------------------------------------------------
 
 
-def _select_index(selection: str, losses: List[float], rng: random.Random) -> int:
+def _make_selector(selection: str, losses: List[float]) -> Callable[[random.Random], int]:
+    """Build a parent picker once per generation; roulette/rank draws are O(1) alias lookups."""
     n = len(losses)
     if n == 0:
-        return 0
+        return lambda rng: 0
     if selection == "roulette":
         # lower loss => higher weight
-        inv = [1.0 / (l + 1e-9) for l in losses]
-        total = sum(inv)
-        r = rng.uniform(0.0, total)
-        acc = 0.0
-        for i, w in enumerate(inv):
-            acc += w
-            if r <= acc:
-                return i
-        return n - 1
+        return build_table([1.0 / (l + 1e-9) for l in losses]).sample
     if selection == "rank":
-        # rank-based selection
-        indices = list(range(n))
-        indices.sort(key=lambda i: losses[i])
-        weights = [1.0 / (i + 1) for i in range(n)]
-        total = sum(weights)
-        r = rng.uniform(0.0, total)
-        acc = 0.0
-        for idx, w in zip(indices, weights):
-            acc += w
-            if r <= acc:
-                return idx
-        return indices[-1]
-    # tournament
+        # rank-based selection: sort once, sample a rank
+        indices = sorted(range(n), key=lambda i: losses[i])
+        table = build_table([1.0 / (i + 1) for i in range(n)])
+        return lambda rng: indices[table.sample(rng)]
+    return lambda rng: _tournament_index(losses, rng)
+
+
+def _select_index(selection: str, losses: List[float], rng: random.Random) -> int:
+    return _make_selector(selection, losses)(rng)
+
+
+def _tournament_index(losses: List[float], rng: random.Random) -> int:
+    n = len(losses)
     k = min(3, n)
     cand = rng.sample(range(n), k=k)
     best_i = cand[0]
@@ -535,11 +675,12 @@ def update_population(
     for i in indices[: max(0, upd.elitism)]:
         new_pop.append(population[i])
     # fill rest
+    select = _make_selector(upd.selection, losses)
     while len(new_pop) < cfg.population_size:
-        p1_idx = _select_index(upd.selection, losses, rng)
+        p1_idx = select(rng)
         parent1 = population[p1_idx]
         if upd.reproduction == "sexual" and rng.random() < upd.crossover_rate:
-            p2_idx = _select_index(upd.selection, losses, rng)
+            p2_idx = select(rng)
             parent2 = population[p2_idx]
             child = repr_obj.crossover(parent1, parent2, rng)
         else:
@@ -717,12 +858,40 @@ def save_system_config(cfg: SystemConfig) -> None:
         json.dump(_system_config_to_dict(cfg), f, indent=2, sort_keys=True)
 
 
-def evaluate_system_config(cfg: SystemConfig, repeats: int, seed: int) -> float:
-    """Evaluate a SystemConfig by running multiple episodes and averaging best_loss."""
-    best_losses: List[float] = []
-    for i in range(repeats):
-        summary = run_system_episode(cfg, seed + i * 97)
-        best_losses.append(summary.best_loss)
+# best_loss per (serialized SystemConfig, episode seed); episodes are deterministic in both.
+EPISODE_CACHE: Dict[Tuple[str, int], float] = {}
+
+
+def _episode_best_loss(cfg: SystemConfig, seed: int) -> float:
+    return run_system_episode(cfg, seed).best_loss
+
+
+def episode_executor(workers: int = 0) -> Optional[concurrent.futures.ProcessPoolExecutor]:
+    """Process pool for episode evaluation (0 = CPU count); None when that is a single worker."""
+    workers = max(1, workers or (os.cpu_count() or 1))
+    return concurrent.futures.ProcessPoolExecutor(workers) if workers > 1 else None
+
+
+def evaluate_system_config(
+    cfg: SystemConfig,
+    repeats: int,
+    seed: int,
+    executor: Optional[concurrent.futures.Executor] = None,
+) -> float:
+    """
+    Evaluate a SystemConfig by running multiple episodes and averaging best_loss.
+    Episodes already in EPISODE_CACHE are free; the rest run on `executor` when given.
+    """
+    key = json.dumps(_system_config_to_dict(cfg), sort_keys=True)
+    seeds = [seed + i * 97 for i in range(repeats)]
+    missing = [s for s in seeds if (key, s) not in EPISODE_CACHE]
+    if executor is not None and len(missing) > 1:
+        for s, loss in zip(missing, executor.map(_episode_best_loss, [cfg] * len(missing), missing)):
+            EPISODE_CACHE[(key, s)] = loss
+    else:
+        for s in missing:
+            EPISODE_CACHE[(key, s)] = _episode_best_loss(cfg, s)
+    best_losses = [EPISODE_CACHE[(key, s)] for s in seeds]
     return sum(best_losses) / max(1, len(best_losses))
 
 
@@ -741,34 +910,52 @@ def accept_new_score(
 
 
 def meta_search(
-    base_cfg: SystemConfig, mm_cfg: MetaMetaConfig, rounds: int, seed: int
+    base_cfg: SystemConfig,
+    mm_cfg: MetaMetaConfig,
+    rounds: int,
+    seed: int,
+    base_seed: Optional[int] = None,
+    workers: int = 0,
+    executor: Optional[concurrent.futures.Executor] = None,
 ) -> Tuple[SystemConfig, float]:
-    """Level 1: search over SystemConfig space (representation + update rule + task generator)."""
+    """
+    Level 1: search over SystemConfig space (representation + update rule + task generator).
+    The base config is scored on `base_seed` episodes (default seed + 1). Episodes run on
+    `executor`, or on a pool of `workers` processes owned by this call (0 = CPU count).
+    """
+    own = episode_executor(workers) if executor is None else None
+    executor = executor or own
     rng = random.Random(seed)
     best_cfg = base_cfg
-    best_score = evaluate_system_config(best_cfg, mm_cfg.eval_repeats, seed + 1)
+    try:
+        best_score = evaluate_system_config(
+            best_cfg, mm_cfg.eval_repeats, seed + 1 if base_seed is None else base_seed, executor
+        )
 
-    ensure_state_dirs()
-    history_path = STATE_DIR / "meta_history.jsonl"
-    with history_path.open("a", encoding="utf-8") as f_hist:
-        for r in range(rounds):
-            cand_cfg = mutate_system_config(best_cfg, mm_cfg.config_step_scale, rng)
-            cand_score = evaluate_system_config(
-                cand_cfg, mm_cfg.eval_repeats, seed + 1000 + r
-            )
-            accepted = accept_new_score(best_score, cand_score, mm_cfg.accept_temp, rng)
-            rec = {
-                "round": r,
-                "base_score": best_score,
-                "cand_score": cand_score,
-                "accepted": accepted,
-                "cand_cfg": _system_config_to_dict(cand_cfg),
-            }
-            f_hist.write(json.dumps(rec) + "\n")
-            if accepted:
-                best_cfg = cand_cfg
-                best_score = cand_score
-                save_system_config(best_cfg)
+        ensure_state_dirs()
+        history_path = STATE_DIR / "meta_history.jsonl"
+        with history_path.open("a", encoding="utf-8") as f_hist:
+            for r in range(rounds):
+                cand_cfg = mutate_system_config(best_cfg, mm_cfg.config_step_scale, rng)
+                cand_score = evaluate_system_config(
+                    cand_cfg, mm_cfg.eval_repeats, seed + 1000 + r, executor
+                )
+                accepted = accept_new_score(best_score, cand_score, mm_cfg.accept_temp, rng)
+                rec = {
+                    "round": r,
+                    "base_score": best_score,
+                    "cand_score": cand_score,
+                    "accepted": accepted,
+                    "cand_cfg": _system_config_to_dict(cand_cfg),
+                }
+                f_hist.write(json.dumps(rec) + "\n")
+                if accepted:
+                    best_cfg = cand_cfg
+                    best_score = cand_score
+                    save_system_config(best_cfg)
+    finally:
+        if own is not None:
+            own.shutdown()
     return best_cfg, best_score
 
 
@@ -820,34 +1007,47 @@ def meta_meta_search(
     base_mm_cfg: MetaMetaConfig,
     rounds: int,
     seed: int,
+    workers: int = 0,
 ) -> Tuple[MetaMetaConfig, float]:
-    """Level 2: redesign the meta-search process by searching over MetaMetaConfig."""
+    """
+    Level 2: redesign the meta-search process by searching over MetaMetaConfig.
+    Every inner meta-search scores the base SystemConfig on the same episode seeds, so after
+    the baseline those episodes come from EPISODE_CACHE and a round pays only for new candidates.
+    """
     rng = random.Random(seed)
     best_mm = base_mm_cfg
-    # baseline: run a short meta-search with current meta-meta config
-    _, best_score = meta_search(base_sys_cfg, best_mm, rounds=3, seed=seed + 1)
+    base_seed = seed + 2
+    executor = episode_executor(workers)
+    try:
+        # baseline: run a short meta-search with current meta-meta config
+        _, best_score = meta_search(
+            base_sys_cfg, best_mm, rounds=3, seed=seed + 1, base_seed=base_seed, executor=executor
+        )
 
-    ensure_state_dirs()
-    history_path = STATE_DIR / "meta_meta_history.jsonl"
-    with history_path.open("a", encoding="utf-8") as f_hist:
-        for r in range(rounds):
-            cand_mm = mutate_meta_meta_config(best_mm, rng)
-            _, cand_score = meta_search(
-                base_sys_cfg, cand_mm, rounds=3, seed=seed + 1000 + r
-            )
-            accepted = accept_new_score(best_score, cand_score, best_mm.accept_temp, rng)
-            rec = {
-                "round": r,
-                "base_score": best_score,
-                "cand_score": cand_score,
-                "accepted": accepted,
-                "cand_mm": asdict(cand_mm),
-            }
-            f_hist.write(json.dumps(rec) + "\n")
-            if accepted:
-                best_mm = cand_mm
-                best_score = cand_score
-                save_meta_meta_config(best_mm)
+        ensure_state_dirs()
+        history_path = STATE_DIR / "meta_meta_history.jsonl"
+        with history_path.open("a", encoding="utf-8") as f_hist:
+            for r in range(rounds):
+                cand_mm = mutate_meta_meta_config(best_mm, rng)
+                _, cand_score = meta_search(
+                    base_sys_cfg, cand_mm, rounds=3, seed=seed + 1000 + r, base_seed=base_seed, executor=executor
+                )
+                accepted = accept_new_score(best_score, cand_score, best_mm.accept_temp, rng)
+                rec = {
+                    "round": r,
+                    "base_score": best_score,
+                    "cand_score": cand_score,
+                    "accepted": accepted,
+                    "cand_mm": asdict(cand_mm),
+                }
+                f_hist.write(json.dumps(rec) + "\n")
+                if accepted:
+                    best_mm = cand_mm
+                    best_score = cand_score
+                    save_meta_meta_config(best_mm)
+    finally:
+        if executor is not None:
+            executor.shutdown()
     return best_mm, best_score
 
 
@@ -874,10 +1074,12 @@ def build_arg_parser() -> argparse.ArgumentParser:
     s_meta = sub.add_parser("run-meta", help="Run Level-1 meta search over SystemConfig.")
     s_meta.add_argument("--rounds", type=int, default=5)
     s_meta.add_argument("--seed", type=int, default=1)
+    s_meta.add_argument("--workers", type=int, default=0, help="Episode processes (0 = CPU count).")
 
     s_meta2 = sub.add_parser("run-meta2", help="Run Level-2 meta-meta search over MetaMetaConfig.")
     s_meta2.add_argument("--rounds", type=int, default=5)
     s_meta2.add_argument("--seed", type=int, default=2)
+    s_meta2.add_argument("--workers", type=int, default=0, help="Episode processes (0 = CPU count).")
 
     s_show = sub.add_parser(
         "show-config", help="Print current SystemConfig and MetaMetaConfig."
@@ -915,7 +1117,7 @@ def main(argv: Optional[List[str]] = None) -> None:
         sys_cfg = load_system_config()
         mm_cfg = load_meta_meta_config()
         best_cfg, best_score = meta_search(
-            sys_cfg, mm_cfg, rounds=args.rounds, seed=args.seed
+            sys_cfg, mm_cfg, rounds=args.rounds, seed=args.seed, workers=args.workers
         )
         print("Meta-search complete.")
         print("Best score:", best_score)
@@ -928,7 +1130,7 @@ def main(argv: Optional[List[str]] = None) -> None:
         sys_cfg = load_system_config()
         mm_cfg = load_meta_meta_config()
         best_mm, best_score = meta_meta_search(
-            sys_cfg, mm_cfg, rounds=args.rounds, seed=args.seed
+            sys_cfg, mm_cfg, rounds=args.rounds, seed=args.seed, workers=args.workers
         )
         print("Meta-meta-search complete.")
         print(
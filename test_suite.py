@@ -1,15 +1,17 @@
 #!/usr/bin/env python
 """
 Comprehensive Verification Suite for UNIFIED_RSI_EXTENDED.py
-Tests: EDA, ARC Loading, Algorithmic Tasks
+Tests: EDA, ARC Loading, Algorithmic Tasks, AST Genomes
 """
 
 import sys
 import random
 import time
+from dataclasses import asdict
 from UNIFIED_RSI_EXTENDED import (
     TaskSpec, Universe, MetaState, FunctionLibrary,
-    GRAMMAR_PROBS, load_arc_task, get_arc_tasks, sample_batch
+    GRAMMAR_PROBS, load_arc_task, get_arc_tasks, sample_batch,
+    Genome, AstGenome, as_ast_genome, evaluate, node_count
 )
 
 def test_eda_grammar_learning():
@@ -123,6 +125,36 @@ def test_arc_json_loading():
         print(f"❌ FAIL: Could not load task '{tid}'")
         return False
 
+def test_ast_genome_representation():
+    """Test 4: AST-native genomes match string genomes"""
+    print("\n" + "="*60)
+    print("TEST 4: AST Genome Representation")
+    print("="*60)
+    
+    g = Genome(statements=["v1 = x*2 + 1.5", "if v1 < 3:", "    v1 = v1 + 1", "return v1"])
+    a = as_ast_genome(g)
+    task = TaskSpec(name='poly2', n_train=24, n_hold=16, n_test=16)
+    batch = sample_batch(random.Random(7), task)
+    r_str = evaluate(g, batch, task.name)
+    r_ast = evaluate(a, batch, task.name)
+    
+    if a.code != g.code or r_str.score != r_ast.score or node_count(a.tree()) != node_count(g.code):
+        print(f"❌ FAIL: AST genome diverged (str={r_str.score}, ast={r_ast.score})")
+        return False
+    if AstGenome(**asdict(a)).statements != g.statements:
+        print("❌ FAIL: Snapshot round-trip changed statements")
+        return False
+    
+    uni = Universe(uid=1, seed=42, meta=MetaState(), pool=[], library=FunctionLibrary(), genome_repr="ast")
+    for gen in range(3):
+        uni.step(gen, task, pop_size=20, batch=batch)
+    restored = Universe.from_snapshot(uni.snapshot())
+    if not all(isinstance(p, AstGenome) for p in uni.pool + restored.pool):
+        print("❌ FAIL: Pool lost AST representation")
+        return False
+    print(f"✅ PASS: Scores match ({r_ast.score:.4f}); AST universe best={uni.best_score:.2f}")
+    return True
+
 def run_all_tests():
     """Run complete verification suite"""
     print("\n" + "█"*60)
@@ -132,7 +164,8 @@ def run_all_tests():
     tests = [
         ("EDA Grammar Learning", test_eda_grammar_learning),
         ("Algorithmic Tasks", test_algorithmic_tasks),
-        ("ARC JSON Loading", test_arc_json_loading)
+        ("ARC JSON Loading", test_arc_json_loading),
+        ("AST Genome Representation", test_ast_genome_representation)
     ]
     
     results = []
@@ -0,0 +1,199 @@
+"""
+weighted_sampling.py
+
+Shared weighted samplers for the RSI engines (UNIFIED_RSI_EXTENDED, rsi_engine, rsi_new_engine).
+
+AliasTable        Walker/Vose alias method: O(n) build, O(1) per draw (one rng.random()).
+CumulativeTable   prefix sums + bisect: O(n) build, O(log n) per draw.
+WeightedSampler   samples the keys of a weight mapping; the table is rebuilt only when the
+                  weights change.
+VersionedWeights  dict that bumps a version on every write, so change detection is O(1).
+
+Weights that are negative, NaN or infinite count as zero (after the optional floor); if every
+weight is zero, draws fall back to uniform.
+"""
+from __future__ import annotations
+
+import bisect
+import itertools
+import math
+import random
+from typing import Any, Dict, Hashable, Iterable, List, Mapping, Optional, Sequence
+
+
+def _clean(weights: Iterable[float], floor: float = 0.0) -> List[float]:
+    out: List[float] = []
+    for w in weights:
+        w = float(w)
+        if not math.isfinite(w):
+            w = 0.0
+        out.append(max(floor, w))
+    return out
+
+
+class AliasTable:
+    """Walker/Vose alias table over indices 0..n-1."""
+
+    __slots__ = ("n", "prob", "alias")
+
+    def __init__(self, weights: Sequence[float], floor: float = 0.0):
+        probs = _clean(weights, floor)
+        n = len(probs)
+        if n == 0:
+            raise ValueError("AliasTable needs at least one weight")
+        self.n = n
+        self.prob = [1.0] * n
+        self.alias = list(range(n))
+        total = sum(probs)
+        if total <= 0.0:
+            return
+        scaled = [p * n / total for p in probs]
+        small = [i for i, p in enumerate(scaled) if p < 1.0]
+        large = [i for i, p in enumerate(scaled) if p >= 1.0]
+        while small and large:
+            s = small.pop()
+            l = large.pop()
+            self.prob[s] = scaled[s]
+            self.alias[s] = l
+            scaled[l] = scaled[l] + scaled[s] - 1.0
+            (small if scaled[l] < 1.0 else large).append(l)
+        # Leftovers are 1.0 up to rounding error.
+        for i in itertools.chain(small, large):
+            self.prob[i] = 1.0
+
+    def sample(self, rng: random.Random) -> int:
+        u = rng.random() * self.n
+        i = int(u)
+        if i >= self.n:
+            i = self.n - 1
+        return i if (u - i) < self.prob[i] else self.alias[i]
+
+
+class CumulativeTable:
+    """Prefix-sum table with bisect lookup over indices 0..n-1."""
+
+    __slots__ = ("n", "cum", "total")
+
+    def __init__(self, weights: Sequence[float], floor: float = 0.0):
+        cleaned = _clean(weights, floor)
+        if not cleaned:
+            raise ValueError("CumulativeTable needs at least one weight")
+        self.n = len(cleaned)
+        self.cum = list(itertools.accumulate(cleaned))
+        self.total = self.cum[-1]
+
+    def sample(self, rng: random.Random) -> int:
+        if self.total <= 0.0:
+            return rng.randrange(self.n)
+        # bisect_right never lands on a zero-weight entry.
+        return min(bisect.bisect_right(self.cum, rng.random() * self.total), self.n - 1)
+
+
+_TABLES = {"alias": AliasTable, "bisect": CumulativeTable}
+
+
+def build_table(weights: Sequence[float], floor: float = 0.0, method: str = "alias") -> Any:
+    """Build an index sampler; `method` is 'alias' or 'bisect'."""
+    return _TABLES[method](weights, floor)
+
+
+class VersionedWeights(dict):
+    """dict whose `version` increases on every mutation (lets samplers skip O(n) change checks)."""
+
+    def __init__(self, *args: Any, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        self.token = object()
+        self.version = 0
+
+    def _bump(self) -> None:
+        self.version += 1
+
+    def __setitem__(self, key: Hashable, value: Any) -> None:
+        super().__setitem__(key, value)
+        self._bump()
+
+    def __delitem__(self, key: Hashable) -> None:
+        super().__delitem__(key)
+        self._bump()
+
+    def update(self, *args: Any, **kwargs: Any) -> None:
+        super().update(*args, **kwargs)
+        self._bump()
+
+    def setdefault(self, key: Hashable, default: Any = None) -> Any:
+        if key not in self:
+            self._bump()
+        return super().setdefault(key, default)
+
+    def pop(self, *args: Any) -> Any:
+        out = super().pop(*args)
+        self._bump()
+        return out
+
+    def popitem(self) -> Any:
+        out = super().popitem()
+        self._bump()
+        return out
+
+    def clear(self) -> None:
+        super().clear()
+        self._bump()
+
+    def __ior__(self, other: Any) -> "VersionedWeights":
+        self.update(other)
+        return self
+
+    def __copy__(self) -> "VersionedWeights":
+        return VersionedWeights(self)
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> "VersionedWeights":
+        return VersionedWeights(self)
+
+    def __reduce__(self) -> Any:
+        return (VersionedWeights, (dict(self),))
+
+
+class WeightedSampler:
+    """
+    Draw keys of a weight mapping. With fixed `keys`, missing entries use `default`;
+    without them the mapping's own key order is used. Each weight is floored at `floor`.
+    """
+
+    def __init__(
+        self,
+        keys: Optional[Sequence[Hashable]] = None,
+        default: float = 1.0,
+        floor: float = 0.0,
+        method: str = "alias",
+    ):
+        self.keys = list(keys) if keys is not None else None
+        self.default = default
+        self.floor = floor
+        self.method = method
+        self._signature: Any = None
+        self._keys: List[Hashable] = []
+        self._table: Any = None
+        self.rebuilds = 0
+
+    def _signature_of(self, weights: Mapping[Hashable, float]) -> Any:
+        if isinstance(weights, VersionedWeights):
+            return (weights.token, weights.version)
+        if self.keys is None:
+            return (tuple(weights), tuple(weights.values()))
+        return tuple([weights.get(k, self.default) for k in self.keys])
+
+    def _refresh(self, weights: Mapping[Hashable, float]) -> None:
+        sig = self._signature_of(weights)
+        if self._table is not None and sig == self._signature:
+            return
+        keys = self.keys if self.keys is not None else list(weights.keys())
+        self._keys = keys
+        self._table = build_table([weights.get(k, self.default) for k in keys], self.floor, self.method) if keys else None
+        self._signature = sig
+        self.rebuilds += 1
+
+    def sample(self, rng: random.Random, weights: Mapping[Hashable, float]) -> Hashable:
+        self._refresh(weights)
+        if self._table is None:
+            raise ValueError("cannot sample from an empty weight mapping")
+        return self._keys[self._table.sample(rng)]